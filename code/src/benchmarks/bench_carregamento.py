@@ -0,0 +1,34 @@
+"""Micro-benchmark da decodificação dos sprites no início da partida: serial x pool de threads.
+
+Executar dentro de src: python -m benchmarks.bench_carregamento
+"""
+import os
+import time
+
+from view.cache_sprites import CacheSprites
+from view.carregador_assets import CarregadorAssets
+from view.pacote_assets import PacoteAssets
+from view.tela_jogo import TelaJogo
+
+
+def medir(max_threads: int) -> float:
+    """Tempo para decodificar e redimensionar todos os sprites a partir dos PNGs originais"""
+    cache = CacheSprites(criar_sprite=lambda img: img)
+    carregador = CarregadorAssets(cache, PacoteAssets.processar, max_threads=max_threads)
+    inicio = time.perf_counter()
+    resultado = carregador.carregar(TelaJogo.especificacoesAssets())
+    tempo = time.perf_counter() - inicio
+    print(f"{max_threads:>2} thread(s): {resultado['total']} sprites em {tempo * 1000:8.1f} ms")
+    return tempo
+
+
+def main():
+    print(f"Núcleos disponíveis: {os.cpu_count()}")
+    serial = medir(1)
+    for max_threads in sorted({2, 4, os.cpu_count() or 1}):
+        if max_threads > 1:
+            print(f"   aceleração: {serial / medir(max_threads):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
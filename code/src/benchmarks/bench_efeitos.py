@@ -0,0 +1,74 @@
+"""Micro-benchmark do custo por clique dos efeitos de imagem.
+
+Executar dentro de src: python -m benchmarks.bench_efeitos
+"""
+import timeit
+
+from PIL import Image
+
+from view import efeitos
+from view.cache_sprites import CacheSprites
+
+BOTAO = ("./resources/botoes/comprar_carta.png", (150, 100))
+PEDRA = ("./resources/pedras/rubi.png", (60, 60))
+REPETICOES = 200
+
+
+def carregar(caminho, tamanho):
+    """Decodifica e redimensiona o asset, como o código antigo fazia a cada clique"""
+    return Image.open(caminho).convert("RGBA").resize(tamanho, Image.Resampling.LANCZOS)
+
+
+def escurecerLegado(img):
+    """Implementação antiga: laço em Python sobre getdata()"""
+    img = img.copy()
+    pixels = img.getdata()
+    novos_pixels = []
+    for item in pixels:
+        if len(item) == 4:
+            novos_pixels.append((int(item[0] * 0.7), int(item[1] * 0.7), int(item[2] * 0.7), item[3]))
+        else:
+            novos_pixels.append((int(item[0] * 0.7), int(item[1] * 0.7), int(item[2] * 0.7)))
+    img.putdata(novos_pixels)
+    return img
+
+
+def selecionarLegado(img):
+    """Implementação antiga: clareia pixel a pixel e desenha a borda"""
+    from PIL import ImageDraw
+    img = img.copy()
+    novos_pixels = []
+    for item in img.getdata():
+        novos_pixels.append((min(255, int(item[0] * 1.3)), min(255, int(item[1] * 1.3)), min(255, int(item[2] * 1.3)), item[3]))
+    img.putdata(novos_pixels)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, img.width - 1, img.height - 1], outline=efeitos.COR_SELECAO, width=efeitos.LARGURA_SELECAO)
+    return img
+
+
+def medir(nome, funcao):
+    """Imprime o custo médio por chamada em milissegundos"""
+    tempo = timeit.timeit(funcao, number=REPETICOES) / REPETICOES
+    print(f"{nome:<45} {tempo * 1000:8.3f} ms")
+
+
+def main():
+    cache = CacheSprites(criar_sprite=lambda img: img)
+
+    for nome, (caminho, tamanho), legado, novo, variante in (
+        ("botão (escurecer)", BOTAO, escurecerLegado, efeitos.escurecer, "escurecida"),
+        ("pedra (selecionar)", PEDRA, selecionarLegado, efeitos.selecionar, "selecionada"),
+    ):
+        print(f"== {nome}")
+        base = carregar(caminho, tamanho)
+        medir("antes: decodificar + laço por pixel", lambda: legado(carregar(caminho, tamanho)))
+        medir("decodificar + operação por banda", lambda: novo(carregar(caminho, tamanho)))
+        medir("só operação por banda", lambda: novo(base))
+        medir("depois: consulta memoizada no cache", lambda: cache.pegar((caminho, tamanho), variante, lambda: carregar(caminho, tamanho)))
+
+        # Confere que o resultado vetorizado é idêntico ao antigo
+        assert legado(base).tobytes() == novo(base).tobytes(), nome
+
+
+if __name__ == "__main__":
+    main()
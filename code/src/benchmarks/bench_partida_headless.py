@@ -0,0 +1,120 @@
+"""Benchmark do desenho da TelaJogo sem display: reproduz uma partida roteirizada no backend de gravação.
+
+Para cada jogada recebida mostra as chamadas feitas ao canvas, as imagens
+alocadas e o tempo de parede do receberTabuleiro até o fim do redesenho.
+
+Executar dentro de src: python -m benchmarks.bench_partida_headless [jogadas]
+"""
+import io
+import sys
+import time
+from collections import Counter
+from contextlib import redirect_stdout
+
+from model.enums.pedrasEnum import PedrasEnum
+from model.jogador import Jogador
+from model.tabuleiro import Tabuleiro
+from view.backend_render import BackendGravacao
+from view.tela_jogo import TelaJogo
+
+JOGADAS = 12
+SEED = 12345
+
+# Roteiro repetido ao longo da partida
+ROTEIRO = ["pedras", "comprar", "pedras", "reservar"]
+
+
+def jogadaPedras(tabuleiro: Tabuleiro, jogador: Jogador, rodada: int):
+    """Pega três pedras diferentes, escolhidas em rodízio"""
+    pedras = list(PedrasEnum)
+    for i in range(3):
+        jogador.adicionarPedraNaMao(pedras[(rodada + i) % len(pedras)], 1)
+
+
+def jogadaComprar(tabuleiro: Tabuleiro, jogador: Jogador, rodada: int, reposicao):
+    """Compra a carta de um slot e repõe o slot com a próxima do baralho"""
+    idx = rodada % len(tabuleiro.cartasNoTabuleiro)
+    carta = tabuleiro.cartasNoTabuleiro[idx]
+    if carta is None:
+        return
+    jogador.adicionarCarta(carta)
+    jogador.adicionarPontos(carta.pegarPontos())
+    jogador.removerPedras({pedra: min(qtd, jogador.pegarPedras()[pedra]) for pedra, qtd in carta.pegarPedrasDaCarta().items()})
+    tabuleiro.cartasNoTabuleiro[idx] = reposicao(idx)
+
+
+def jogadaReservar(tabuleiro: Tabuleiro, jogador: Jogador, rodada: int, reposicao):
+    """Reserva a carta de um slot e repõe o slot com a próxima do baralho"""
+    idx = (rodada * 5) % len(tabuleiro.cartasNoTabuleiro)
+    carta = tabuleiro.cartasNoTabuleiro[idx]
+    if carta is None:
+        return
+    jogador.reservarCarta(carta)
+    tabuleiro.cartasNoTabuleiro[idx] = reposicao(idx)
+
+
+def proximaJogada(tela: TelaJogo, rodada: int):
+    """Monta o tabuleiro que chegaria pelo DOG depois da jogada da rodada (serializado e deserializado)"""
+    atual = tela.pegarTabuleiro()
+
+    def reposicao(idx):
+        # Os slots são 4 por nível, na ordem dos baralhos
+        return atual.baralhos[idx // 4].pegarCartaDoBaralho()
+
+    novo = Tabuleiro.from_dict(atual.to_dict())
+    novo.rodada = rodada
+    jogador = novo.pegarJogadorLocal() if novo.pegarJogadorLocal().jogadorEmTurno else novo.pegarJogadorRemoto()
+    tipo = ROTEIRO[rodada % len(ROTEIRO)]
+    if tipo == "pedras":
+        jogadaPedras(novo, jogador, rodada)
+    elif tipo == "comprar":
+        jogadaComprar(novo, jogador, rodada, reposicao)
+    else:
+        jogadaReservar(novo, jogador, rodada, reposicao)
+
+    # Passa o turno
+    for participante in (novo.pegarJogadorLocal(), novo.pegarJogadorRemoto()):
+        participante.jogadorEmTurno = not participante.jogadorEmTurno
+    return novo, tipo
+
+
+def main():
+    jogadas = int(sys.argv[1]) if len(sys.argv) > 1 else JOGADAS
+    backend = BackendGravacao()
+    raiz = backend.criarRaiz()
+
+    # Os prints de depuração do jogo ficam fora da saída do benchmark
+    silencio = io.StringIO()
+    inicio = time.perf_counter()
+    with redirect_stdout(silencio):
+        tela = TelaJogo(raiz, lambda *args: None, Jogador("Local", True), Jogador("Remoto", False),
+                        lambda *args: None, seed_partida=SEED, backend=backend)
+        raiz.processarPendentes()
+    print(f"Montagem da tela: {(time.perf_counter() - inicio) * 1000:.1f} ms, "
+          f"{sum(backend.contadores().values())} operações {backend.contadores()}, {len(backend.canvas)} itens")
+
+    total = Counter()
+    tempos = []
+    for rodada in range(1, jogadas + 1):
+        with redirect_stdout(silencio):
+            tabuleiro, tipo = proximaJogada(tela, rodada)
+            backend.zerarContadores()
+            inicio = time.perf_counter()
+            tela.receberTabuleiro(tabuleiro)
+            raiz.processarPendentes()
+            tempo = (time.perf_counter() - inicio) * 1000
+        silencio.seek(0)
+        silencio.truncate()
+        contadores = backend.contadores()
+        total.update(contadores)
+        tempos.append(tempo)
+        print(f"Jogada {rodada:>3} ({tipo:<8}): {tempo:7.2f} ms, {sum(contadores.values()):>4} operações {contadores}")
+
+    tempos.sort()
+    print(f"Total: {sum(total.values())} operações em {jogadas} jogadas {dict(total)}")
+    print(f"Rótulos (acumulado): {tela.rotulos.estatisticas()}")
+    print(f"Tempo por jogada: mediana {tempos[len(tempos) // 2]:.2f} ms, máximo {tempos[-1]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
+import os
 from dog.dog_proxy import DogProxy
-from dog.polling_thread import PollingThread
+from dog.send_queue import MoveSendQueue
+from dog.transport import create_transport
+
+# DOG_CLIENT chooses the client: thread (DogProxy + transport thread, default) or async (asyncio loop)
+DEFAULT_CLIENT = "thread"
 
 
 class DogActor:
@@ -7,19 +12,23 @@ class DogActor:
         super().__init__()
         self.proxy = DogProxy()
         self.player_actor = None
-        self.polling_thread = PollingThread(self.proxy, True)
+        # poll, longpoll or push, chosen per deployment with DOG_TRANSPORT
+        self.transport = create_transport(self.proxy)
+        # moves go out from a background thread, with retries; send_move never waits on the network
+        self.send_queue = MoveSendQueue(self.proxy.send_move, self.proxy.confirm_move)
 
     def initialize(self, player_name, a_player_actor):
         self.player_actor = a_player_actor
         resp_dict = self.proxy.initialize(player_name, self)
-        self.polling_thread.start()
+        self.transport.start()
+        self.send_queue.start()
         return resp_dict
 
     def start_match(self, number_of_players):
         return self.proxy.start_match(number_of_players)
 
     def send_move(self, move):
-        self.proxy.send_move(move)
+        return self.send_queue.enqueue(move)
 
     def receive_start(self, start_status):
         self.player_actor.receive_start(start_status)
@@ -29,3 +38,14 @@ class DogActor:
 
     def receive_withdrawal_notification(self):
         self.player_actor.receive_withdrawal_notification()
+
+
+def create_dog_actor(name=None):
+    """Builds the DOG actor named by `name` or by DOG_CLIENT (thread, async)"""
+    name = name or os.environ.get("DOG_CLIENT", DEFAULT_CLIENT)
+    if name == "async":
+        from dog.dog_client_async import AsyncDogActor
+        return AsyncDogActor()
+    if name != DEFAULT_CLIENT:
+        print(f"Cliente DOG desconhecido '{name}': usando {DEFAULT_CLIENT}")
+    return DogActor()
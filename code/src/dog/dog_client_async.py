@@ -0,0 +1,329 @@
+import asyncio
+import json
+import os
+import ssl
+import threading
+from urllib.parse import urlencode, urlparse
+
+from dog.dog_proxy import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, DEFAULT_URL, LONG_POLL_MARGIN
+from dog.match_state import MatchState
+from dog.polling_policy import PollingPolicy
+from dog.send_queue import MoveNotSent, MoveSendQueue
+from dog.start_status import StartStatus
+from dog.transport import LONG_POLL_TIMEOUT
+
+
+class ConnectFailed(ConnectionError):
+    """The connection could not be opened, so the request was never sent"""
+
+
+class AsyncHttpConnection:
+    """Minimal HTTP/1.1 client on asyncio streams: one keep-alive connection, one request at a time"""
+
+    def __init__(self, url, connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT):
+        parsed = urlparse(url)
+        self.host = parsed.hostname
+        self.secure = parsed.scheme == "https"
+        self.port = parsed.port or (443 if self.secure else 80)
+        self.base_path = parsed.path.rstrip("/") + "/"
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.reader = None
+        self.writer = None
+        self.lock = asyncio.Lock()
+
+    async def post(self, endpoint, form, read_timeout=None, idempotent=True):
+        """Returns (status code, body text).
+
+        An idempotent request is sent again, once, if the kept-alive
+        connection turns out to be closed; others (move/) never are.
+        """
+        async with self.lock:
+            if self.reader is not None and self.reader.at_eof():  #   closed by the server while idle
+                await self.close()
+            for attempt in range(2):
+                reused = self.writer is not None
+                try:
+                    if self.writer is None:
+                        await self._connect()
+                    return await asyncio.wait_for(self._request(endpoint, form), read_timeout or self.read_timeout)
+                except ConnectFailed:
+                    raise
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    await self.close()
+                    if attempt or not reused or not idempotent:
+                        raise
+                except BaseException:
+                    await self.close()
+                    raise
+
+    async def _connect(self):
+        context = ssl.create_default_context() if self.secure else None
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=context), self.connect_timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ConnectFailed(f"não foi possível conectar a {self.host}:{self.port}: {e!r}") from e
+
+    async def _request(self, endpoint, form):
+        body = urlencode(form).encode()
+        head = (
+            f"POST {self.base_path}{endpoint} HTTP/1.1\r\n"
+            f"Host: {self.host}\r\n"
+            "Content-Type: application/x-www-form-urlencoded\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        )
+        self.writer.write(head.encode() + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("conexão fechada pelo servidor")
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise ValueError(f"resposta HTTP inválida: {status_line[:80]!r}")
+        status = int(parts[1])
+        headers = {}
+        while True:
+            line = (await self.reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            data = b""
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                data += chunk[:-2]
+        elif "content-length" in headers:
+            data = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            data = await self.reader.read()
+            headers["connection"] = "close"
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, data.decode("utf-8")
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+        self.reader = None
+        self.writer = None
+
+
+class AsyncDogClient(MatchState):
+    """asyncio version of DogProxy + PollingThread.
+
+    initialize, start_match and send_move are coroutines; events() is the
+    stream of server events: ("start", StartStatus), ("move", dict) and
+    ("withdrawal", None). Commands and the event stream use separate
+    connections, so a long-poll never delays sending a move.
+    """
+
+    def __init__(self, url=None, polling_policy=None, long_poll=True):
+        self.url = (url or os.environ.get("DOG_URL", DEFAULT_URL)).rstrip("/") + "/"
+        self.commands = AsyncHttpConnection(self.url)
+        self.stream = AsyncHttpConnection(self.url)
+        self.polling_policy = polling_policy or PollingPolicy()
+        self.long_poll = long_poll
+        self.player_id = 0
+        self.player_name = ""
+        self.game_id = 0
+        self.status = 0  #   same meaning as DogProxy.status
+        self.move_order = 0
+        self._wake = None
+
+    async def initialize(self, a_name):
+        self.player_id = self.generate_player_id()
+        self.player_name = a_name or "player" + self.player_id
+        try:
+            with open("config/game.id", "r") as config_file:
+                self.game_id = config_file.read()
+        except FileNotFoundError:
+            self.status = 0
+            return "Arquivo de configuração do jogo não encontrado"
+        post_data = {"player_name": self.player_name, "player_id": self.player_id, "game_id": self.game_id}
+        try:
+            status, _ = await self.commands.post("player/", post_data)
+        except (OSError, asyncio.TimeoutError):
+            status = None
+        if status == 200:
+            self.status = 2
+            return "Conectado a Dog Server"
+        self.status = 1
+        return "Você está sem conexão"
+
+    async def start_match(self, number_of_players):
+        post_data = {"player_id": self.player_id, "game_id": self.game_id, "number_of_players": number_of_players}
+        status, text = await self.commands.post("start/", post_data)
+        if status != 200:
+            return StartStatus("0", "Voce está offline", [], self.player_id)
+        resp_dict = json.loads(text)
+        start_status = StartStatus(resp_dict["code"], resp_dict["message"], resp_dict["players"], self.player_id)
+        if resp_dict["code"] == "2":
+            self.match_started(resp_dict["players"])
+        return start_status
+
+    async def send_move(self, a_move):
+        post_data = {"player_id": self.player_id, "game_id": self.game_id, "move": json.dumps(a_move)}
+        try:
+            status, text = await self.commands.post("move/", post_data, idempotent=False)
+        except ConnectFailed as e:
+            raise MoveNotSent(str(e)) from e
+        if status != 200:
+            raise ConnectionError(f"servidor recusou a jogada (HTTP {status})")
+        self.move_delivered(a_move)
+        self._wake_stream()
+        return text
+
+    async def confirm_move(self, a_move):
+        #   after a send that failed midway: did the move reach the server anyway?
+        post_data = {"player_id": self.player_id, "game_id": self.game_id}
+        _, text = await self.commands.post("match/", post_data)
+        if self.move_arrived(json.loads(text), a_move):
+            self.move_delivered(a_move)
+            self._wake_stream()
+            return True
+        return False
+
+    async def events(self):
+        """Async generator of server events, running until the task is cancelled"""
+        self._wake = asyncio.Event()
+        while True:
+            status = self.status
+            try:
+                if status == 2:
+                    event = await self._poll_start()
+                elif status == 3:
+                    event = await self._wait_move()
+                else:
+                    event = None
+            except (OSError, asyncio.TimeoutError, ValueError) as e:  #   ValueError: answer that is not JSON or HTTP
+                print(f"Falha ao consultar o servidor DOG: {e!r}")
+                event = None
+            if event is not None:
+                yield event
+                continue
+            if status in (2, 3):
+                self.polling_policy.poll_done()
+            await self._sleep(self.polling_policy.next_delay(status))
+
+    async def _poll_start(self):
+        post_data = {"player_id": self.player_id, "game_id": self.game_id}
+        status, text = await self.stream.post("started/", post_data)
+        if status != 200 or self.status != 2:
+            return None
+        resp_dict = json.loads(text)
+        if resp_dict["code"] != "2":
+            return None
+        self.match_started(resp_dict["players"])
+        return ("start", StartStatus(resp_dict["code"], resp_dict["message"], resp_dict["players"], self.player_id))
+
+    async def _wait_move(self):
+        post_data = {"player_id": self.player_id, "game_id": self.game_id}
+        while self.long_poll and self.status == 3:
+            long_poll_data = dict(post_data, after=self.move_order, timeout=LONG_POLL_TIMEOUT)
+            status, text = await self.stream.post("match/wait/", long_poll_data, LONG_POLL_TIMEOUT + LONG_POLL_MARGIN)
+            if status in (404, 405, 501):
+                print("Servidor DOG sem long-poll: usando polling")
+                self.long_poll = False
+                break
+            event = self.read_match_result(json.loads(text))
+            if event is not None:
+                return event
+            #   an empty long-poll answer already waited: ask again right away
+        if self.status != 3:
+            return None
+        _, text = await self.stream.post("match/", post_data)
+        return self.read_match_result(json.loads(text))
+
+    def match_started(self, players):
+        MatchState.match_started(self, players)
+        self._wake_stream()
+
+    async def _sleep(self, delay):
+        try:
+            await asyncio.wait_for(self._wake.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    def _wake_stream(self):
+        if self._wake is not None:
+            self._wake.set()
+
+    async def close(self):
+        await self.commands.close()
+        await self.stream.close()
+
+
+class AsyncDogActor:
+    """Tk adapter for AsyncDogClient, with the same interface as DogActor.
+
+    The asyncio loop runs in its own thread next to the Tk mainloop. send_move
+    only queues the move (see MoveSendQueue) and returns; server events reach the
+    player interface the same way as with PollingThread (from a thread
+    other than Tk's, so PlayerInterface forwards them to its event pump).
+    """
+
+    def __init__(self, client=None):
+        self.client = client or AsyncDogClient()
+        self.player_actor = None
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.events_task = None
+        self.send_queue = MoveSendQueue(self.send_and_wait, self.confirm_and_wait)
+
+    def run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def initialize(self, player_name, a_player_actor):
+        self.player_actor = a_player_actor
+        message = self.run(self.client.initialize(player_name)).result()
+        self.events_task = self.run(self.dispatch_events())
+        self.send_queue.start()
+        return message
+
+    def start_match(self, number_of_players):
+        #   the caller uses the answer right away, so this one waits
+        return self.run(self.client.start_match(number_of_players)).result()
+
+    def send_move(self, move):
+        return self.send_queue.enqueue(move)
+
+    def send_and_wait(self, move):
+        #   runs in the send queue thread, never in Tk's
+        try:
+            return self.run(self.client.send_move(move)).result()
+        except asyncio.TimeoutError as e:
+            raise TimeoutError("tempo esgotado ao enviar a jogada") from e
+
+    def confirm_and_wait(self, move):
+        return self.run(self.client.confirm_move(move)).result()
+
+    async def dispatch_events(self):
+        async for kind, value in self.client.events():
+            if kind == "start":
+                self.player_actor.receive_start(value)
+            elif kind == "move":
+                self.player_actor.receive_move(value)
+            elif kind == "withdrawal":
+                self.player_actor.receive_withdrawal_notification()
+
+    def close(self):
+        self.send_queue.stop()
+        if self.events_task is not None:
+            self.events_task.cancel()
+        self.run(self.client.close()).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
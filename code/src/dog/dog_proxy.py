@@ -1,12 +1,78 @@
 import json
+import os
+import threading
+import time
+from collections import deque
 from urllib.parse import urldefrag
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
 from dog.start_status import StartStatus
+from dog.polling_policy import PollingPolicy
+from dog.match_state import MatchState
+from dog.send_queue import MoveNotSent
 
+# One keep-alive session per proxy: polling reuses the same TCP/TLS connection
+DEFAULT_POOL_SIZE = 4
+DEFAULT_CONNECT_TIMEOUT = 5.0  # seconds to open the connection
+DEFAULT_READ_TIMEOUT = 15.0  # seconds waiting for the server response
+REQUEST_LOG_SIZE = 200
+# Server address; DOG_URL points the game at another deployment (e.g. the stand-in server)
+DEFAULT_URL = "https://api-dog-server.herokuapp.com/"
+# Extra read time on top of the long-poll timeout before giving up on the request
+LONG_POLL_MARGIN = 5.0
 
-class DogProxy:
-    def __init__(self):
+# Handshake time of the connection opened by the current thread's request (None: a kept-alive one was reused)
+_connect_timing = threading.local()
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connect_timing.ms = (time.perf_counter() - start) * 1000
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()  #   TCP and TLS handshakes
+        _connect_timing.ms = (time.perf_counter() - start) * 1000
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections record their handshake time, so each request knows if it opened one"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+
+class DogProxy(MatchState):
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT, polling_policy=None):
         super().__init__()
+        # Told about every match event, so PollingThread polls only as often as needed
+        self.polling_policy = polling_policy or PollingPolicy()
+        self.timeout = (connect_timeout, read_timeout)
+        self.adapter = TimedAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        # Last requests: endpoint, status, whether a new connection was opened and timings (ms);
+        # written by the transport, send queue and Tk threads
+        self.request_log = deque(maxlen=REQUEST_LOG_SIZE)
+        self.request_log_lock = threading.Lock()
         self.dog_actor = None
         self.player_id = 0
         self.player_name = ""
@@ -14,7 +80,7 @@ class DogProxy:
         self.status = 0
         # 0 - file game.id not found; 1 - not connected to server; 2 - connected without match; 3 - waiting move (even if it's the local player's turn)
         self.move_order = 0
-        self.url = "https://api-dog-server.herokuapp.com/"
+        self.url = os.environ.get("DOG_URL", DEFAULT_URL).rstrip("/") + "/"
 
     def get_status(self):
         return self.status
@@ -46,22 +112,14 @@ class DogProxy:
             message = "Você está sem conexão"
         return message
 
-    def generate_player_id(self):
-        from time import time
-        milliseconds = int(time() * 1000)
-        an_id = str(milliseconds - 1639872000000)
-        return an_id
-
     def register_player(self, a_player_name, a_player_id, a_game_id):
-        url = self.url + "player/"
         post_data = {"player_name": a_player_name, "player_id": a_player_id, "game_id": a_game_id}
-        resp = requests.post(url, data=post_data)
+        resp = self._post("player/", post_data)
         return resp
 
     def start_match(self, number_of_players):
-        url = self.url + "start/"
         post_data = {"player_id": self.player_id, "game_id": self.game_id, "number_of_players": number_of_players}
-        resp = requests.post(url, data=post_data)
+        resp = self._post("start/", post_data)
         result = resp.status_code
         if result == 200:
             resp_json = resp.text
@@ -71,16 +129,14 @@ class DogProxy:
             players = resp_dict["players"]
             start_status = StartStatus(code, message, players, self.player_id)
             if code == "2":
-                self.status = 3
-                self.move_order = 0
+                self.match_started(players)
         else:
             start_status = StartStatus("0", "Voce está offline", [], self.player_id)
         return start_status
 
     def start_status(self):
-        url = self.url + "started/"
         post_data = {"player_id": self.player_id, "game_id": self.game_id}
-        resp = requests.post(url, data=post_data)
+        resp = self._post("started/", post_data)
         result = resp.status_code
         if result == 200 and self.status == 2:
             resp_json = resp.text
@@ -90,42 +146,126 @@ class DogProxy:
             players = resp_dict["players"]
             if code == "2":
                 start_status = StartStatus(code, message, players, self.player_id)
-                self.status = 3
-                self.move_order = 0
+                self.match_started(players)
                 self.dog_actor.receive_start(start_status)
 
     def send_move(self, a_move):
-        url = self.url + "move/"
         json_move = json.dumps(a_move)  # convert move to json
         post_data = {"player_id": self.player_id, "game_id": self.game_id, "move": json_move}
-        resp = requests.post(url, data=post_data)
-        if a_move["match_status"] == "next":
-            self.status = 3  #   pass the turn and start looking for a move
-        elif a_move["match_status"] == "finished":
-            self.status = 2  #   connected without match
+        try:
+            resp = self._post("move/", post_data)
+        except requests.RequestException as e:
+            if connection_not_opened(e):
+                raise MoveNotSent(f"sem conexão com o servidor: {e}") from e
+            raise
+        resp.raise_for_status()  #   not acknowledged
+        self.move_delivered(a_move)
         return resp.text
 
+    def confirm_move(self, a_move):
+        #   after a send that failed midway: did the move reach the server anyway?
+        post_data = {"player_id": self.player_id, "game_id": self.game_id}
+        resp = self._post("match/", post_data)
+        if self.move_arrived(json.loads(resp.text), a_move):
+            self.move_delivered(a_move)
+            return True
+        return False
+
     def match_status(self):
-        url = self.url + "match/"
         post_data = {"player_id": self.player_id, "game_id": self.game_id}
-        resp = requests.post(url, data=post_data)
+        resp = self._post("match/", post_data)
         resp_json = resp.text
         seek_result = json.loads(resp_json)
-        if bool(seek_result):
-            move_dictionary = eval(
-                seek_result["1"]
-            )  #   move is contained in seek_result as a string (to be converted in dictionary)
-            if bool(move_dictionary):
-                match_status = move_dictionary["match_status"]
-                if match_status == "interrupted":  #  an opponent has abandoned the match
-                    self.dog_actor.receive_withdrawal_notification()
-                    self.status = 2
-                else:
-                    move_player_id = move_dictionary["player"]
-                    move_player_order = move_dictionary["order"]
-                    if move_player_id != str(self.player_id):  #  not from the player himself
-                        if int(move_player_order) > self.move_order:  #  not an already handled move
-                            self.move_order = int(move_player_order)
-                            self.dog_actor.receive_move(move_dictionary)
-                            if move_dictionary["match_status"] == "finished":
-                                self.status = 2
+        self.handle_match_result(seek_result)
+
+    def wait_match_status(self, timeout):
+        #   long-poll: the server answers when there is a move newer than ours or after timeout seconds
+        #   returns False if the server has no long-poll endpoint
+        post_data = {"player_id": self.player_id, "game_id": self.game_id, "after": self.move_order, "timeout": timeout}
+        resp = self._post("match/wait/", post_data, read_timeout=timeout + LONG_POLL_MARGIN)
+        if resp.status_code in (404, 405, 501):
+            return False
+        self.handle_match_result(json.loads(resp.text))
+        return True
+
+    def handle_match_result(self, seek_result):
+        #   seek_result is the match/ answer, whichever transport brought it
+        event = self.read_match_result(seek_result)
+        if event is None:
+            return
+        kind, move_dictionary = event
+        if kind == "withdrawal":
+            self.dog_actor.receive_withdrawal_notification()
+        else:
+            self.dog_actor.receive_move(move_dictionary)
+
+    def _post(self, endpoint, post_data, read_timeout=None):
+        url = self.url + endpoint
+        timeout = self.timeout if read_timeout is None else (self.timeout[0], read_timeout)
+        _connect_timing.ms = None
+        start = time.perf_counter()
+        try:
+            resp = self.session.post(url, data=post_data, timeout=timeout)
+        except requests.RequestException as e:
+            self._log_request(endpoint, None, start, None)
+            print(f"Falha na requisição {endpoint}: {e}")
+            raise
+        self._log_request(endpoint, resp.status_code, start, resp.elapsed)
+        return resp
+
+    def _log_request(self, endpoint, status_code, start, elapsed):
+        total_ms = (time.perf_counter() - start) * 1000
+        connect_ms = _connect_timing.ms  #   set by this thread's request only
+        # elapsed goes from sending the request (connecting first, if needed) to reading the headers;
+        # the remainder is the body transfer
+        elapsed_ms = elapsed.total_seconds() * 1000 if elapsed is not None else total_ms
+        entry = {
+            "endpoint": endpoint,
+            "status": status_code,
+            "new_connection": connect_ms is not None,
+            "connect_ms": connect_ms or 0.0,
+            "headers_ms": max(elapsed_ms - (connect_ms or 0.0), 0.0),
+            "transfer_ms": max(total_ms - elapsed_ms, 0.0),
+            "total_ms": total_ms,
+        }
+        with self.request_log_lock:
+            self.request_log.append(entry)
+
+    def request_stats(self):
+        """Per endpoint: requests, failures, new connections (handshakes) and mean/max times in ms.
+
+        mean_connect_ms is the mean handshake time of the requests that opened a connection.
+        """
+        with self.request_log_lock:
+            entries = list(self.request_log)
+        stats = {}
+        for entry in entries:
+            endpoint = stats.setdefault(entry["endpoint"], {
+                "requests": 0, "failures": 0, "new_connections": 0, "mean_connect_ms": 0.0,
+                "mean_headers_ms": 0.0, "mean_transfer_ms": 0.0, "mean_total_ms": 0.0, "max_total_ms": 0.0,
+            })
+            endpoint["requests"] += 1
+            endpoint["failures"] += entry["status"] is None
+            endpoint["new_connections"] += entry["new_connection"]
+            endpoint["mean_connect_ms"] += entry["connect_ms"]
+            endpoint["mean_headers_ms"] += entry["headers_ms"]
+            endpoint["mean_transfer_ms"] += entry["transfer_ms"]
+            endpoint["mean_total_ms"] += entry["total_ms"]
+            endpoint["max_total_ms"] = max(endpoint["max_total_ms"], entry["total_ms"])
+        for endpoint in stats.values():
+            endpoint["mean_connect_ms"] /= max(endpoint["new_connections"], 1)
+            endpoint["mean_headers_ms"] /= endpoint["requests"]
+            endpoint["mean_transfer_ms"] /= endpoint["requests"]
+            endpoint["mean_total_ms"] /= endpoint["requests"]
+        return stats
+
+    def close(self):
+        self.session.close()
+
+
+def connection_not_opened(error):
+    #   connect timeout, refused connection or unknown host: the request never left this machine
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
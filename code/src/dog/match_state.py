@@ -0,0 +1,95 @@
+import ast
+from time import time
+
+
+class MatchState:
+    """Match bookkeeping shared by DogProxy and AsyncDogClient.
+
+    Expects player_id, status, move_order and polling_policy on the
+    instance. status: 0 - file game.id not found; 1 - not connected to
+    server; 2 - connected without match; 3 - waiting move (even if it's
+    the local player's turn).
+    """
+
+    def generate_player_id(self):
+        milliseconds = int(time() * 1000)
+        an_id = str(milliseconds - 1639872000000)
+        return an_id
+
+    def is_first_player(self, players):
+        #   players: [name, id, order]; order 1 plays first
+        return any(str(player[1]) == str(self.player_id) and int(player[2]) == 1 for player in players)
+
+    def match_started(self, players):
+        self.status = 3
+        self.move_order = 0
+        self.polling_policy.match_started(self.is_first_player(players))
+
+    def move_delivered(self, a_move):
+        #   the server has our move: update the state as the sender
+        if a_move["match_status"] == "next":
+            self.status = 3  #   pass the turn and start looking for a move
+            self.polling_policy.move_sent()
+        elif a_move["match_status"] == "finished":
+            self.status = 2  #   connected without match
+            self.polling_policy.match_ended()
+
+    def move_arrived(self, seek_result, a_move):
+        """Whether the match/ answer shows that a_move reached the server.
+
+        It did if the last move is a_move itself (same move_id) or an
+        opponent's move newer than the last one we handled, which can only
+        be an answer to a_move.
+        """
+        last_move = parse_last_move(seek_result)
+        if not last_move or last_move["match_status"] == "interrupted":
+            return False
+        if a_move.get("move_id") is not None and last_move.get("move_id") == a_move["move_id"]:
+            return True
+        return last_move["player"] != str(self.player_id) and int(last_move["order"]) > self.move_order
+
+    def read_match_result(self, seek_result):
+        """Turns a match/ answer into ("withdrawal", None), ("move", move) or None (nothing new).
+
+        Raises ValueError if the answer does not hold a readable move.
+        """
+        move_dictionary = parse_last_move(seek_result)
+        if not move_dictionary:
+            return None
+        if move_dictionary["match_status"] == "interrupted":  #  an opponent has abandoned the match
+            self.status = 2
+            self.polling_policy.match_ended()
+            return ("withdrawal", None)
+        if move_dictionary["player"] == str(self.player_id):  #  from the player himself
+            return None
+        if int(move_dictionary["order"]) <= self.move_order:  #  an already handled move
+            return None
+        self.move_order = int(move_dictionary["order"])
+        finished = move_dictionary["match_status"] == "finished"
+        self.polling_policy.move_received(our_turn=not finished)
+        if finished:
+            self.status = 2
+            self.polling_policy.match_ended()
+        return ("move", move_dictionary)
+
+
+def parse_last_move(seek_result):
+    """The last move in a match/ answer, as a dictionary ({} if there is none)"""
+    if not seek_result:
+        return {}
+    try:
+        #   the move travels as a Python literal string
+        move_dictionary = ast.literal_eval(seek_result["1"]) or {}
+        if not isinstance(move_dictionary, dict):
+            raise TypeError(type(move_dictionary).__name__)
+        if move_dictionary:
+            required = ["match_status"]
+            if move_dictionary["match_status"] != "interrupted":
+                required += ["player", "order"]
+            missing = [key for key in required if key not in move_dictionary]
+            if missing:
+                raise KeyError(", ".join(missing))
+            int(move_dictionary.get("order", 0))
+    except (SyntaxError, ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"jogada ilegível na resposta do servidor: {e!r}") from e
+    return move_dictionary
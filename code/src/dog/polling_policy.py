@@ -0,0 +1,87 @@
+import random
+import threading
+import time
+
+# Right after sending a move the opponent is about to play: poll fast for a while
+FAST_INTERVAL = 0.25  # seconds between polls in the fast window
+FAST_WINDOW = 10.0  # seconds of fast polling after a move is sent
+# Otherwise back off exponentially while nothing happens
+BASE_INTERVAL = 1.0
+MAX_INTERVAL = 5.0
+BACKOFF_FACTOR = 1.5
+JITTER = 0.2  # fraction of the delay added or removed at random
+# During our own turn there is nothing to fetch except a withdrawal: poll rarely (None = never)
+OWN_TURN_INTERVAL = 15.0
+
+
+class PollingPolicy:
+    """Decides how long PollingThread sleeps before the next poll.
+
+    DogProxy reports what happened (move sent, move received, match started
+    or ended) and the thread asks for the next delay. A report that makes
+    polling more urgent wakes a sleeping thread at once.
+    """
+
+    def __init__(self, fast_interval=FAST_INTERVAL, fast_window=FAST_WINDOW, base_interval=BASE_INTERVAL,
+                 max_interval=MAX_INTERVAL, backoff_factor=BACKOFF_FACTOR, jitter=JITTER,
+                 own_turn_interval=OWN_TURN_INTERVAL, rng=None, clock=time.monotonic):
+        self.fast_interval = fast_interval
+        self.fast_window = fast_window
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.own_turn_interval = own_turn_interval
+        self.rng = rng or random.Random()
+        self.clock = clock
+        self.our_turn = False
+        self.fast_until = 0.0
+        self.empty_polls = 0
+        self.polls = 0
+        self._wake = threading.Event()
+
+    def match_started(self, our_turn):
+        self.our_turn = our_turn
+        self.empty_polls = 0
+        self._wake.set()
+
+    def move_sent(self):
+        self.our_turn = False
+        self.empty_polls = 0
+        self.fast_until = self.clock() + self.fast_window
+        self._wake.set()
+
+    def move_received(self, our_turn=True):
+        self.our_turn = our_turn
+        self.empty_polls = 0
+        self.fast_until = 0.0
+
+    def match_ended(self):
+        self.our_turn = False
+        self.empty_polls = 0
+        self.fast_until = 0.0
+
+    def poll_done(self):
+        self.polls += 1
+        # Backoff starts counting only after the fast window
+        if self.clock() >= self.fast_until:
+            self.empty_polls += 1
+
+    def next_delay(self, status):
+        """Seconds until the next poll (None = wait until woken). status is DogProxy.status"""
+        if status == 3 and self.our_turn:
+            return self.own_turn_interval
+        if status == 3 and self.clock() < self.fast_until:
+            return self.fast_interval
+        if status not in (2, 3):
+            return self.max_interval
+        delay = min(self.max_interval, self.base_interval * self.backoff_factor ** max(self.empty_polls - 1, 0))
+        return delay * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    def wake(self):
+        self._wake.set()
+
+    def wait(self, delay):
+        """Sleeps for delay seconds, returning early if something makes polling urgent"""
+        self._wake.wait(delay)
+        self._wake.clear()
@@ -0,0 +1,197 @@
+import queue
+import threading
+import time
+import uuid
+
+# A move whose connection could not be opened is sent again up to MAX_ATTEMPTS times in total, waiting longer each time
+MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5  # seconds before the first retry
+RETRY_MAX_DELAY = 4.0
+RETRY_BACKOFF = 2.0
+
+# States reported to the listeners
+SENDING = "sending"
+DELIVERED = "delivered"
+FAILED = "failed"
+
+
+class MoveNotSent(OSError):
+    """Raised by send when the request surely never reached the server (the connection was not opened).
+
+    Only these failures are retried: any other error may come after the
+    server stored the move, and sending it again would post it twice.
+    """
+
+
+class OutboundMove:
+    """A move waiting in (or already through) the send queue.
+
+    order numbers the moves sent by this player, from 1; a move is
+    acknowledged (DELIVERED) once the server answered its POST with
+    success, and the answer body is kept in response. move_id goes inside
+    the move, so a server (or a later check) can tell a resent move apart
+    from a new one.
+    """
+
+    def __init__(self, order, move):
+        self.order = order
+        self.move_id = uuid.uuid4().hex
+        self.move = dict(move, move_id=self.move_id)
+        self.state = SENDING
+        self.uncertain = False  #   failed after the request may have reached the server
+        self.attempts = 0
+        self.response = None
+        self.error = None
+        self.queued_at = time.monotonic()
+        self.finished_at = None
+
+    def elapsed(self):
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.queued_at
+
+
+class MoveSendQueue(threading.Thread):
+    """Sends moves in a background thread, so whoever calls enqueue never waits on the network.
+
+    Moves go out one at a time, in the order they were queued. send is the
+    blocking send (DogProxy.send_move, for instance): returning means
+    delivered, raising MoveNotSent means try again after a backoff, until
+    max_attempts. Any other error fails the move at once; if it was an
+    OSError the request may have arrived, so confirm (when given) asks the
+    server whether it holds the move before giving up. A failed move can
+    be put back in the queue with resend. Listeners are called, in the
+    sender thread, every time a move changes state or is retried.
+    """
+
+    def __init__(self, send, confirm=None, max_attempts=MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY,
+                 max_delay=RETRY_MAX_DELAY, backoff=RETRY_BACKOFF):
+        threading.Thread.__init__(self, daemon=True)
+        self.send = send
+        self.confirm = confirm
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.listeners = []
+        self.moves = {}  #   order -> OutboundMove
+        self.last_order = 0
+        self.pending = queue.Queue()
+        self.lock = threading.Lock()
+        self.running = True
+        self._stopped = threading.Event()
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def enqueue(self, move):
+        """Queues the move and returns its OutboundMove at once"""
+        with self.lock:
+            self.last_order += 1
+            outbound = OutboundMove(self.last_order, move)
+            self.moves[outbound.order] = outbound
+        self.notify(outbound)
+        self.pending.put(outbound)
+        return outbound
+
+    def resend(self, order):
+        """Puts a FAILED move back in the queue, with the same move_id"""
+        outbound = self.moves[order]
+        if outbound.state != FAILED:
+            return outbound
+        outbound.state = SENDING
+        outbound.attempts = 0
+        outbound.queued_at = time.monotonic()
+        outbound.finished_at = None
+        self.notify(outbound)
+        self.pending.put(outbound)
+        return outbound
+
+    def run(self):
+        while self.running:
+            outbound = self.pending.get()
+            if outbound is None:
+                break
+            self.deliver(outbound)
+
+    def deliver(self, outbound):
+        if self.arrived(outbound):  #   resending a move whose first try ended in doubt
+            self.finish(outbound, DELIVERED)
+            return
+        while True:
+            outbound.attempts += 1
+            try:
+                outbound.response = self.send(outbound.move)
+            except MoveNotSent as e:
+                outbound.error = e
+                if outbound.attempts >= self.max_attempts or not self.running:
+                    self.finish(outbound, FAILED)
+                    return
+                self.notify(outbound)  #   still SENDING, with one more attempt
+                if self._stopped.wait(self.retry_delay(outbound.attempts)):
+                    self.finish(outbound, FAILED)
+                    return
+            except Exception as e:
+                outbound.error = e
+                outbound.uncertain = isinstance(e, OSError)
+                self.finish(outbound, DELIVERED if self.arrived(outbound) else FAILED)
+                return
+            else:
+                outbound.error = None
+                outbound.uncertain = False
+                self.finish(outbound, DELIVERED)
+                return
+
+    def arrived(self, outbound):
+        #   only asked after an error that may have come after the server stored the move
+        if not outbound.uncertain or self.confirm is None:
+            return False
+        try:
+            arrived = bool(self.confirm(outbound.move))
+        except Exception as e:
+            print(f"Não foi possível confirmar a jogada {outbound.order}: {e!r}")
+            return False
+        if arrived:
+            outbound.uncertain = False
+            outbound.error = None
+        return arrived
+
+    def retry_delay(self, attempts):
+        return min(self.max_delay, self.base_delay * self.backoff ** (attempts - 1))
+
+    def finish(self, outbound, state):
+        outbound.state = state
+        outbound.finished_at = time.monotonic()
+        self.notify(outbound)
+
+    def notify(self, outbound):
+        for listener in self.listeners:
+            try:
+                listener(outbound)
+            except Exception as e:
+                print(f"Erro ao notificar envio da jogada {outbound.order}: {e}")
+
+    def state(self, order):
+        outbound = self.moves.get(order)
+        return outbound.state if outbound is not None else None
+
+    def acknowledged(self):
+        """Orders of the moves the server confirmed"""
+        return [order for order, outbound in self.moves.items() if outbound.state == DELIVERED]
+
+    def unacknowledged(self):
+        return [order for order, outbound in self.moves.items() if outbound.state != DELIVERED]
+
+    def stats(self):
+        states = [outbound.state for outbound in self.moves.values()]
+        return {
+            "queued": len(states),
+            SENDING: states.count(SENDING),
+            DELIVERED: states.count(DELIVERED),
+            FAILED: states.count(FAILED),
+            "retries": sum(max(outbound.attempts - 1, 0) for outbound in self.moves.values()),
+        }
+
+    def stop(self):
+        self.running = False
+        self._stopped.set()
+        self.pending.put(None)
@@ -0,0 +1,205 @@
+"""Local stand-in for the DOG server, for testing the transports without the real deployment.
+
+Implements player/, start/, started/, move/ and match/ like the DOG server,
+plus match/wait/ (long-poll) and a push channel (one JSON line per move).
+
+Run inside src: python -m dog.stand_in_server [--port 8000] [--push-port 8765] [--no-long-poll]
+then start two game instances with, for example:
+DOG_URL=http://127.0.0.1:8000/ DOG_TRANSPORT=push DOG_PUSH_ADDRESS=127.0.0.1:8765 python3 main.py
+"""
+import argparse
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class StandInGame:
+    def __init__(self):
+        self.players = {}  #   player_id -> name
+        self.waiting = []  #   player_ids that asked to start
+        self.match_players = []  #   [name, id, order] once the match started
+        self.last_move = None
+        self.move_ids = set()  #   client move ids already stored, to drop resent moves
+
+
+class StandInServer:
+    def __init__(self, host="127.0.0.1", port=0, push_port=0, long_poll=True):
+        self.long_poll = long_poll
+        self.games = {}
+        self.subscribers = []  #   (game_id, socket)
+        self.condition = threading.Condition()
+        self.http = ThreadingHTTPServer((host, port), self._http_handler())
+        self.http.daemon_threads = True
+        self.push = socketserver.ThreadingTCPServer((host, push_port), self._push_handler())
+        self.push.daemon_threads = True
+        self.threads = []
+
+    @property
+    def url(self):
+        host, port = self.http.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def push_address(self):
+        return self.push.server_address[:2]
+
+    def start(self):
+        for server in (self.http, self.push):
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        return self
+
+    def stop(self):
+        for server in (self.http, self.push):
+            server.shutdown()
+            server.server_close()
+
+    def game(self, game_id):
+        return self.games.setdefault(game_id, StandInGame())
+
+    # DOG operations, called with the form fields of the request
+    def register(self, form):
+        self.game(form["game_id"]).players[form["player_id"]] = form["player_name"]
+        return {"0": "0", "1": "Jogador registrado"}
+
+    def start_match(self, form):
+        with self.condition:
+            game = self.game(form["game_id"])
+            if form["player_id"] not in game.waiting:
+                game.waiting.append(form["player_id"])
+            number_of_players = int(form.get("number_of_players", 2))
+            if len(game.waiting) >= number_of_players:
+                ids, game.waiting = game.waiting[:number_of_players], game.waiting[number_of_players:]
+                game.match_players = [[game.players.get(pid, pid), pid, str(order)] for order, pid in enumerate(ids, 1)]
+                game.last_move = None
+            return self.start_answer(game, form["player_id"])
+
+    def started(self, form):
+        with self.condition:
+            return self.start_answer(self.game(form["game_id"]), form["player_id"])
+
+    def start_answer(self, game, player_id):
+        if any(player[1] == player_id for player in game.match_players):
+            return {"code": "2", "message": "Partida iniciada", "players": game.match_players}
+        return {"code": "1", "message": "Aguardando jogadores", "players": []}
+
+    def send_move(self, form):
+        with self.condition:
+            game = self.game(form["game_id"])
+            move = json.loads(form["move"])
+            move_id = move.get("move_id")
+            if move_id is not None:
+                if move_id in game.move_ids:
+                    return "Jogada recebida"
+                game.move_ids.add(move_id)
+            order = int(game.last_move["order"]) + 1 if game.last_move else 1
+            move["player"] = form["player_id"]
+            move["order"] = str(order)
+            game.last_move = move
+            self.condition.notify_all()
+            subscribers = [sock for game_id, sock in self.subscribers if game_id == form["game_id"]]
+        line = (json.dumps(self.match_answer(game)) + "\n").encode()
+        for sock in subscribers:
+            try:
+                sock.sendall(line)
+            except OSError:
+                pass
+        return "Jogada recebida"
+
+    def match_answer(self, game):
+        #   like the DOG server: the move travels as a Python literal string
+        return {"1": repr(game.last_move)} if game.last_move else {}
+
+    def match(self, form):
+        with self.condition:
+            return self.match_answer(self.game(form["game_id"]))
+
+    def wait_match(self, form):
+        after = int(form.get("after", 0))
+        player_id = form["player_id"]
+        game = self.game(form["game_id"])
+
+        def new_move():
+            move = game.last_move
+            return move is not None and int(move["order"]) > after and move["player"] != player_id
+
+        with self.condition:
+            self.condition.wait_for(new_move, timeout=float(form.get("timeout", 25)))
+            return self.match_answer(game)
+
+    def _http_handler(self):
+        server = self
+        routes = {
+            "/player/": server.register,
+            "/start/": server.start_match,
+            "/started/": server.started,
+            "/move/": server.send_move,
+            "/match/": server.match,
+        }
+        if server.long_poll:
+            routes["/match/wait/"] = server.wait_match
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                form = {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode()).items()}
+                route = routes.get(self.path)
+                if route is None:
+                    self.answer(404, "not found")
+                    return
+                result = route(form)
+                self.answer(200, result if isinstance(result, str) else json.dumps(result))
+
+            def answer(self, code, body):
+                data = body.encode()
+                self.send_response(code)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _push_handler(self):
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                subscription = json.loads(self.rfile.readline())
+                entry = (subscription["game_id"], self.request)
+                with server.condition:
+                    server.subscribers.append(entry)
+                try:
+                    while self.rfile.readline():
+                        pass
+                finally:
+                    with server.condition:
+                        server.subscribers.remove(entry)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor DOG local para testes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--push-port", type=int, default=8765)
+    parser.add_argument("--no-long-poll", action="store_true", help="responde 404 em match/wait/, como o servidor real")
+    args = parser.parse_args()
+    server = StandInServer(args.host, args.port, args.push_port, long_poll=not args.no_long_poll).start()
+    print(f"Servidor DOG local em {server.url} (push em {server.push_address[0]}:{server.push_address[1]})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
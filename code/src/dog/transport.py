@@ -0,0 +1,177 @@
+import json
+import os
+import socket
+from threading import Thread
+from urllib.parse import urlparse
+
+# Backend chosen with the DOG_TRANSPORT environment variable (poll, longpoll or push)
+DEFAULT_TRANSPORT = "poll"
+# How long the server may hold a long-poll request before answering "nothing new"
+LONG_POLL_TIMEOUT = 25.0
+# Push channel: DOG_PUSH_ADDRESS (host:port); by default the DOG_URL host on this port
+DEFAULT_PUSH_PORT = 8765
+# Without a push for this long, poll once anyway (and check the connection is alive)
+PUSH_HEARTBEAT = 30.0
+
+
+class Transport(Thread):
+    """Background thread that brings server events to DogProxy.
+
+    The lobby (waiting for a match to start) is always polled. How the
+    opponent's moves arrive while a match is running is up to each backend,
+    which overrides wait_for_move (polling match/ by default). Every backend hands the server answer to
+    DogProxy.handle_match_result, so the rest of the game never sees the
+    difference.
+    """
+
+    transport_name = ""
+
+    def __init__(self, a_proxy, daemon_value=True):
+        Thread.__init__(self, daemon=daemon_value)
+        self.proxy = a_proxy
+        self.policy = a_proxy.polling_policy
+        self.running = True
+
+    def run(self):
+        while self.running:
+            status = self.proxy.get_status()
+            try:
+                if status == 3:  #   match running: waiting remote move (or our own turn)
+                    self.wait_for_move()
+                    continue
+                if status == 2:  #   connected without match
+                    self.proxy.start_status()
+                    self.policy.poll_done()
+            except OSError as e:  #   requests and socket errors (timeouts, connection lost)
+                self.connection_lost(e)
+                self.policy.poll_done()
+            except ValueError as e:  #   answer that is not JSON or holds no readable move
+                print(f"Resposta inválida do servidor DOG: {e!r}")
+                self.policy.poll_done()
+            self.policy.wait(self.policy.next_delay(status))
+
+    def wait_for_move(self):
+        #   asks match/ for the opponent's move, as often as the polling policy says
+        self.proxy.match_status()
+        self.policy.poll_done()
+        self.policy.wait(self.policy.next_delay(3))  # adaptive: fast after a send, backoff while idle
+
+    def connection_lost(self, error):
+        pass
+
+    def stop(self):
+        self.running = False
+        self.policy.wake()
+
+
+class LongPollTransport(Transport):
+    """Asks the server to hold match/wait/ until there is a move newer than ours (or a timeout).
+
+    A server without that endpoint gets plain polling instead.
+    """
+
+    transport_name = "longpoll"
+
+    def __init__(self, a_proxy, daemon_value=True, timeout=LONG_POLL_TIMEOUT):
+        Transport.__init__(self, a_proxy, daemon_value)
+        self.timeout = timeout
+        self.supported = True
+
+    def wait_for_move(self):
+        if self.supported and self.proxy.wait_match_status(self.timeout):
+            return
+        if self.supported:
+            print("Servidor DOG sem long-poll: usando polling")
+            self.supported = False
+        Transport.wait_for_move(self)
+
+
+class PushTransport(Transport):
+    """Keeps a socket open to the server, which pushes each move as one JSON line.
+
+    The subscription is a JSON line with player_id and game_id. After every
+    (re)connection and after each silent heartbeat interval the match is
+    polled once, so moves sent while disconnected are not lost.
+    """
+
+    transport_name = "push"
+
+    def __init__(self, a_proxy, daemon_value=True, address=None, heartbeat=PUSH_HEARTBEAT):
+        Transport.__init__(self, a_proxy, daemon_value)
+        self.address = address or push_address(a_proxy.url)
+        self.heartbeat = heartbeat
+        self.sock = None
+        self.buffer = b""
+
+    def wait_for_move(self):
+        if self.sock is None:
+            self.connect()
+            self.proxy.match_status()
+        try:
+            line = self.read_line()
+        except socket.timeout:
+            self.proxy.match_status()  #   heartbeat
+            return
+        try:
+            seek_result = json.loads(line)
+        except ValueError:
+            print(f"Mensagem inválida no canal push: {line[:80]}")
+            return
+        self.proxy.handle_match_result(seek_result)
+
+    def read_line(self):
+        while b"\n" not in self.buffer:
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("canal push fechado pelo servidor")
+            self.buffer += chunk
+        line, self.buffer = self.buffer.split(b"\n", 1)
+        return line.decode("utf-8")
+
+    def connect(self):
+        connect_timeout = self.proxy.timeout[0]
+        self.sock = socket.create_connection(self.address, timeout=connect_timeout)
+        self.sock.settimeout(self.heartbeat)
+        subscription = {"player_id": str(self.proxy.player_id), "game_id": str(self.proxy.game_id)}
+        self.sock.sendall((json.dumps(subscription) + "\n").encode())
+        self.buffer = b""
+
+    def connection_lost(self, error):
+        print(f"Canal push indisponível ({error}): reconectando")
+        self.close()
+
+    def close(self):
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+        self.sock = None
+
+    def stop(self):
+        Transport.stop(self)
+        self.close()
+
+
+def push_address(url):
+    address = os.environ.get("DOG_PUSH_ADDRESS")
+    if address:
+        host, _, port = address.rpartition(":")
+        return host, int(port)
+    return urlparse(url).hostname, DEFAULT_PUSH_PORT
+
+
+def create_transport(a_proxy, name=None):
+    """Builds the transport named by `name` or by DOG_TRANSPORT (poll, longpoll, push)"""
+    from dog.polling_thread import PollingThread
+
+    transports = {
+        PollingThread.transport_name: PollingThread,
+        LongPollTransport.transport_name: LongPollTransport,
+        PushTransport.transport_name: PushTransport,
+    }
+    name = name or os.environ.get("DOG_TRANSPORT", DEFAULT_TRANSPORT)
+    if name not in transports:
+        print(f"Transporte DOG desconhecido '{name}': usando {DEFAULT_TRANSPORT}")
+        name = DEFAULT_TRANSPORT
+    return transports[name](a_proxy, True)
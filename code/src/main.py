@@ -8,11 +8,19 @@ from view.tela_inicial import TelaInicial
 from view.tela_jogo import TelaJogo
 from view.tela_regras import TelaRegras
 from view.tela_creditos import TelaCreditos
+from view.catalogo_cartas import pegarCatalogoCartas
+from view.gerenciador_telas import GerenciadorTelas
+from view.notificacoes import pegarNotificacoes
+from view.bomba_eventos import BombaEventos
 
 from dog.dog_interface import DogPlayerInterface
-from dog.dog_actor import DogActor
+from dog.dog_actor import create_dog_actor
+from dog.send_queue import SENDING, DELIVERED, FAILED
 from tkinter import PhotoImage
 
+# O aviso de "enviando" é curto: normalmente o de entregue vem logo em seguida
+DURACAO_ENVIO_MS = 1500
+
 class PlayerInterface(DogPlayerInterface):
     def __init__(self):
         self.root = Tk()
@@ -26,12 +34,23 @@ class PlayerInterface(DogPlayerInterface):
         self.title_font = ('Aclonica', 36, 'bold')
 
         self.current_screen = None
+        self.telas = GerenciadorTelas(self.root)
         self.partida_em_andamento = False
         self.jogador_local = None
         self.jogador_remoto = None
         self.dog_server_interface = None
         self.aguardando_jogadores = False
 
+        # O DOG chama receive_* na thread de polling: o que mexe no Tk é aplicado por esta bomba
+        self.bomba_eventos = BombaEventos(self.root)
+        self.bomba_eventos.iniciar()
+
+        # Monta o catálogo de artes das cartas uma única vez, na abertura do jogo
+        pegarCatalogoCartas()
+
+        # Começa a preparar os sprites da partida enquanto o jogador está na tela inicial
+        TelaJogo.preaquecerAssets(self.root)
+
         self.show_screen("inicial")
 
     def finalizar_jogada(self, tabuleiro, status='next'):
@@ -43,37 +62,75 @@ class PlayerInterface(DogPlayerInterface):
                 "tabuleiro_atualizado": tabuleiro.to_dict(),
                 "match_status": status  # 'next' ou 'finished'
             }
+            # Só enfileira: a thread de envio avisa (em receive_send_state) quando a jogada for entregue ou falhar
             self.dog_server_interface.send_move(move_dict)
-            if status == 'next':
-                # Atualiza o tabuleiro localmente para o jogador que enviou a jogada
-                messagebox.showinfo("Turno", "Aguardando jogada do oponente...")
-            # Se for finished, não mostra nada (a tela de vitória já aparece)
         except Exception as e:
             print(f"Erro ao enviar estado do tabuleiro: {e}")
             import traceback
             traceback.print_exc()
             messagebox.showerror("Erro", f"Erro ao enviar jogada: {e}")
 
+    def receive_send_state(self, envio):
+        """Chamado na thread de envio a cada mudança de estado de uma jogada enviada"""
+        estado, tentativas, erro = envio.state, envio.attempts, envio.error
+        self.bomba_eventos.publicar(lambda: self.aplicar_estado_envio(envio, estado, tentativas, erro))
+
+    def aplicar_estado_envio(self, envio, estado, tentativas, erro):
+        final = envio.move["match_status"] == 'finished'
+        if estado == SENDING:
+            if tentativas == 0:
+                pegarNotificacoes().info("Enviando", "Enviando jogada...", DURACAO_ENVIO_MS)
+            else:
+                pegarNotificacoes().aviso("Reenviando", f"Falha ao enviar a jogada ({erro}). Tentando de novo ({tentativas + 1}/{self.dog_server_interface.send_queue.max_attempts})...")
+        elif estado == DELIVERED:
+            print(f"Jogada {envio.order} entregue em {envio.elapsed() * 1000:.0f} ms ({tentativas} tentativa(s))")
+            # Se for finished, não mostra nada (a tela de vitória já aparece)
+            if not final:
+                pegarNotificacoes().info("Turno", "Jogada entregue. Aguardando jogada do oponente...")
+        elif estado == FAILED:
+            # O turno já foi encerrado localmente: sem reenviar, a partida ficaria parada
+            reenviar = messagebox.askretrycancel(
+                "Falha no envio",
+                f"A jogada não chegou ao servidor ({tentativas} tentativa(s)):\n{erro}\n\n"
+                "Tentar enviar de novo? Cancelar encerra a partida."
+            )
+            if reenviar:
+                self.dog_server_interface.send_queue.resend(envio.order)
+            else:
+                self.show_screen("inicial")
+
     def show_screen(self, screen_name: str):
         print(f"Changing to screen: {screen_name}")
-        self.clear_screen()
 
         if screen_name == "inicial":
             self.partida_em_andamento = False
-            self.current_screen = TelaInicial(self.root, self.show_screen)
+            # Sair da partida descarta a tela do jogo e fecha os popups abertos
+            self.telas.fecharJanelas()
+            self.telas.descartar("jogo")
+            self.current_screen = self.telas.mostrar("inicial", lambda: TelaInicial(self.root, self.show_screen), "1080x720")
 
         elif screen_name == "jogo":
-            if not self.partida_em_andamento:
+            if self.partida_em_andamento and self.telas.pegar("jogo"):
+                # Volta para a partida sem recriar o canvas nem recarregar imagens
+                self.current_screen = self.telas.mostrar("jogo", None)
+            elif not self.partida_em_andamento:
+                self.telas.esconderAtual()
                 self.aguardando_jogadores = True
                 self.start_match(2)
 
         elif screen_name == "regras":
             destino_voltar = "jogo" if self.partida_em_andamento else "inicial"
-            self.current_screen = TelaRegras(self.root, self.show_screen, destino_voltar)
+            self.current_screen = self.telas.mostrar("regras", lambda: TelaRegras(self.root, self.show_screen, destino_voltar))
+            self.current_screen.destino_voltar = destino_voltar
 
         elif screen_name == "creditos":
             destino_voltar = "jogo" if self.partida_em_andamento else "inicial"
-            self.current_screen = TelaCreditos(self.root, self.show_screen, destino_voltar)
+            self.current_screen = self.telas.mostrar("creditos", lambda: TelaCreditos(self.root, self.show_screen, destino_voltar))
+            self.current_screen.destino_voltar = destino_voltar
+
+    def tela_jogo(self):
+        """Retorna a tela da partida em andamento, mesmo que outra tela esteja sendo exibida"""
+        return self.telas.pegar("jogo")
 
     def start_match(self, num_players):
         """Inicia o processo de partida"""
@@ -102,14 +159,17 @@ class PlayerInterface(DogPlayerInterface):
         self.show_screen("inicial")
 
     def receive_start(self, start_status):
-        """Chamado quando a partida realmente inicia"""
+        """Chamado (na thread de polling) quando a partida realmente inicia"""
+        self.bomba_eventos.publicar(lambda: self.aplicar_inicio_partida(start_status))
+
+    def aplicar_inicio_partida(self, start_status):
         if hasattr(self, 'janela_espera'):
             self.janela_espera.destroy()
         
         self.aguardando_jogadores = False
         self.partida_em_andamento = True
         
-        if not self.current_screen or not isinstance(self.current_screen, TelaJogo):
+        if self.tela_jogo() is None:
             self.tratar_inicio_partida(start_status)
 
     def tratar_inicio_partida(self, start_status):
@@ -126,19 +186,21 @@ class PlayerInterface(DogPlayerInterface):
         self.seed_partida = 12345
         print(f"Seed fixo usado para a partida: {self.seed_partida}")
 
-        self.current_screen = TelaJogo(
+        # Uma nova partida sempre começa com uma tela de jogo nova
+        self.telas.descartar("jogo")
+        self.current_screen = self.telas.mostrar("jogo", lambda: TelaJogo(
             self.root,
             self.show_screen,
             self.jogador_local,
             self.jogador_remoto,
             self.finalizar_jogada,
             self.seed_partida  # Passa o seed para a TelaJogo
-        )
+        ), f"{TelaJogo.WINDOW_WIDTH}x{TelaJogo.WINDOW_HEIGHT}")
 
         if self.jogador_local.jogadorEmTurno:
-            messagebox.showinfo("Seu turno", "Você começa jogando!")
+            pegarNotificacoes().info("Seu turno", "Você começa jogando!")
         else:
-            messagebox.showinfo("Turno do oponente", "Aguardando jogada do oponente...")
+            pegarNotificacoes().info("Turno do oponente", "Aguardando jogada do oponente...")
 
     def criar_jogadores(self, start_status):
         players = start_status.get_players()
@@ -165,54 +227,63 @@ class PlayerInterface(DogPlayerInterface):
             raise ValueError("Falha ao criar jogadores")
 
     def receive_move(self, a_move):
+        """Chamado na thread de polling: o tabuleiro é deserializado aqui e só aplicado na thread do Tk"""
+        tabuleiro_atualizado = a_move.get("tabuleiro_atualizado")
+        print("Recebendo tabuleiro:", tabuleiro_atualizado)  # DEBUG
+        if not tabuleiro_atualizado:
+            return
+        try:
+            tabuleiro_obj = Tabuleiro.from_dict(tabuleiro_atualizado)
+            # Inverte jogador local e remoto
+            tabuleiro_obj.jogadorLocal, tabuleiro_obj.jogadorRemoto = tabuleiro_obj.jogadorRemoto, tabuleiro_obj.jogadorLocal
+        except Exception as e:
+            print(f"Erro ao processar movimento: {e}")
+            return
+        match_status = a_move.get("match_status", "next")
+        self.bomba_eventos.publicar(lambda: self.aplicar_jogada(tabuleiro_obj, match_status))
+
+    def aplicar_jogada(self, tabuleiro_obj, match_status):
         if self.partida_em_andamento:
-            tabuleiro_atualizado = a_move.get("tabuleiro_atualizado")
-            print("Recebendo tabuleiro:", tabuleiro_atualizado)  # DEBUG
-            if tabuleiro_atualizado:
-                try:
-                    tabuleiro_obj = Tabuleiro.from_dict(tabuleiro_atualizado)
-                    # Inverte jogador local e remoto
-                    tabuleiro_obj.jogadorLocal, tabuleiro_obj.jogadorRemoto = tabuleiro_obj.jogadorRemoto, tabuleiro_obj.jogadorLocal
-                    
-                    # Atualiza o tabuleiro (que agora recarrega as imagens automaticamente)
-                    self.current_screen.atualizarTabuleiro(tabuleiro_obj)
-                    match_status = a_move.get("match_status", "next")
-                    if match_status == "finished":
-                        # Exibe a notificação de vitória/derrota/empate para o jogador remoto
-                        pontos_local = tabuleiro_obj.jogadorLocal.pegarPontuacaoJogador()
-                        pontos_remoto = tabuleiro_obj.jogadorRemoto.pegarPontuacaoJogador()
-                        if pontos_local > pontos_remoto:
-                            vencedor = tabuleiro_obj.jogadorLocal.pegarNome()
-                            messagebox.showinfo("Fim de Jogo", f"Parabéns! {vencedor} venceu a partida!")
-                        elif pontos_remoto > pontos_local:
-                            vencedor = tabuleiro_obj.jogadorRemoto.pegarNome()
-                            messagebox.showinfo("Fim de Jogo", f"Parabéns! {vencedor} venceu a partida!")
-                        else:
-                            messagebox.showinfo("Fim de Jogo", "A partida terminou em empate!")
-                        self.partida_em_andamento = False
-                        self.show_screen("inicial")
+            try:
+                # Atualiza o tabuleiro (que agora recarrega as imagens automaticamente)
+                self.tela_jogo().receberTabuleiro(tabuleiro_obj)
+                if match_status == "finished":
+                    # Exibe a notificação de vitória/derrota/empate para o jogador remoto
+                    pontos_local = tabuleiro_obj.jogadorLocal.pegarPontuacaoJogador()
+                    pontos_remoto = tabuleiro_obj.jogadorRemoto.pegarPontuacaoJogador()
+                    if pontos_local > pontos_remoto:
+                        vencedor = tabuleiro_obj.jogadorLocal.pegarNome()
+                        messagebox.showinfo("Fim de Jogo", f"Parabéns! {vencedor} venceu a partida!")
+                    elif pontos_remoto > pontos_local:
+                        vencedor = tabuleiro_obj.jogadorRemoto.pegarNome()
+                        messagebox.showinfo("Fim de Jogo", f"Parabéns! {vencedor} venceu a partida!")
                     else:
-                        messagebox.showinfo("Turno", "Agora é seu turno!")
-                except Exception as e:
-                    print(f"Erro ao processar movimento: {e}")
+                        messagebox.showinfo("Fim de Jogo", "A partida terminou em empate!")
+                    self.partida_em_andamento = False
+                    self.show_screen("inicial")
+                else:
+                    pegarNotificacoes().info("Turno", "Agora é seu turno!")
+            except Exception as e:
+                print(f"Erro ao processar movimento: {e}")
 
     def receive_withdrawal_notification(self):
-        """Chamado quando um jogador desiste da partida"""
+        """Chamado (na thread de polling) quando um jogador desiste da partida"""
+        self.bomba_eventos.publicar(self.aplicar_desistencia)
+
+    def aplicar_desistencia(self):
         if self.partida_em_andamento:
             self.partida_em_andamento = False
-            if hasattr(self, 'current_screen') and hasattr(self.current_screen, 'notificarDesistencia'):
-                self.current_screen.notificarDesistencia()
+            if self.tela_jogo() is not None:
+                self.tela_jogo().notificarDesistencia()
             else:
                 messagebox.showinfo("Desistência", "O jogador adversário desistiu da partida.")
                 self.show_screen("inicial")
 
-    def clear_screen(self):
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
     def run(self):
         player_name = simpledialog.askstring("Nome", "Digite seu nome:") or "Jogador"
-        self.dog_server_interface = DogActor()
+        # DOG_CLIENT=async usa o cliente asyncio, que não bloqueia o Tk ao enviar jogadas
+        self.dog_server_interface = create_dog_actor()
+        self.dog_server_interface.send_queue.add_listener(self.receive_send_state)
         message = self.dog_server_interface.initialize(player_name, self)
 
         if message == "Você está sem conexão":
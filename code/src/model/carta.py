@@ -1,9 +1,67 @@
-from typing import Dict, Union
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Union
 from .enums.niveisEnum import NiveisEnum
 from .enums.pedrasEnum import PedrasEnum
+from .manifesto_cartas import DefinicaoCarta
+
+
+class PrototipoCarta:
+    """Dados imutáveis de um desenho de carta, compartilhados por todas as cópias dele.
+
+    Os protótipos são internados pela chave dos atributos: uma carta do
+    manifesto e uma recebida pela rede com os mesmos atributos apontam para o
+    mesmo objeto, então comparar desenhos é comparar identidade.
+    """
+    __slots__ = ("pontos", "nivel", "pedras", "cartaDeRoubo", "bonus", "definicao", "chave")
+
+    _internados: Dict[tuple, "PrototipoCarta"] = {}
+
+    def __init__(self, pontos: int, nivel: NiveisEnum, pedras: Mapping[PedrasEnum, int], cartaDeRoubo: bool,
+                 bonus: Union[PedrasEnum, None], definicao: Optional[DefinicaoCarta] = None):
+        object.__setattr__(self, "pontos", pontos)
+        object.__setattr__(self, "nivel", nivel)
+        object.__setattr__(self, "pedras", MappingProxyType(dict(pedras)))
+        object.__setattr__(self, "cartaDeRoubo", cartaDeRoubo)
+        object.__setattr__(self, "bonus", bonus)
+        object.__setattr__(self, "definicao", definicao)
+        object.__setattr__(self, "chave", self.chaveAtributos(pontos, nivel, pedras, cartaDeRoubo, bonus))
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("PrototipoCarta é imutável")
+
+    @staticmethod
+    def chaveAtributos(pontos, nivel, pedras, cartaDeRoubo, bonus) -> tuple:
+        return (pontos, nivel, tuple(sorted((p.name, q) for p, q in pedras.items())), cartaDeRoubo, bonus)
+
+    @classmethod
+    def obter(cls, pontos: int, nivel: NiveisEnum, pedras: Mapping[PedrasEnum, int], cartaDeRoubo: bool,
+              bonus: Union[PedrasEnum, None]) -> "PrototipoCarta":
+        """Retorna o protótipo com esses atributos (o do manifesto, se já houver), criando-o na primeira vez"""
+        chave = cls.chaveAtributos(pontos, nivel, pedras, cartaDeRoubo, bonus)
+        prototipo = cls._internados.get(chave)
+        if prototipo is None:
+            prototipo = cls(pontos, nivel, pedras, cartaDeRoubo, bonus)
+            cls._internados[chave] = prototipo
+        return prototipo
+
+    @classmethod
+    def daDefinicao(cls, definicao: DefinicaoCarta) -> "PrototipoCarta":
+        """Retorna o protótipo de uma definição do manifesto, guardando nele a definição para achar a arte.
+
+        Definições com os mesmos atributos ficam com o protótipo da primeira,
+        como no CatalogoCartas.
+        """
+        prototipo = cls.obter(definicao.pontos, definicao.nivel, definicao.pegarPedras(), definicao.cartaDeRoubo,
+                              definicao.bonus)
+        if prototipo.definicao is None:
+            object.__setattr__(prototipo, "definicao", definicao)
+        return prototipo
 
 
 class Carta:
+    """Cópia de uma carta em jogo: guarda só o id e a habilitação, o resto vem do protótipo compartilhado"""
+    __slots__ = ("id", "prototipo", "habilitada")
+
     def __init__(self, 
                  id: int,
                  pontos: int, 
@@ -14,18 +72,42 @@ class Carta:
                  habilitada: bool):
         
         self.id = id
-        self.pontos = pontos
-        self.nivel = nivel
-        self.pedras = pedras
-        self.cartaDeRoubo = cartaDeRoubo
-        self.bonus = bonus
+        self.prototipo = PrototipoCarta.obter(pontos, nivel, pedras, cartaDeRoubo, bonus)
         self.habilitada = habilitada
-    
-    
+
+    @classmethod
+    def doPrototipo(cls, id: int, prototipo: PrototipoCarta, habilitada: bool = True) -> "Carta":
+        """Cria uma cópia de um protótipo já existente"""
+        carta = cls.__new__(cls)
+        carta.id = id
+        carta.prototipo = prototipo
+        carta.habilitada = habilitada
+        return carta
+
+    @property
+    def pontos(self) -> int:
+        return self.prototipo.pontos
+
+    @property
+    def nivel(self) -> NiveisEnum:
+        return self.prototipo.nivel
+
+    @property
+    def pedras(self) -> Mapping[PedrasEnum, int]:
+        return self.prototipo.pedras
+
+    @property
+    def cartaDeRoubo(self) -> bool:
+        return self.prototipo.cartaDeRoubo
+
+    @property
+    def bonus(self) -> Union[PedrasEnum, None]:
+        return self.prototipo.bonus
+
     def pegarPontos(self) -> int:
         return self.pontos
     
-    def pegarPedrasDaCarta(self) -> Dict[PedrasEnum, int]:
+    def pegarPedrasDaCarta(self) -> Mapping[PedrasEnum, int]:
         return self.pedras
     
     def temBonus(self) -> bool:
@@ -0,0 +1,122 @@
+from typing import FrozenSet, NamedTuple, Optional, Tuple
+
+from .carta import Carta
+from .enums.pedrasEnum import PedrasEnum
+from .jogador import Jogador
+
+LADOS = ("local", "remoto")
+
+
+def assinaturaCarta(carta: Optional[Carta]):
+    """O que define o desenho de uma carta na tela: a instância e o seu protótipo (internado, comparado por identidade)"""
+    if carta is None:
+        return None
+    return (carta.id, carta.prototipo)
+
+
+class FotoJogador(NamedTuple):
+    """Estado de um jogador no momento em que foi desenhado"""
+    nome: str
+    emTurno: bool
+    pontos: int
+    pedras: Tuple[Tuple[PedrasEnum, int], ...]
+    cartas: tuple
+    reservadas: tuple
+
+    @classmethod
+    def capturar(cls, jogador: Jogador) -> "FotoJogador":
+        return cls(
+            nome=jogador.pegarNome(),
+            emTurno=bool(jogador.jogadorEmTurno),
+            pontos=jogador.pegarPontuacaoJogador(),
+            pedras=tuple(jogador.pegarPedras().items()),
+            cartas=tuple(assinaturaCarta(carta) for carta in jogador.pegarCartas()),
+            reservadas=tuple(assinaturaCarta(carta) for carta in jogador.pegarCartasReservadas()),
+        )
+
+    def painel(self):
+        """Dados exibidos no painel de informações do jogador"""
+        return (self.nome, self.emTurno, self.pontos, self.pedras)
+
+
+class FotoTabuleiro(NamedTuple):
+    """Cópia imutável do que foi desenhado, para comparar com o próximo tabuleiro"""
+    cartas: tuple
+    pedras: Tuple[Tuple[PedrasEnum, int], ...]
+    local: FotoJogador
+    remoto: FotoJogador
+
+    @classmethod
+    def capturar(cls, tabuleiro) -> "FotoTabuleiro":
+        return cls(
+            cartas=tuple(assinaturaCarta(carta) for carta in tabuleiro.cartasNoTabuleiro),
+            pedras=tuple(tabuleiro.pedrasNoTabuleiro.items()),
+            local=FotoJogador.capturar(tabuleiro.pegarJogadorLocal()),
+            remoto=FotoJogador.capturar(tabuleiro.pegarJogadorRemoto()),
+        )
+
+    def jogador(self, lado: str) -> FotoJogador:
+        return self.local if lado == "local" else self.remoto
+
+
+class DiffTabuleiro(NamedTuple):
+    """Partes da tela que mudaram entre dois tabuleiros"""
+    slots: FrozenSet[int]
+    pedras: FrozenSet[PedrasEnum]
+    paineis: FrozenSet[str]
+    maos: FrozenSet[str]
+    reservas: FrozenSet[str]
+    turno: bool
+
+    def vazio(self) -> bool:
+        return not (self.slots or self.pedras or self.paineis or self.maos or self.reservas or self.turno)
+
+    def __str__(self):
+        partes = []
+        if self.slots:
+            partes.append(f"cartas {sorted(self.slots)}")
+        if self.pedras:
+            partes.append(f"pedras {sorted(pedra.name for pedra in self.pedras)}")
+        for nome, lados in (("painel", self.paineis), ("mão", self.maos), ("reservas", self.reservas)):
+            if lados:
+                partes.append(f"{nome} {'/'.join(sorted(lados))}")
+        if self.turno:
+            partes.append("turno")
+        return ", ".join(partes) if partes else "sem mudanças"
+
+
+def compararTabuleiros(anterior: Optional[FotoTabuleiro], novo: FotoTabuleiro) -> DiffTabuleiro:
+    """Compara o estado desenhado com o novo. Sem estado anterior, tudo é considerado alterado"""
+    if anterior is None:
+        return DiffTabuleiro(
+            slots=frozenset(range(len(novo.cartas))),
+            pedras=frozenset(pedra for pedra, _ in novo.pedras),
+            paineis=frozenset(LADOS),
+            maos=frozenset(LADOS),
+            reservas=frozenset(LADOS),
+            turno=True,
+        )
+
+    total_slots = max(len(anterior.cartas), len(novo.cartas))
+    slots = frozenset(
+        idx for idx in range(total_slots)
+        if _posicao(anterior.cartas, idx) != _posicao(novo.cartas, idx)
+    )
+
+    pedras_anteriores = dict(anterior.pedras)
+    pedras_novas = dict(novo.pedras)
+    pedras = frozenset(
+        pedra for pedra in set(pedras_anteriores) | set(pedras_novas)
+        if pedras_anteriores.get(pedra, 0) != pedras_novas.get(pedra, 0)
+    )
+
+    paineis = frozenset(lado for lado in LADOS if anterior.jogador(lado).painel() != novo.jogador(lado).painel())
+    maos = frozenset(lado for lado in LADOS if anterior.jogador(lado).cartas != novo.jogador(lado).cartas)
+    reservas = frozenset(lado for lado in LADOS if anterior.jogador(lado).reservadas != novo.jogador(lado).reservadas)
+    turno = any(anterior.jogador(lado).emTurno != novo.jogador(lado).emTurno for lado in LADOS)
+
+    return DiffTabuleiro(slots, pedras, paineis, maos, reservas, turno)
+
+
+def _posicao(sequencia: tuple, idx: int):
+    return sequencia[idx] if idx < len(sequencia) else None
@@ -0,0 +1,201 @@
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .enums.niveisEnum import NiveisEnum
+from .enums.pedrasEnum import PedrasEnum
+
+# Diretório base com as artes das cartas do tabuleiro
+DIRETORIO_CARTAS = Path("./resources/cartas/cartas-tabuleiro")
+
+# Manifesto gerado a partir dos nomes dos arquivos (python -m model.manifesto_cartas, dentro de src)
+ARQUIVO_MANIFESTO = Path("./resources/cartas/manifesto-cartas.json")
+VERSAO_MANIFESTO = 1
+
+# Subdiretórios das artes e se contêm cartas de roubo
+DIRETORIOS_CATALOGO = [
+    ("cartas-nivel-1", False),
+    ("cartas-nivel-2", False),
+    ("cartas-nivel-3", False),
+    ("cartas-de-roubo", True),
+]
+
+# Diretório das artes de cada nível de baralho
+DIRETORIOS_NIVEIS = {
+    NiveisEnum.NIVEL1: "cartas-nivel-1",
+    NiveisEnum.NIVEL2: "cartas-nivel-2",
+    NiveisEnum.NIVEL3: "cartas-nivel-3",
+}
+DIRETORIO_ROUBO = "cartas-de-roubo"
+
+
+def extrair_dados_carta(carta_img_path: Path, roubo=False):
+    """Extrai os atributos de uma carta a partir do nome do arquivo da sua arte"""
+    nome = carta_img_path.stem
+    pontos = 0
+    bonus = None
+    pedras = {}
+    cartaDeRoubo = roubo
+    habilitada = True
+
+    partes = nome.split('-')
+    for parte in partes:
+        if parte.startswith("pontos:"):
+            pontos = int(parte.split(":")[1])
+        elif parte.startswith("bonus:"):
+            bonus_nome = parte.split(":")[1]
+            bonus = PedrasEnum[bonus_nome.upper()]
+        elif parte.startswith("roubo"):
+            pedras_roubo = parte.split('-')[1:]
+            for pedra_nome in pedras_roubo:
+                pedra_enum = PedrasEnum[pedra_nome.upper()]
+                pedras[pedra_enum] = 1
+        elif ':' in parte:
+            pedra_nome, qtd = parte.split(':')
+            # Só adiciona se não for bonus
+            if pedra_nome.lower() not in [p.name.lower() for p in PedrasEnum]:
+                continue
+            pedra_enum = PedrasEnum[pedra_nome.upper()]
+            pedras[pedra_enum] = int(qtd)
+
+    # Usa o nome do arquivo como ID base para garantir consistência
+    # O ID final será gerado usando hash determinístico no método que chama esta função
+    id_carta = nome
+    return id_carta, pontos, pedras, cartaDeRoubo, bonus, habilitada
+
+
+class DefinicaoCarta(NamedTuple):
+    """Definição imutável de um desenho de carta, como descrito no manifesto"""
+    nome: str  # Nome do arquivo sem extensão, usado como base dos ids das cartas
+    arquivo: str  # Caminho da arte relativo a DIRETORIO_CARTAS
+    nivel: NiveisEnum
+    pontos: int
+    pedras: Tuple[Tuple[PedrasEnum, int], ...]
+    bonus: Optional[PedrasEnum]
+    cartaDeRoubo: bool
+
+    def pegarPedras(self) -> Dict[PedrasEnum, int]:
+        """Retorna uma cópia do custo da carta como dict"""
+        return dict(self.pedras)
+
+    def caminhoArte(self, diretorio_base: Path = DIRETORIO_CARTAS) -> Path:
+        return diretorio_base / self.arquivo
+
+    def to_dict(self):
+        return {
+            "nome": self.nome,
+            "arquivo": self.arquivo,
+            "nivel": self.nivel.name,
+            "pontos": self.pontos,
+            "pedras": {pedra.name: qtd for pedra, qtd in self.pedras},
+            "bonus": self.bonus.name if self.bonus else None,
+            "cartaDeRoubo": self.cartaDeRoubo,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            nome=data["nome"],
+            arquivo=data["arquivo"],
+            nivel=NiveisEnum[data["nivel"]],
+            pontos=data["pontos"],
+            pedras=tuple((PedrasEnum[pedra], qtd) for pedra, qtd in data["pedras"].items()),
+            bonus=PedrasEnum[data["bonus"]] if data["bonus"] else None,
+            cartaDeRoubo=data["cartaDeRoubo"],
+        )
+
+
+class ManifestoCartas:
+    """Definições de todas as cartas do jogo, agrupadas pelo diretório de origem da arte"""
+
+    def __init__(self, definicoes: Dict[str, Tuple[DefinicaoCarta, ...]]):
+        self._definicoes = {diretorio: tuple(lista) for diretorio, lista in definicoes.items()}
+
+    def pegarDefinicoes(self, diretorio: str) -> Tuple[DefinicaoCarta, ...]:
+        """Definições de um diretório, em ordem determinística (ordem dos nomes dos arquivos)"""
+        return self._definicoes.get(diretorio, ())
+
+    def definicoesDoNivel(self, nivel: NiveisEnum) -> Tuple[DefinicaoCarta, ...]:
+        return self.pegarDefinicoes(DIRETORIOS_NIVEIS[nivel])
+
+    def definicoesRoubo(self) -> Tuple[DefinicaoCarta, ...]:
+        return self.pegarDefinicoes(DIRETORIO_ROUBO)
+
+    def diretorios(self) -> List[str]:
+        return list(self._definicoes)
+
+    def __iter__(self) -> Iterator[DefinicaoCarta]:
+        for definicoes in self._definicoes.values():
+            yield from definicoes
+
+    def __len__(self):
+        return sum(len(definicoes) for definicoes in self._definicoes.values())
+
+    @classmethod
+    def gerar(cls, diretorio_base: Path = DIRETORIO_CARTAS) -> "ManifestoCartas":
+        """Monta o manifesto lendo os nomes dos arquivos de arte"""
+        definicoes = {}
+        for nome_diretorio, roubo in DIRETORIOS_CATALOGO:
+            # Ordena os arquivos para garantir consistência entre jogadores
+            arquivos = sorted((diretorio_base / nome_diretorio).glob("*.png"), key=lambda x: x.name)
+            lista = []
+            for arquivo in arquivos:
+                nome, pontos, pedras, cartaDeRoubo, bonus, _ = extrair_dados_carta(arquivo, roubo)
+                # As cartas de roubo entram no baralho do nível 3
+                nivel = NiveisEnum.NIVEL3 if roubo else NiveisEnum(int(nome_diretorio.rsplit("-", 1)[1]))
+                lista.append(DefinicaoCarta(
+                    nome=nome,
+                    arquivo=f"{nome_diretorio}/{arquivo.name}",
+                    nivel=nivel,
+                    pontos=pontos,
+                    pedras=tuple(pedras.items()),
+                    bonus=bonus,
+                    cartaDeRoubo=cartaDeRoubo,
+                ))
+            definicoes[nome_diretorio] = tuple(lista)
+        return cls(definicoes)
+
+    def to_dict(self):
+        return {
+            "versao": VERSAO_MANIFESTO,
+            "diretorios": {diretorio: [d.to_dict() for d in lista] for diretorio, lista in self._definicoes.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("versao") != VERSAO_MANIFESTO:
+            raise ValueError(f"Versão de manifesto não suportada: {data.get('versao')}")
+        return cls({
+            diretorio: tuple(DefinicaoCarta.from_dict(d) for d in lista)
+            for diretorio, lista in data["diretorios"].items()
+        })
+
+    def salvar(self, caminho: Path = ARQUIVO_MANIFESTO):
+        caminho.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    @classmethod
+    def carregar(cls, caminho: Path = ARQUIVO_MANIFESTO) -> "ManifestoCartas":
+        return cls.from_dict(json.loads(caminho.read_text(encoding="utf-8")))
+
+
+_manifesto: Optional[ManifestoCartas] = None
+
+
+def pegarManifestoCartas() -> ManifestoCartas:
+    """Retorna o manifesto das cartas, lendo o arquivo na primeira chamada"""
+    global _manifesto
+    if _manifesto is None:
+        try:
+            _manifesto = ManifestoCartas.carregar()
+        except (OSError, ValueError, KeyError) as e:
+            # Sem manifesto válido, monta as definições a partir dos nomes dos arquivos
+            print(f"Erro ao ler manifesto de cartas ({e}); gerando a partir das artes")
+            _manifesto = ManifestoCartas.gerar()
+    return _manifesto
+
+
+if __name__ == "__main__":
+    # Etapa de build: python -m model.manifesto_cartas (executar dentro de src)
+    manifesto = ManifestoCartas.gerar()
+    manifesto.salvar()
+    print(f"Manifesto gerado em {ARQUIVO_MANIFESTO} com {len(manifesto)} cartas")
@@ -2,7 +2,7 @@ from typing import Dict, List, Optional, Tuple
 import random
 from .jogador import Jogador
 from .baralho import Baralho
-from .carta import Carta
+from .carta import Carta, PrototipoCarta
 from .enums.pedrasEnum import PedrasEnum
 from .enums.niveisEnum import NiveisEnum
 
@@ -134,6 +134,17 @@ class Tabuleiro:
                     cartaDeRoubo=cartaDeRoubo,
                     bonus=bonus,
                     habilitada=habilitada)
+        self.adicionarCartaAoBaralho(carta)
+
+    def instanciarCartaDoPrototipo(self, id: int, prototipo: PrototipoCarta, habilitada: bool = True) -> Carta:
+        """Cria uma cópia de um desenho de carta compartilhado e a coloca no baralho do seu nível"""
+        carta = Carta.doPrototipo(id, prototipo, habilitada)
+        self.adicionarCartaAoBaralho(carta)
+        return carta
+
+    def adicionarCartaAoBaralho(self, carta: Carta):
+        id = carta.id
+        nivel = carta.nivel
         # Adicione ao baralho correto
         baralho_idx = nivel.value - 1
         if 0 <= baralho_idx < len(self.baralhos):
@@ -0,0 +1,74 @@
+from functools import wraps
+from typing import Callable, Dict, List, Set
+
+
+class AgendadorRedesenho:
+    """Junta os pedidos de redesenho e executa um só no próximo ciclo ocioso do Tk.
+
+    As regiões marcadas como sujas se acumulam até a execução. As chamadas que
+    precisam acontecer depois do redesenho (habilitar/desabilitar botões, efeitos
+    visuais) ficam numa fila e rodam logo após ele, na ordem em que foram feitas.
+    """
+
+    def __init__(self, root, redesenhar: Callable[[Set[str]], None]):
+        self.root = root
+        self.redesenhar = redesenhar
+        self._sujas: Set[str] = set()
+        self._depois: List[Callable[[], None]] = []
+        self._agendamento = None
+        self.pedidos = 0
+        self.redesenhos = 0
+
+    def marcar(self, *regioes: str):
+        """Marca as regiões como sujas e agenda o redesenho, se ainda não houver um agendado"""
+        self._sujas.update(regioes)
+        self.pedidos += 1
+        if self._agendamento is None:
+            self._agendamento = self.root.after_idle(self._executarAgendado)
+
+    def pendente(self) -> bool:
+        return self._agendamento is not None
+
+    def depois(self, acao: Callable[[], None]):
+        """Executa a ação logo após o redesenho pendente (ou agora, se não houver nenhum)"""
+        if self.pendente():
+            self._depois.append(acao)
+        else:
+            acao()
+
+    def executar(self):
+        """Executa imediatamente o redesenho pendente, se houver"""
+        if self._agendamento is None:
+            return
+        self.root.after_cancel(self._agendamento)
+        self._executarAgendado()
+
+    def cancelar(self):
+        """Descarta o redesenho pendente e as ações que esperavam por ele"""
+        if self._agendamento is not None:
+            self.root.after_cancel(self._agendamento)
+        self._agendamento = None
+        self._sujas = set()
+        self._depois = []
+
+    def _executarAgendado(self):
+        self._agendamento = None
+        regioes, self._sujas = self._sujas, set()
+        acoes, self._depois = self._depois, []
+        self.redesenhos += 1
+        self.redesenhar(regioes)
+        for acao in acoes:
+            acao()
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Retorna quantos redesenhos foram pedidos e quantos realmente foram executados"""
+        return {"pedidos": self.pedidos, "redesenhos": self.redesenhos}
+
+
+def aposRedesenho(metodo):
+    """Decorador para métodos que mexem nos itens do canvas: se houver um redesenho
+    agendado (em `self.agendador`), a chamada é adiada para logo depois dele"""
+    @wraps(metodo)
+    def envolvido(self, *args, **kwargs):
+        self.agendador.depois(lambda: metodo(self, *args, **kwargs))
+    return envolvido
@@ -0,0 +1,318 @@
+import time
+from collections import Counter
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from tkinter import Canvas
+
+from view.cache_sprites import CacheSprites, pegarCacheSprites
+
+
+class BackendTk:
+    """Backend padrão da TelaJogo: canvas do Tk e o cache de sprites da sessão"""
+    nome = "tk"
+
+    def criarCanvas(self, root, **opcoes):
+        return Canvas(root, **opcoes)
+
+    def cacheSprites(self) -> CacheSprites:
+        return pegarCacheSprites()
+
+
+class OperacaoGravada(NamedTuple):
+    """Uma chamada feita ao canvas de gravação"""
+    nome: str
+    id: Optional[int]
+    argumentos: tuple
+
+
+class SpriteGravado:
+    """Substituto do ImageTk.PhotoImage: guarda só o tamanho da imagem"""
+    __slots__ = ("largura", "altura")
+
+    def __init__(self, largura: int, altura: int):
+        self.largura = largura
+        self.altura = altura
+
+    def width(self) -> int:
+        return self.largura
+
+    def height(self) -> int:
+        return self.altura
+
+
+class CanvasGravacao:
+    """Canvas sem display: mantém os itens em memória e registra cada chamada.
+
+    Implementa a parte da API do tkinter.Canvas que o desenho do jogo usa
+    (criar, configurar, mover, apagar e reordenar itens). Chamadas de outros
+    métodos são aceitas, contadas como "outros" e ignoradas.
+    """
+
+    def __init__(self, backend: "BackendGravacao", **opcoes):
+        self.backend = backend
+        self.opcoes = dict(opcoes)
+        self._proximo_id = 1
+        self._itens: Dict[int, dict] = {}
+        self._ordem: List[int] = []
+        self._binds: Dict[str, Callable] = {}
+        self._existe = True
+
+    # Criação de itens
+    def _criar(self, tipo: str, coords: tuple, opcoes: dict) -> int:
+        id_item = self._proximo_id
+        self._proximo_id += 1
+        tags = opcoes.pop("tags", ())
+        tags = (tags,) if isinstance(tags, str) else tuple(tags)
+        self._itens[id_item] = {"tipo": tipo, "coords": tuple(coords), "tags": tags, "opcoes": opcoes}
+        self._ordem.append(id_item)
+        self.backend.registrar("criar", id_item, (tipo,))
+        return id_item
+
+    def create_image(self, *coords, **opcoes) -> int:
+        return self._criar("image", coords, opcoes)
+
+    def create_text(self, *coords, **opcoes) -> int:
+        return self._criar("text", coords, opcoes)
+
+    def create_line(self, *coords, **opcoes) -> int:
+        return self._criar("line", coords, opcoes)
+
+    def create_rectangle(self, *coords, **opcoes) -> int:
+        return self._criar("rectangle", coords, opcoes)
+
+    def create_oval(self, *coords, **opcoes) -> int:
+        return self._criar("oval", coords, opcoes)
+
+    # Itens existentes
+    def _ids(self, alvo) -> List[int]:
+        if isinstance(alvo, int):
+            return [alvo] if alvo in self._itens else []
+        if alvo == "all":
+            return list(self._ordem)
+        return [id_item for id_item in self._ordem if alvo in self._itens[id_item]["tags"]]
+
+    def coords(self, alvo, *coords):
+        ids = self._ids(alvo)
+        if not coords:
+            return list(self._itens[ids[0]]["coords"]) if ids else []
+        for id_item in ids:
+            self._itens[id_item]["coords"] = tuple(coords)
+            self.backend.registrar("coords", id_item, coords)
+
+    def move(self, alvo, dx, dy):
+        for id_item in self._ids(alvo):
+            coords = self._itens[id_item]["coords"]
+            self._itens[id_item]["coords"] = tuple(c + (dx if i % 2 == 0 else dy) for i, c in enumerate(coords))
+            self.backend.registrar("coords", id_item, (dx, dy))
+
+    def itemconfigure(self, alvo, **opcoes):
+        for id_item in self._ids(alvo):
+            self._itens[id_item]["opcoes"].update(opcoes)
+            self.backend.registrar("itemconfig", id_item, tuple(opcoes))
+
+    itemconfig = itemconfigure
+
+    def itemcget(self, alvo, opcao):
+        ids = self._ids(alvo)
+        return self._itens[ids[0]]["opcoes"].get(opcao) if ids else None
+
+    def delete(self, *alvos):
+        for alvo in alvos:
+            for id_item in self._ids(alvo):
+                del self._itens[id_item]
+                self._ordem.remove(id_item)
+                self.backend.registrar("delete", id_item, ())
+
+    def tag_lower(self, alvo, abaixo_de=None):
+        self._reordenar(alvo, abaixo_de, acima=False)
+
+    def tag_raise(self, alvo, acima_de=None):
+        self._reordenar(alvo, acima_de, acima=True)
+
+    def _reordenar(self, alvo, referencia, acima: bool):
+        ids = self._ids(alvo)
+        restantes = [id_item for id_item in self._ordem if id_item not in ids]
+        if referencia is None:
+            self._ordem = restantes + ids if acima else ids + restantes
+        else:
+            ref = self._ids(referencia)
+            posicao = restantes.index(ref[-1 if acima else 0]) + (1 if acima else 0) if ref else len(restantes)
+            self._ordem = restantes[:posicao] + ids + restantes[posicao:]
+        self.backend.registrar("ordem", None, ())
+
+    def find_withtag(self, alvo) -> Tuple[int, ...]:
+        return tuple(self._ids(alvo))
+
+    def find_overlapping(self, x0, y0, x1, y1) -> Tuple[int, ...]:
+        # Sem geometria real dos itens: o hit-test não é simulado
+        return ()
+
+    def bbox(self, alvo):
+        ids = self._ids(alvo)
+        if not ids:
+            return None
+        x, y = self._itens[ids[0]]["coords"][:2]
+        return (int(x), int(y), int(x) + 1, int(y) + 1)
+
+    def type(self, alvo) -> Optional[str]:
+        ids = self._ids(alvo)
+        return self._itens[ids[0]]["tipo"] if ids else None
+
+    # Widget
+    def bind(self, evento, tratador=None, add=None):
+        self._binds[evento] = tratador
+
+    def tag_bind(self, tag, evento, tratador=None, add=None):
+        self._binds[f"{tag}:{evento}"] = tratador
+
+    def cget(self, opcao):
+        return self.opcoes.get(opcao, "")
+
+    def configure(self, **opcoes):
+        self.opcoes.update(opcoes)
+
+    config = configure
+
+    def canvasx(self, x):
+        return x
+
+    def canvasy(self, y):
+        return y
+
+    def winfo_exists(self) -> int:
+        return int(self._existe)
+
+    def destroy(self):
+        self._existe = False
+
+    def pack(self, **opcoes):
+        pass
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def __getattr__(self, nome):
+        if nome.startswith("_"):
+            raise AttributeError(nome)
+
+        def ignorado(*args, **kwargs):
+            self.backend.registrar("outros", None, (nome,))
+        return ignorado
+
+    def __len__(self):
+        return len(self._itens)
+
+
+class RaizGravacao:
+    """Substituto do Tk root para o backend de gravação.
+
+    Os callbacks de after/after_idle ficam numa fila e só rodam em processarPendentes,
+    o que permite ao benchmark medir cada jogada incluindo o redesenho agendado.
+    """
+
+    def __init__(self):
+        self._pendentes: Dict[str, Tuple[float, Callable]] = {}
+        self._contador = 0
+        self.binds: Dict[str, Callable] = {}
+
+    def after(self, ms, funcao=None, *args):
+        self._contador += 1
+        identificador = f"after#{self._contador}"
+        self._pendentes[identificador] = (time.perf_counter() + ms / 1000, lambda: funcao(*args))
+        return identificador
+
+    def after_idle(self, funcao, *args):
+        return self.after(0, funcao, *args)
+
+    def after_cancel(self, identificador):
+        self._pendentes.pop(identificador, None)
+
+    def processarPendentes(self, incluir_temporizados: bool = False) -> int:
+        """Executa os callbacks ociosos (e os temporizados, se pedido). Retorna quantos rodaram"""
+        executados = 0
+        while True:
+            agora = time.perf_counter()
+            prontos = [
+                identificador for identificador, (quando, _) in self._pendentes.items()
+                if incluir_temporizados or quando <= agora
+            ]
+            if not prontos:
+                return executados
+            for identificador in prontos:
+                pendente = self._pendentes.pop(identificador, None)
+                if pendente is not None:
+                    pendente[1]()
+                    executados += 1
+
+    def bind(self, evento, tratador=None, add=None):
+        self.binds[evento] = tratador
+
+    def unbind(self, evento, funcid=None):
+        self.binds.pop(evento, None)
+
+    def geometry(self, geometria=None):
+        pass
+
+    def title(self, titulo=None):
+        pass
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def winfo_exists(self) -> int:
+        return 1
+
+
+class BackendGravacao:
+    """Backend sem display: canvas e imagens de mentira que contam tudo o que o desenho pede.
+
+    Cada TelaJogo criada com este backend tem um cache de sprites próprio
+    (os sprites gravados não servem para o Tk), e `contadores()` informa
+    as chamadas feitas ao canvas e as imagens alocadas desde o último zerar.
+    """
+    nome = "gravacao"
+
+    def __init__(self, guardar_operacoes: bool = False):
+        self.guardar_operacoes = guardar_operacoes
+        self.operacoes: List[OperacaoGravada] = []
+        self.contagem = Counter()
+        self.bytes_imagens = 0
+        self.canvas: Optional[CanvasGravacao] = None
+        self._cache: Optional[CacheSprites] = None
+
+    def criarRaiz(self) -> RaizGravacao:
+        return RaizGravacao()
+
+    def criarCanvas(self, root, **opcoes) -> CanvasGravacao:
+        self.canvas = CanvasGravacao(self, **opcoes)
+        return self.canvas
+
+    def criarSprite(self, img) -> SpriteGravado:
+        self.contagem["imagens"] += 1
+        self.bytes_imagens += img.width * img.height * 4
+        return SpriteGravado(img.width, img.height)
+
+    def cacheSprites(self) -> CacheSprites:
+        if self._cache is None:
+            self._cache = CacheSprites(criar_sprite=self.criarSprite)
+        return self._cache
+
+    def registrar(self, nome: str, id_item: Optional[int], argumentos: tuple):
+        self.contagem[nome] += 1
+        if self.guardar_operacoes:
+            self.operacoes.append(OperacaoGravada(nome, id_item, argumentos))
+
+    def contadores(self) -> Dict[str, int]:
+        """Chamadas ao canvas e imagens alocadas desde a última vez que os contadores foram zerados"""
+        return dict(self.contagem)
+
+    def zerarContadores(self):
+        self.contagem.clear()
+        self.operacoes.clear()
+        self.bytes_imagens = 0
@@ -0,0 +1,72 @@
+import queue
+import time
+from typing import Callable, Dict
+
+# Intervalo entre as drenagens da fila: limita a latência de uma jogada recebida até ser aplicada
+INTERVALO_MS = 50
+
+# Máximo de eventos aplicados por drenagem, para não travar a interface numa rajada
+MAX_POR_CICLO = 20
+
+
+class BombaEventos:
+    """Ponte entre as threads de rede e o Tk.
+
+    Threads de fundo (como a PollingThread do DOG) nunca tocam no Tk: elas
+    preparam o que for preciso (ex.: deserializar o tabuleiro) e publicam
+    só o passo final, uma função sem argumentos. Uma bomba agendada com
+    root.after drena a fila na thread da interface.
+    """
+
+    def __init__(self, root, intervalo_ms: int = INTERVALO_MS, max_por_ciclo: int = MAX_POR_CICLO):
+        self.root = root
+        self.intervalo_ms = intervalo_ms
+        self.max_por_ciclo = max_por_ciclo
+        self._fila: "queue.Queue" = queue.Queue()
+        self._agendamento = None
+        self.publicados = 0
+        self.aplicados = 0
+        self.latencia_max_ms = 0.0
+
+    def publicar(self, aplicar: Callable[[], None]):
+        """Enfileira a ação para rodar na thread do Tk. Pode ser chamado de qualquer thread"""
+        self._fila.put((time.perf_counter(), aplicar))
+        self.publicados += 1
+
+    def iniciar(self):
+        if self._agendamento is None:
+            self._agendamento = self.root.after(self.intervalo_ms, self._bombear)
+
+    def parar(self):
+        if self._agendamento is not None:
+            self.root.after_cancel(self._agendamento)
+            self._agendamento = None
+
+    def drenar(self) -> int:
+        """Aplica os eventos pendentes (até o máximo por ciclo). Só deve ser chamado na thread do Tk"""
+        aplicados = 0
+        while aplicados < self.max_por_ciclo:
+            try:
+                publicado_em, aplicar = self._fila.get_nowait()
+            except queue.Empty:
+                break
+            self.latencia_max_ms = max(self.latencia_max_ms, (time.perf_counter() - publicado_em) * 1000)
+            try:
+                aplicar()
+            except Exception as e:
+                print(f"Erro ao aplicar evento recebido: {e}")
+            aplicados += 1
+        self.aplicados += aplicados
+        return aplicados
+
+    def _bombear(self):
+        self._agendamento = None
+        self.drenar()
+        self.iniciar()
+
+    def pendentes(self) -> int:
+        return self._fila.qsize()
+
+    def estatisticas(self) -> Dict[str, float]:
+        """Eventos publicados, aplicados e a maior espera na fila (ms)"""
+        return {"publicados": self.publicados, "aplicados": self.aplicados, "latencia_max_ms": self.latencia_max_ms}
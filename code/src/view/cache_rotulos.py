@@ -0,0 +1,43 @@
+from typing import Dict, Tuple
+
+# Fontes dos rótulos do tabuleiro, montadas uma única vez
+FONTE_NOME = ("Arial", 14, "normal")
+FONTE_NOME_TURNO = ("Arial", 14, "bold")
+FONTE_PONTOS = ("Arial", 12)
+FONTE_QTD_MINI = ("Arial", 10)
+FONTE_QTD_PEDRA = ("Aclonica", 14)
+
+
+class CacheRotulos:
+    """Rótulos de texto da cena (nomes, pontos, quantidades de pedras) com cache por slot.
+
+    Cada slot lembra a última chave desenhada: (posição, fonte, texto, cor,
+    âncora). Se a chave não mudou, o item só é mantido no quadro atual, sem
+    montar opções nem comparar nada na cena. Os contadores mostram quantas
+    atualizações foram evitadas.
+    """
+
+    def __init__(self, cena):
+        self.cena = cena
+        self._chaves: Dict[str, Tuple] = {}
+        self.pulados = 0
+        self.atualizados = 0
+
+    def rotulo(self, tag: str, x: float, y: float, texto: str, fonte: tuple,
+               camada: str = "tabuleiro", fill: str = "white", anchor: str = "center"):
+        """Desenha o rótulo do slot, falando com a cena apenas se algo mudou"""
+        chave = (x, y, fonte, texto, fill, anchor, camada)
+        if self._chaves.get(tag) == chave and self.cena.manter(tag):
+            self.pulados += 1
+            return
+        self.cena.texto(tag, x, y, camada=camada, text=texto, fill=fill, font=fonte, anchor=anchor)
+        self._chaves[tag] = chave
+        self.atualizados += 1
+
+    def esquecer(self, tag: str):
+        """Descarta a chave do slot: o próximo desenho dele passa pela cena"""
+        self._chaves.pop(tag, None)
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Retorna quantos rótulos foram pulados (sem mudança) e quantos foram atualizados"""
+        return {"pulados": self.pulados, "atualizados": self.atualizados}
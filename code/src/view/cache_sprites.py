@@ -0,0 +1,180 @@
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple
+
+from PIL import Image, ImageTk
+
+from view import efeitos
+
+# Fração da altura mantida nas cartas cortadas da mão dos jogadores
+FRACAO_CORTE = 0.3
+
+# Memória máxima ocupada pelos sprites e imagens base do cache
+ORCAMENTO_BYTES = 48 * 1024 * 1024
+
+
+def aplicarRotacao(img: Image.Image) -> Image.Image:
+    """Rotaciona a imagem em 180°"""
+    return img.transpose(Image.ROTATE_180)
+
+
+def aplicarCorte(img: Image.Image) -> Image.Image:
+    """Mantém apenas a parte superior da imagem"""
+    return img.crop((0, 0, img.width, int(img.height * FRACAO_CORTE)))
+
+
+def chaveArquivo(caminho, tamanho) -> Tuple[str, Tuple[int, int]]:
+    """Chave da imagem base de um arquivo redimensionado para o tamanho dado"""
+    return (str(Path(caminho)), tuple(tamanho))
+
+
+# Transformações aplicadas sobre a imagem base de cada variante
+VARIANTES: Dict[str, Callable[[Image.Image], Image.Image]] = {
+    "normal": lambda img: img,
+    "transparente": efeitos.transparencia,
+    "escurecida": efeitos.escurecer,
+    "selecionada": efeitos.selecionar,
+    "rotacionada": aplicarRotacao,
+    "cortada": aplicarCorte,
+    "rotacionada_cortada": lambda img: aplicarCorte(aplicarRotacao(img)),
+}
+
+
+class CacheSprites:
+    """Cache das variantes de sprites (normal, transparente, rotacionada, cortada, efeitos de clique).
+
+    Cada imagem base é decodificada e redimensionada uma única vez, e cada par
+    (base, variante) vira um ImageTk.PhotoImage reaproveitado em todos os redesenhos.
+
+    O cache tem um orçamento de memória: ao passar dele, descarta as entradas
+    usadas há mais tempo (LRU). Nunca são descartados os sprites fixados nem os
+    usados desde o início do quadro atual (ou seja, os que estão na tela).
+    """
+
+    def __init__(self, criar_sprite: Callable[[Image.Image], object] = ImageTk.PhotoImage,
+                 orcamento_bytes: int = ORCAMENTO_BYTES):
+        self.criar_sprite = criar_sprite
+        self.orcamento_bytes = orcamento_bytes
+        self._bases: "OrderedDict[Hashable, Image.Image]" = OrderedDict()
+        self._sprites: "OrderedDict[Tuple[Hashable, str], object]" = OrderedDict()
+        self._bytes: Dict[tuple, int] = {}
+        self._uso: Dict[Tuple[Hashable, str], int] = {}
+        self._fixados: Set[Tuple[Hashable, str]] = set()
+        self.quadro = 0
+        self.bytes_total = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.decodificacoes = 0
+        self.despejos = 0
+        # Chamado a cada falha com (variante, segundos gastos construindo o sprite)
+        self.observador_falhas: Optional[Callable[[str, float], None]] = None
+
+    def pegarBase(self, base: Hashable, carregar: Callable[[], Image.Image]) -> Image.Image:
+        """Retorna a imagem PIL base, chamando `carregar` apenas se ela não estiver no cache"""
+        img = self._bases.get(base)
+        if img is not None:
+            self._bases.move_to_end(base)
+            return img
+        img = carregar()
+        self._bases[base] = img
+        self._registrarBytes(("base", base), img.width * img.height * len(img.getbands()))
+        self.decodificacoes += 1
+        return img
+
+    def pegar(self, base: Hashable, variante: str, carregar: Callable[[], Image.Image], fixar: bool = False):
+        """Retorna o sprite da variante pedida, construindo-o apenas se ele não estiver no cache"""
+        chave = (base, variante)
+        if fixar:
+            self._fixados.add(chave)
+        self._uso[chave] = self.quadro
+
+        sprite = self._sprites.get(chave)
+        if sprite is not None:
+            self.acertos += 1
+            self._sprites.move_to_end(chave)
+            return sprite
+
+        self.falhas += 1
+        inicio = time.perf_counter()
+        img = VARIANTES[variante](self.pegarBase(base, carregar))
+        sprite = self.criar_sprite(img)
+        if self.observador_falhas is not None:
+            self.observador_falhas(variante, time.perf_counter() - inicio)
+        self._sprites[chave] = sprite
+        # O Tk guarda os pixels das imagens em 32 bits
+        self._registrarBytes(("sprite", chave), img.width * img.height * 4)
+        self._despejar()
+        return sprite
+
+    def contem(self, base: Hashable, variante: str = "normal") -> bool:
+        """Indica se o sprite da variante já foi construído"""
+        return (base, variante) in self._sprites
+
+    def fixar(self, base: Hashable, variante: str = "normal"):
+        """Impede que o sprite seja descartado (para imagens sempre visíveis, como botões e pedras)"""
+        self._fixados.add((base, variante))
+
+    def liberar(self, base: Hashable, variante: str = "normal"):
+        """Permite que um sprite fixado volte a ser descartado"""
+        self._fixados.discard((base, variante))
+
+    def iniciarQuadro(self):
+        """Marca o início de um redesenho completo: só os sprites usados a partir daqui ficam protegidos"""
+        self.quadro += 1
+
+    def _registrarBytes(self, chave: tuple, tamanho: int):
+        self._bytes[chave] = tamanho
+        self.bytes_total += tamanho
+
+    def _liberarBytes(self, chave: tuple):
+        self.bytes_total -= self._bytes.pop(chave, 0)
+
+    def _protegido(self, chave: Tuple[Hashable, str]) -> bool:
+        return chave in self._fixados or self._uso.get(chave) == self.quadro
+
+    def _despejar(self):
+        """Descarta as entradas menos usadas até voltar ao orçamento"""
+        if self.bytes_total <= self.orcamento_bytes:
+            return
+
+        # Primeiro as imagens base, que podem ser refeitas a partir do pacote de assets
+        while self._bases and self.bytes_total > self.orcamento_bytes:
+            base, _ = self._bases.popitem(last=False)
+            self._liberarBytes(("base", base))
+            self.despejos += 1
+
+        for chave in list(self._sprites):
+            if self.bytes_total <= self.orcamento_bytes:
+                break
+            if self._protegido(chave):
+                continue
+            del self._sprites[chave]
+            self._uso.pop(chave, None)
+            self._liberarBytes(("sprite", chave))
+            self.despejos += 1
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Retorna o tamanho do cache e os contadores de acertos, falhas, decodificações e descartes"""
+        return {
+            "sprites": len(self._sprites),
+            "bases": len(self._bases),
+            "fixados": len(self._fixados),
+            "bytes": self.bytes_total,
+            "orcamento_bytes": self.orcamento_bytes,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "decodificacoes": self.decodificacoes,
+            "despejos": self.despejos,
+        }
+
+
+_cache: Optional[CacheSprites] = None
+
+
+def pegarCacheSprites() -> CacheSprites:
+    """Retorna o cache de sprites da sessão, criando-o na primeira chamada"""
+    global _cache
+    if _cache is None:
+        _cache = CacheSprites()
+    return _cache
@@ -0,0 +1,190 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image
+
+from view.cache_sprites import CacheSprites, chaveArquivo
+
+# Número máximo de threads de decodificação (a decodificação de PNG e o resize do PIL liberam o GIL)
+MAX_THREADS = min(8, os.cpu_count() or 1)
+
+# Bomba do pré-aquecimento: a cada intervalo, quantos sprites decodificados viram PhotoImage na thread do Tk
+INTERVALO_BOMBA_MS = 15
+SPRITES_POR_BOMBA = 4
+
+Especificacao = Tuple[Path, Tuple[int, int]]
+Progresso = Callable[[int, int], None]
+
+
+def decodificarEmParalelo(especificacoes: List[Especificacao], decodificar: Callable[[Path, Tuple[int, int]], Image.Image],
+                          max_threads: int = MAX_THREADS) -> Iterable[Tuple[Especificacao, Optional[Image.Image]]]:
+    """Decodifica as imagens em um pool de threads, devolvendo cada uma assim que fica pronta.
+
+    As imagens que falharem são devolvidas como None (o erro é impresso).
+    """
+    if max_threads <= 1 or len(especificacoes) <= 1:
+        for especificacao in especificacoes:
+            yield especificacao, _decodificar(decodificar, especificacao)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="carregador-assets") as pool:
+        futuros = {pool.submit(_decodificar, decodificar, especificacao): especificacao for especificacao in especificacoes}
+        for futuro in as_completed(futuros):
+            yield futuros[futuro], futuro.result()
+
+
+def _decodificar(decodificar, especificacao: Especificacao) -> Optional[Image.Image]:
+    caminho, tamanho = especificacao
+    try:
+        img = decodificar(caminho, tamanho)
+        # Força a leitura dos pixels aqui, fora da thread do Tk
+        img.load()
+        return img
+    except Exception as e:
+        print(f"Erro ao carregar {caminho}: {e}")
+        return None
+
+
+class CarregadorAssets:
+    """Pré-carrega os sprites do jogo: decodifica no pool de threads e cria os PhotoImage na thread do Tk.
+
+    O método carregar deve ser chamado da thread do Tk; o callback de progresso
+    também é chamado nela, então pode atualizar widgets.
+    """
+
+    def __init__(self, sprites: CacheSprites, decodificar: Callable[[Path, Tuple[int, int]], Image.Image],
+                 max_threads: int = MAX_THREADS):
+        self.sprites = sprites
+        self.decodificar = decodificar
+        self.max_threads = max_threads
+
+        # Estado do carregamento em segundo plano
+        self._fila: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self.progresso: Optional[Progresso] = None
+        self.total = 0
+        self.feitos = 0
+        self.erros = 0
+        self.concluido = True
+
+    def pendentes(self, especificacoes: List[Especificacao]) -> List[Especificacao]:
+        """Especificações que ainda não estão no cache de sprites"""
+        vistas = set()
+        pendentes = []
+        for caminho, tamanho in especificacoes:
+            chave = chaveArquivo(caminho, tamanho)
+            if chave in vistas or self.sprites.contem(chave):
+                continue
+            vistas.add(chave)
+            pendentes.append((Path(caminho), tuple(tamanho)))
+        return pendentes
+
+    def carregar(self, especificacoes: List[Especificacao], progresso: Optional[Progresso] = None) -> Dict[str, int]:
+        """Carrega todos os sprites pendentes, chamando progresso(feitos, total) a cada imagem pronta"""
+        pendentes = self.pendentes(especificacoes)
+        total = len(pendentes)
+        feitos = 0
+        erros = 0
+        if progresso:
+            progresso(feitos, total)
+
+        for (caminho, tamanho), img in decodificarEmParalelo(pendentes, self.decodificar, self.max_threads):
+            if img is None:
+                erros += 1
+            else:
+                # Só a criação do PhotoImage acontece aqui, na thread do Tk
+                self.sprites.pegar(chaveArquivo(caminho, tamanho), "normal", lambda: img)
+            feitos += 1
+            if progresso:
+                progresso(feitos, total)
+
+        return {"total": total, "erros": erros}
+
+    def iniciarEmSegundoPlano(self, root, especificacoes: List[Especificacao]):
+        """Começa a decodificar sem bloquear a interface.
+
+        A decodificação roda numa thread própria (que usa o pool de threads) e os
+        PhotoImage são criados aos poucos por uma bomba agendada com root.after.
+        """
+        pendentes = self.pendentes(especificacoes)
+        self.total = len(pendentes)
+        self.feitos = 0
+        self.erros = 0
+        self.concluido = False
+        self._fila = queue.Queue()
+        self._thread = threading.Thread(target=self._decodificarEmSegundoPlano, args=(pendentes,),
+                                        name="preaquecimento-assets", daemon=True)
+        self._thread.start()
+        root.after(INTERVALO_BOMBA_MS, lambda: self._bombear(root))
+
+    def _decodificarEmSegundoPlano(self, pendentes: List[Especificacao]):
+        try:
+            for especificacao, img in decodificarEmParalelo(pendentes, self.decodificar, self.max_threads):
+                self._fila.put((especificacao, img))
+        except Exception as e:
+            print(f"Erro no pré-aquecimento dos assets: {e}")
+        finally:
+            # Marca o fim da fila
+            self._fila.put(None)
+
+    def _bombear(self, root):
+        """Transforma alguns sprites já decodificados em PhotoImage e se reagenda até terminar"""
+        for _ in range(SPRITES_POR_BOMBA):
+            if not self._consumir(bloquear=False):
+                break
+        if not self.concluido:
+            root.after(INTERVALO_BOMBA_MS, lambda: self._bombear(root))
+
+    def _consumir(self, bloquear: bool) -> bool:
+        """Cria o PhotoImage do próximo sprite decodificado. Retorna False se não houver nenhum pronto"""
+        if self.concluido:
+            return False
+        try:
+            item = self._fila.get(block=bloquear)
+        except queue.Empty:
+            return False
+        if item is None:
+            self.concluido = True
+            return False
+
+        (caminho, tamanho), img = item
+        if img is None:
+            self.erros += 1
+        else:
+            self.sprites.pegar(chaveArquivo(caminho, tamanho), "normal", lambda: img)
+        self.feitos += 1
+        if self.progresso:
+            self.progresso(self.feitos, self.total)
+        return True
+
+    def concluir(self, progresso: Optional[Progresso] = None) -> Dict[str, int]:
+        """Espera o carregamento em segundo plano terminar, criando os sprites que faltam (chamar na thread do Tk)"""
+        self.progresso = progresso
+        if progresso and not self.concluido:
+            progresso(self.feitos, self.total)
+        while not self.concluido:
+            self._consumir(bloquear=True)
+        self.progresso = None
+        return {"total": self.total, "erros": self.erros}
+
+
+_preaquecimento: Optional[CarregadorAssets] = None
+
+
+def iniciarPreaquecimento(root, sprites: CacheSprites, especificacoes: List[Especificacao],
+                          decodificar: Callable[[Path, Tuple[int, int]], Image.Image]) -> CarregadorAssets:
+    """Começa a preparar os sprites do jogo em segundo plano, uma única vez por sessão"""
+    global _preaquecimento
+    if _preaquecimento is None:
+        _preaquecimento = CarregadorAssets(sprites, decodificar)
+        _preaquecimento.iniciarEmSegundoPlano(root, especificacoes)
+    return _preaquecimento
+
+
+def pegarPreaquecimento() -> Optional[CarregadorAssets]:
+    """Retorna o pré-aquecimento iniciado na abertura do jogo, se houver"""
+    return _preaquecimento
@@ -0,0 +1,73 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from model.enums.pedrasEnum import PedrasEnum
+from model.manifesto_cartas import (DIRETORIO_CARTAS, DIRETORIOS_CATALOGO, DefinicaoCarta, ManifestoCartas,
+                                    pegarManifestoCartas)
+
+
+class CatalogoCartas:
+    """Índice das artes das cartas, montado uma única vez a partir do manifesto de cartas.
+
+    Cada arte é indexada pelos atributos da carta (pontos, pedras, bônus e se é
+    carta de roubo), de modo que qualquer carta encontra seu arquivo em O(1).
+    """
+
+    def __init__(self, manifesto: ManifestoCartas, diretorio_base: Path = DIRETORIO_CARTAS):
+        self.manifesto = manifesto
+        self.diretorio_base = diretorio_base
+        self._caminhos: Dict[tuple, Path] = {}
+        self._arquivos: Dict[str, List[Path]] = {}
+
+        for nome_diretorio, _ in DIRETORIOS_CATALOGO:
+            definicoes = manifesto.pegarDefinicoes(nome_diretorio)
+            self._arquivos[nome_diretorio] = [definicao.caminhoArte(diretorio_base) for definicao in definicoes]
+            for definicao in definicoes:
+                # Se duas artes tiverem os mesmos atributos, mantém a primeira
+                self._caminhos.setdefault(self.chaveDefinicao(definicao), definicao.caminhoArte(diretorio_base))
+
+    @staticmethod
+    def chave(pontos: int, pedras: Dict[PedrasEnum, int], bonus: Optional[PedrasEnum], cartaDeRoubo: bool) -> tuple:
+        """Monta a chave do catálogo a partir dos atributos de uma carta"""
+        pedras_ordenadas: Tuple[Tuple[str, int], ...] = tuple(sorted((p.name, q) for p, q in pedras.items()))
+        return (pontos, pedras_ordenadas, bonus, cartaDeRoubo)
+
+    def chaveDefinicao(self, definicao: DefinicaoCarta) -> tuple:
+        """Retorna a chave do catálogo para uma definição do manifesto"""
+        return self.chave(definicao.pontos, definicao.pegarPedras(), definicao.bonus, definicao.cartaDeRoubo)
+
+    def chaveCarta(self, carta) -> tuple:
+        """Retorna a chave do catálogo para uma carta"""
+        return self.chave(carta.pontos, carta.pedras, carta.bonus, carta.cartaDeRoubo)
+
+    def pegarCaminho(self, carta) -> Optional[Path]:
+        """Retorna o arquivo da arte de uma carta, ou None se não houver arte correspondente"""
+        if carta is None:
+            return None
+        # Cartas criadas a partir do manifesto já conhecem sua arte
+        prototipo = getattr(carta, "prototipo", None)
+        if prototipo is not None and prototipo.definicao is not None:
+            return prototipo.definicao.caminhoArte(self.diretorio_base)
+        return self._caminhos.get(self.chaveCarta(carta))
+
+    def pegarDefinicoes(self, nome_diretorio: str) -> Tuple[DefinicaoCarta, ...]:
+        """Retorna as definições das cartas de um subdiretório, na mesma ordem dos arquivos"""
+        return self.manifesto.pegarDefinicoes(nome_diretorio)
+
+    def pegarArquivos(self, nome_diretorio: str) -> List[Path]:
+        """Retorna os arquivos de um subdiretório do catálogo, em ordem determinística"""
+        return list(self._arquivos.get(nome_diretorio, []))
+
+    def __len__(self):
+        return len(self._caminhos)
+
+
+_catalogo: Optional[CatalogoCartas] = None
+
+
+def pegarCatalogoCartas() -> CatalogoCartas:
+    """Retorna o catálogo de artes, montando-o na primeira chamada"""
+    global _catalogo
+    if _catalogo is None:
+        _catalogo = CatalogoCartas(pegarManifestoCartas())
+    return _catalogo
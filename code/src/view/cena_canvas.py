@@ -0,0 +1,172 @@
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+# Camadas da cena, de baixo para cima. Itens criados depois continuam dentro da sua camada
+CAMADAS = ["fundo", "tabuleiro", "botoes", "pedras", "jogadores", "maos", "reservadas", "efeitos"]
+
+
+class ItemCena:
+    """Estado conhecido de um item do canvas (o que já foi enviado ao Tk)"""
+    __slots__ = ("id", "tipo", "camada", "coords", "opcoes", "visivel")
+
+    def __init__(self, id: int, tipo: str, camada: str, coords: Tuple[float, ...], opcoes: dict):
+        self.id = id
+        self.tipo = tipo
+        self.camada = camada
+        self.coords = coords
+        self.opcoes = opcoes
+        self.visivel = True
+
+
+class CenaCanvas:
+    """Camada retida sobre o canvas do jogo.
+
+    Cada slot da tela (identificado pela sua tag) vira um item criado uma única
+    vez. Os redesenhos seguintes só chamam coords/itemconfig quando a posição
+    ou alguma opção realmente mudou, e os slots que não foram desenhados no
+    quadro atual são escondidos em vez de apagados.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._itens: Dict[str, ItemCena] = {}
+        self._desenhados: Set[str] = set()
+        self._camadas_quadro: Optional[Set[str]] = None
+        self._tags_por_id: Dict[int, str] = {}
+        self.operacoes = Counter()
+
+        # Marcadores invisíveis que delimitam o topo de cada camada
+        self._marcadores: Dict[str, int] = {}
+        for camada in CAMADAS:
+            self._marcadores[camada] = canvas.create_line(0, 0, 0, 0, state="hidden", tags="marcador_camada")
+
+    def iniciarQuadro(self, camadas=None):
+        """Começa um redesenho: os slots não desenhados até finalizarQuadro serão escondidos.
+
+        Com `camadas`, o redesenho é parcial e só os slots dessas camadas podem ser escondidos.
+        """
+        self._desenhados = set()
+        self._camadas_quadro = set(camadas) if camadas is not None else None
+
+    def finalizarQuadro(self):
+        """Esconde os slots que não foram desenhados neste quadro"""
+        for tag, item in self._itens.items():
+            if tag in self._desenhados or not item.visivel:
+                continue
+            if self._camadas_quadro is None or item.camada in self._camadas_quadro:
+                self._esconder(item)
+
+    def imagem(self, tag: str, x: float, y: float, camada: str = "tabuleiro", **opcoes) -> int:
+        """Desenha (ou atualiza) o slot de imagem identificado pela tag"""
+        return self._desenhar("image", tag, (x, y), camada, opcoes)
+
+    def texto(self, tag: str, x: float, y: float, camada: str = "tabuleiro", **opcoes) -> int:
+        """Desenha (ou atualiza) o slot de texto identificado pela tag"""
+        return self._desenhar("text", tag, (x, y), camada, opcoes)
+
+    def _desenhar(self, tipo: str, tag: str, coords: Tuple[float, ...], camada: str, opcoes: dict) -> int:
+        self._desenhados.add(tag)
+        item = self._itens.get(tag)
+
+        if item is not None and item.tipo != tipo:
+            self.remover(tag)
+            item = None
+
+        if item is None:
+            criar = self.canvas.create_image if tipo == "image" else self.canvas.create_text
+            id_item = criar(*coords, tags=tag, **opcoes)
+            self.canvas.tag_lower(id_item, self._marcadores[camada])
+            self._itens[tag] = ItemCena(id_item, tipo, camada, coords, dict(opcoes))
+            self._tags_por_id[id_item] = tag
+            self.operacoes["criar"] += 1
+            return id_item
+
+        if item.coords != coords:
+            self.canvas.coords(item.id, *coords)
+            item.coords = coords
+            self.operacoes["coords"] += 1
+        self._configurarItem(item, opcoes)
+        if not item.visivel:
+            self.canvas.itemconfigure(item.id, state="normal")
+            item.visivel = True
+            self.operacoes["exibir"] += 1
+        return item.id
+
+    def _configurarItem(self, item: ItemCena, opcoes: dict):
+        mudancas = {nome: valor for nome, valor in opcoes.items() if item.opcoes.get(nome) is not valor and item.opcoes.get(nome) != valor}
+        if mudancas:
+            self.canvas.itemconfigure(item.id, **mudancas)
+            item.opcoes.update(mudancas)
+            self.operacoes["config"] += 1
+
+    def manter(self, tag: str) -> bool:
+        """Marca o slot como desenhado neste quadro sem reconfigurá-lo. Retorna False se ele não existir"""
+        item = self._itens.get(tag)
+        if item is None:
+            return False
+        self._desenhados.add(tag)
+        if not item.visivel:
+            self.canvas.itemconfigure(item.id, state="normal")
+            item.visivel = True
+            self.operacoes["exibir"] += 1
+        return True
+
+    def configurar(self, tag: str, **opcoes):
+        """Equivalente ao canvas.itemconfig, mas só fala com o Tk se alguma opção mudou"""
+        item = self._itens.get(tag)
+        if item is not None:
+            self._configurarItem(item, opcoes)
+
+    def mover(self, tag: str, x: float, y: float):
+        """Muda a posição do slot, se ela for diferente da atual"""
+        item = self._itens.get(tag)
+        if item is not None and item.coords != (x, y):
+            self.canvas.coords(item.id, x, y)
+            item.coords = (x, y)
+            self.operacoes["coords"] += 1
+
+    def posicao(self, tag: str) -> Optional[Tuple[float, ...]]:
+        item = self._itens.get(tag)
+        return item.coords if item is not None else None
+
+    def esconder(self, tag: str):
+        item = self._itens.get(tag)
+        if item is not None and item.visivel:
+            self._esconder(item)
+        self._desenhados.discard(tag)
+
+    def _esconder(self, item: ItemCena):
+        self.canvas.itemconfigure(item.id, state="hidden")
+        item.visivel = False
+        self.operacoes["esconder"] += 1
+
+    def remover(self, tag: str):
+        item = self._itens.pop(tag, None)
+        if item is not None:
+            self._tags_por_id.pop(item.id, None)
+            self.canvas.delete(item.id)
+            self.operacoes["remover"] += 1
+
+    def existe(self, tag: str) -> bool:
+        return tag in self._itens
+
+    def visivel(self, tag: str) -> bool:
+        item = self._itens.get(tag)
+        return item is not None and item.visivel
+
+    def tagDoItem(self, id_item: int) -> Optional[str]:
+        """Slot ao qual pertence o item do canvas (None para itens fora da cena)"""
+        return self._tags_por_id.get(id_item)
+
+    def visiveis(self) -> List[str]:
+        return [tag for tag, item in self._itens.items() if item.visivel]
+
+    def contadores(self) -> Dict[str, int]:
+        """Operações enviadas ao canvas desde a última vez que os contadores foram zerados"""
+        return dict(self.operacoes)
+
+    def zerarContadores(self):
+        self.operacoes.clear()
+
+    def __len__(self):
+        return len(self._itens)
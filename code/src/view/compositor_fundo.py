@@ -0,0 +1,64 @@
+from typing import Callable, List, Tuple
+
+from PIL import Image, ImageColor
+
+# Âncoras aceitas para as camadas, no mesmo sentido das do canvas do Tk
+ANCORAS = {"nw", "sw", "ne", "se"}
+
+
+class CamadaFundo:
+    """Imagem estática posicionada no fundo (ex.: capa de baralho, sombra de painel)"""
+    __slots__ = ("nome", "x", "y", "anchor", "carregar")
+
+    def __init__(self, nome: str, x: int, y: int, anchor: str, carregar: Callable[[], Image.Image]):
+        self.nome = nome
+        self.x = x
+        self.y = y
+        self.anchor = anchor
+        self.carregar = carregar
+
+    def origem(self, img: Image.Image) -> Tuple[int, int]:
+        """Canto superior esquerdo da imagem, convertendo a âncora"""
+        x = self.x - img.width if "e" in self.anchor else self.x
+        y = self.y - img.height if "s" in self.anchor else self.y
+        return int(x), int(y)
+
+
+class CompositorFundo:
+    """Achata as partes estáticas do tabuleiro numa única imagem do tamanho da janela.
+
+    Em vez de um item do canvas por capa de baralho e por sombra de painel,
+    o canvas recebe uma só imagem de fundo. A chave identifica o resultado
+    (tamanho, cor e camadas), para reaproveitá-lo no cache de sprites.
+    """
+
+    def __init__(self, largura: int, altura: int, cor: str):
+        self.largura = largura
+        self.altura = altura
+        self.cor = cor
+        self.camadas: List[CamadaFundo] = []
+
+    def adicionar(self, nome: str, x: int, y: int, carregar: Callable[[], Image.Image], anchor: str = "nw"):
+        if anchor not in ANCORAS:
+            raise ValueError(f"Âncora não suportada no fundo: {anchor}")
+        self.camadas.append(CamadaFundo(nome, x, y, anchor, carregar))
+
+    def chave(self) -> tuple:
+        return ("fundo", self.largura, self.altura, self.cor,
+                tuple((camada.nome, camada.x, camada.y, camada.anchor) for camada in self.camadas))
+
+    def compor(self) -> Image.Image:
+        """Desenha a cor de fundo e as camadas, na ordem em que foram adicionadas"""
+        fundo = Image.new("RGBA", (self.largura, self.altura), ImageColor.getrgb(self.cor) + (255,))
+        for camada in self.camadas:
+            try:
+                img = camada.carregar().convert("RGBA")
+            except Exception as e:
+                print(f"Erro ao compor a camada de fundo {camada.nome}: {e}")
+                continue
+            x, y = camada.origem(img)
+            # Recorta o que ficaria fora da janela (alpha_composite não aceita destino negativo)
+            recorte = img.crop((max(-x, 0), max(-y, 0), min(img.width, self.largura - x), min(img.height, self.altura - y)))
+            if recorte.width > 0 and recorte.height > 0:
+                fundo.alpha_composite(recorte, (max(x, 0), max(y, 0)))
+        return fundo
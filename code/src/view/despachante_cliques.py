@@ -0,0 +1,112 @@
+from typing import Callable, Dict, Optional
+
+CURSOR_CLICAVEL = "hand2"
+CURSOR_PADRAO = "arrow"
+
+
+class RegiaoClicavel:
+    """Entrada da tabela de hit-test: tratadores de um slot da cena e se ele aceita cliques"""
+    __slots__ = ("tag", "clique", "entrar", "sair", "habilitada")
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        self.clique: Optional[Callable[[], None]] = None
+        self.entrar: Optional[Callable[[], None]] = None
+        self.sair: Optional[Callable[[], None]] = None
+        self.habilitada = False
+
+
+class DespachanteCliques:
+    """Único tratador de eventos do mouse do canvas do jogo.
+
+    Em vez de um tag_bind por item, o canvas tem só binds de clique, movimento
+    e saída. A cada evento o item sob o cursor é encontrado e a tabela de regiões
+    diz o que fazer. Habilitar ou desabilitar uma região apenas troca um flag.
+    As regiões desabilitadas continuam recebendo entrar/sair (efeitos de hover),
+    mas não cliques nem o cursor de mão.
+    """
+
+    def __init__(self, canvas, cena):
+        self.canvas = canvas
+        self.cena = cena
+        self._regioes: Dict[str, RegiaoClicavel] = {}
+        self._sob_cursor: Optional[RegiaoClicavel] = None
+        self.cliques = 0
+        self.cliques_ignorados = 0
+
+        canvas.bind("<Button-1>", self._clique)
+        canvas.bind("<Motion>", self._movimento)
+        canvas.bind("<Leave>", self._saiuDoCanvas)
+
+    def registrar(self, tag: str, clique: Callable[[], None] = None,
+                  entrar: Callable[[], None] = None, sair: Callable[[], None] = None) -> RegiaoClicavel:
+        """Define os tratadores do slot (sem mudar se ele está habilitado)"""
+        regiao = self._regioes.get(tag)
+        if regiao is None:
+            regiao = self._regioes[tag] = RegiaoClicavel(tag)
+        regiao.clique = clique
+        regiao.entrar = entrar
+        regiao.sair = sair
+        return regiao
+
+    def habilitar(self, tag: str, habilitada: bool = True):
+        regiao = self._regioes.get(tag)
+        if regiao is None:
+            regiao = self._regioes[tag] = RegiaoClicavel(tag)
+        if regiao.habilitada != habilitada:
+            regiao.habilitada = habilitada
+            if regiao is self._sob_cursor:
+                self._atualizarCursor()
+
+    def desabilitar(self, tag: str):
+        self.habilitar(tag, False)
+
+    def habilitada(self, tag: str) -> bool:
+        regiao = self._regioes.get(tag)
+        return regiao is not None and regiao.habilitada
+
+    def regiaoEm(self, x: float, y: float) -> Optional[RegiaoClicavel]:
+        """Hit-test: a região do item visível mais acima no ponto (x, y)"""
+        for id_item in reversed(self.canvas.find_overlapping(x, y, x, y)):
+            tag = self.cena.tagDoItem(id_item)
+            if tag is None:
+                # Item fora da cena (notificação, overlay de métricas): o clique passa para o que está embaixo
+                continue
+            if not self.cena.visivel(tag):
+                continue
+            regiao = self._regioes.get(tag)
+            if regiao is not None:
+                return regiao
+        return None
+
+    def _clique(self, evento):
+        regiao = self.regiaoEm(self.canvas.canvasx(evento.x), self.canvas.canvasy(evento.y))
+        if regiao is None or regiao.clique is None:
+            return
+        if not regiao.habilitada:
+            self.cliques_ignorados += 1
+            return
+        self.cliques += 1
+        regiao.clique()
+
+    def _movimento(self, evento):
+        regiao = self.regiaoEm(self.canvas.canvasx(evento.x), self.canvas.canvasy(evento.y))
+        if regiao is self._sob_cursor:
+            return
+        anterior, self._sob_cursor = self._sob_cursor, regiao
+        if anterior is not None and anterior.sair is not None:
+            anterior.sair()
+        if regiao is not None and regiao.entrar is not None:
+            regiao.entrar()
+        self._atualizarCursor()
+
+    def _saiuDoCanvas(self, evento):
+        anterior, self._sob_cursor = self._sob_cursor, None
+        if anterior is not None and anterior.sair is not None:
+            anterior.sair()
+        self._atualizarCursor()
+
+    def _atualizarCursor(self):
+        regiao = self._sob_cursor
+        clicavel = regiao is not None and regiao.habilitada and regiao.clique is not None
+        self.canvas.configure(cursor=CURSOR_CLICAVEL if clicavel else CURSOR_PADRAO)
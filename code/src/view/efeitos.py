@@ -0,0 +1,45 @@
+from typing import Tuple
+
+from PIL import Image, ImageDraw
+
+# Cor e largura da borda das pedras selecionadas
+COR_SELECAO = (255, 215, 0, 255)
+LARGURA_SELECAO = 3
+
+
+def _tabela(fator: float):
+    """Tabela de consulta de 256 posições que multiplica cada valor pelo fator (limitado a 255)"""
+    return [min(255, int(valor * fator)) for valor in range(256)]
+
+
+def _multiplicarCores(img: Image.Image, fator: float) -> Image.Image:
+    """Multiplica os canais RGB pelo fator preservando o alfa, banda a banda"""
+    img = img.convert("RGBA")
+    r, g, b, a = img.split()
+    tabela = _tabela(fator)
+    return Image.merge("RGBA", (r.point(tabela), g.point(tabela), b.point(tabela), a))
+
+
+def escurecer(img: Image.Image, fator: float = 0.7) -> Image.Image:
+    """Efeito de clique: escurece a imagem (equivale a multiplicar RGB por 0.7)"""
+    return _multiplicarCores(img, fator)
+
+
+def clarear(img: Image.Image, fator: float = 1.3) -> Image.Image:
+    """Aumenta o brilho da imagem em 30%, saturando em 255"""
+    return _multiplicarCores(img, fator)
+
+
+def transparencia(img: Image.Image, fator: float = 0.5) -> Image.Image:
+    """Multiplica o canal alfa pelo fator (50% de opacidade por padrão)"""
+    img = img.convert("RGBA")
+    img.putalpha(img.getchannel("A").point(_tabela(fator)))
+    return img
+
+
+def selecionar(img: Image.Image, cor: Tuple[int, int, int, int] = COR_SELECAO, largura: int = LARGURA_SELECAO) -> Image.Image:
+    """Efeito de seleção das pedras: clareia e adiciona uma borda dourada"""
+    img = clarear(img)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, img.width - 1, img.height - 1], outline=cor, width=largura)
+    return img
@@ -0,0 +1,77 @@
+from tkinter import Tk, Toplevel
+from typing import Callable, Dict, Optional
+
+
+def widgetRaiz(tela):
+    """Widget que contém toda a tela (o frame principal, ou o canvas no caso da tela do jogo)"""
+    return getattr(tela, "frame", None) or tela.canvas
+
+
+class GerenciadorTelas:
+    """Alterna entre as telas escondendo e reexibindo seus widgets em vez de destruí-los.
+
+    Cada tela é criada uma única vez e mantida (com seu canvas, imagens e
+    estado) até ser descartada explicitamente.
+    """
+
+    def __init__(self, root: Tk):
+        self.root = root
+        self._telas: Dict[str, object] = {}
+        self._geometrias: Dict[str, Optional[str]] = {}
+        self.atual: Optional[str] = None
+
+    def pegar(self, nome: str):
+        """Retorna a tela registrada com esse nome, ou None"""
+        return self._telas.get(nome)
+
+    def mostrar(self, nome: str, criar: Callable[[], object], geometria: Optional[str] = None):
+        """Exibe a tela, criando-a apenas se ainda não existir"""
+        tela = self._telas.get(nome)
+        if tela is None:
+            self.esconderAtual()
+            # O construtor das telas já empacota seus widgets na janela
+            tela = criar()
+            self._telas[nome] = tela
+            self._geometrias[nome] = geometria
+            self.atual = nome
+            return tela
+
+        if self.atual != nome:
+            self.esconderAtual()
+            widgetRaiz(tela).pack(expand=True, fill='both')
+            self.atual = nome
+        if self._geometrias.get(nome):
+            self.root.geometry(self._geometrias[nome])
+        return tela
+
+    def esconderAtual(self):
+        """Esconde a tela exibida no momento, sem destruí-la"""
+        if self.atual is not None and self.atual in self._telas:
+            widgetRaiz(self._telas[self.atual]).pack_forget()
+        self.atual = None
+
+    def descartar(self, nome: str):
+        """Destrói a tela e libera seus recursos"""
+        tela = self._telas.pop(nome, None)
+        self._geometrias.pop(nome, None)
+        if tela is None:
+            return
+        if self.atual == nome:
+            self.atual = None
+        # A tela pode ter registros em objetos da sessão (ex.: observadores) a desfazer antes
+        liberar = getattr(tela, "liberar", None)
+        if callable(liberar):
+            try:
+                liberar()
+            except Exception as e:
+                print(f"Erro ao liberar tela {nome}: {e}")
+        try:
+            widgetRaiz(tela).destroy()
+        except Exception as e:
+            print(f"Erro ao descartar tela {nome}: {e}")
+
+    def fecharJanelas(self):
+        """Fecha as janelas auxiliares (popups) abertas sobre a janela principal"""
+        for widget in self.root.winfo_children():
+            if isinstance(widget, Toplevel):
+                widget.destroy()
@@ -0,0 +1,191 @@
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Deque, Dict, List, Optional
+
+# Quantas medições recentes de cada fase entram no cálculo dos percentis
+JANELA_AMOSTRAS = 120
+
+# Fases que correspondem a um redesenho inteiro (as demais são partes dele)
+FASES_QUADRO = ("quadro", "quadro_parcial")
+
+# A cada quantos redesenhos a saída de log imprime o resumo
+INTERVALO_LOG = 50
+
+# Liga a saída de log desde o início (útil em builds de produção)
+VARIAVEL_LOG = "SPLENDOR_METRICAS"
+
+
+class EstatisticaRolante:
+    """Guarda as últimas medições de uma fase (em ms) e calcula percentis sobre elas"""
+
+    def __init__(self, janela: int = JANELA_AMOSTRAS):
+        self.amostras: Deque[float] = deque(maxlen=janela)
+        self.total = 0
+        self.ultimo = 0.0
+
+    def registrar(self, ms: float):
+        self.amostras.append(ms)
+        self.total += 1
+        self.ultimo = ms
+
+    def percentil(self, p: float) -> float:
+        if not self.amostras:
+            return 0.0
+        ordenadas = sorted(self.amostras)
+        indice = min(len(ordenadas) - 1, int(round(p / 100 * (len(ordenadas) - 1))))
+        return ordenadas[indice]
+
+    def resumo(self) -> Dict[str, float]:
+        return {"n": self.total, "ultimo": self.ultimo, "p50": self.percentil(50), "p95": self.percentil(95)}
+
+
+class Instrumentacao:
+    """Tempos por fase dos redesenhos do jogo e das falhas do cache de sprites.
+
+    Cada fase mantém uma janela rolante de medições com p50/p95. Ao fim de
+    cada redesenho completo ou parcial, os observadores (overlay, log) são avisados.
+    """
+
+    def __init__(self, janela: int = JANELA_AMOSTRAS):
+        self.janela = janela
+        self.fases: Dict[str, EstatisticaRolante] = {}
+        self.observadores: List[Callable[["Instrumentacao"], None]] = []
+        self.quadros = 0
+
+    def registrar(self, fase: str, ms: float):
+        estatistica = self.fases.get(fase)
+        if estatistica is None:
+            estatistica = self.fases[fase] = EstatisticaRolante(self.janela)
+        estatistica.registrar(ms)
+        if fase in FASES_QUADRO:
+            self.quadros += 1
+            for observador in self.observadores:
+                observador(self)
+
+    @contextmanager
+    def medir(self, fase: str):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(fase, (time.perf_counter() - inicio) * 1000)
+
+    def registrarFalhaCache(self, variante: str, segundos: float):
+        """Observador do cache de sprites: cada sprite construído vira uma medição da fase cache:<variante>"""
+        self.registrar(f"cache:{variante}", segundos * 1000)
+
+    def resumo(self) -> Dict[str, Dict[str, float]]:
+        return {fase: estatistica.resumo() for fase, estatistica in self.fases.items()}
+
+    def linhas(self) -> List[str]:
+        """Resumo legível, uma fase por linha (redesenhos primeiro, depois fases e cache)"""
+        def ordem(fase):
+            return (fase not in FASES_QUADRO, fase.startswith("cache:"), fase)
+
+        linhas = []
+        for fase in sorted(self.fases, key=ordem):
+            r = self.fases[fase].resumo()
+            linhas.append(f"{fase:<28} n={r['n']:<5} p50={r['p50']:6.2f}ms p95={r['p95']:6.2f}ms")
+        return linhas
+
+
+def medirFase(fase: str):
+    """Decorador para métodos de desenho: mede o tempo da chamada em `self.instrumentacao`"""
+    def decorador(metodo):
+        @wraps(metodo)
+        def envolvido(self, *args, **kwargs):
+            with self.instrumentacao.medir(fase):
+                return metodo(self, *args, **kwargs)
+        return envolvido
+    return decorador
+
+
+class OverlayMetricas:
+    """Texto sobre o canvas do jogo com os percentis de cada fase (liga/desliga com F3)"""
+
+    def __init__(self, canvas, instrumentacao: Instrumentacao):
+        self.canvas = canvas
+        self.instrumentacao = instrumentacao
+        self.visivel = False
+        self._fundo = None
+        self._texto = None
+        instrumentacao.observadores.append(self.atualizar)
+
+    def alternar(self, evento=None):
+        self.visivel = not self.visivel
+        if self.visivel:
+            self.atualizar(self.instrumentacao)
+        else:
+            self.remover()
+
+    def atualizar(self, instrumentacao: Instrumentacao):
+        if not self.visivel:
+            return
+        if not self.canvas.winfo_exists():
+            self.desanexar()
+            return
+        conteudo = "\n".join(instrumentacao.linhas()) or "sem medições"
+        if self._texto is None:
+            self._fundo = self.canvas.create_rectangle(0, 0, 0, 0, fill="black", outline="#d4af37", tags="overlay_metricas")
+            self._texto = self.canvas.create_text(
+                int(self.canvas.cget("width")) - 10, int(self.canvas.cget("height")) - 10,
+                anchor="se", fill="#7CFC00", font=("Courier", 9), tags="overlay_metricas"
+            )
+        self.canvas.itemconfigure(self._texto, text=conteudo)
+        x0, y0, x1, y1 = self.canvas.bbox(self._texto)
+        self.canvas.coords(self._fundo, x0 - 6, y0 - 6, x1 + 6, y1 + 6)
+        self.canvas.tag_raise(self._fundo)
+        self.canvas.tag_raise(self._texto)
+
+    def remover(self):
+        if self._texto is not None and self.canvas.winfo_exists():
+            self.canvas.delete("overlay_metricas")
+        self._fundo = None
+        self._texto = None
+
+    def desanexar(self):
+        """Deixa de acompanhar a instrumentação (quando a tela do jogo é descartada)"""
+        self.remover()
+        if self.atualizar in self.instrumentacao.observadores:
+            self.instrumentacao.observadores.remove(self.atualizar)
+
+
+class SaidaLog:
+    """Imprime o resumo das fases a cada `intervalo` redesenhos (liga/desliga com F4)"""
+
+    def __init__(self, instrumentacao: Instrumentacao, intervalo: int = INTERVALO_LOG,
+                 ativa: bool = os.environ.get(VARIAVEL_LOG, "") not in ("", "0")):
+        self.intervalo = intervalo
+        self.ativa = ativa
+        instrumentacao.observadores.append(self.quadroConcluido)
+
+    def alternar(self, evento=None):
+        self.ativa = not self.ativa
+        print(f"Log de métricas de desenho {'ligado' if self.ativa else 'desligado'}")
+
+    def quadroConcluido(self, instrumentacao: Instrumentacao):
+        if self.ativa and instrumentacao.quadros % self.intervalo == 0:
+            print(f"Métricas de desenho após {instrumentacao.quadros} redesenhos:")
+            for linha in instrumentacao.linhas():
+                print(f"  {linha}")
+
+
+_instrumentacao: Optional[Instrumentacao] = None
+_saida_log: Optional[SaidaLog] = None
+
+
+def pegarInstrumentacao() -> Instrumentacao:
+    """Retorna a instrumentação da sessão (com a saída de log já registrada), criando-a na primeira chamada"""
+    global _instrumentacao, _saida_log
+    if _instrumentacao is None:
+        _instrumentacao = Instrumentacao()
+        _saida_log = SaidaLog(_instrumentacao)
+    return _instrumentacao
+
+
+def pegarSaidaLog() -> SaidaLog:
+    pegarInstrumentacao()
+    return _saida_log
@@ -0,0 +1,162 @@
+from collections import deque
+from typing import Deque, List, Optional
+
+# Tempo que cada notificação fica na tela e quantas aparecem ao mesmo tempo
+DURACAO_PADRAO_MS = 3000
+DURACAO_LONGA_MS = 6000
+MAX_VISIVEIS = 3
+
+# Aparência das notificações, por tipo
+CORES = {
+    "info": ("#2b1a0e", "#d4af37"),
+    "aviso": ("#3a2a05", "#ffd700"),
+    "erro": ("#3a0e0e", "#ff6b6b"),
+}
+LARGURA_TEXTO = 420
+MARGEM = 12
+ESPACO = 8
+# Topo da pilha: a faixa livre acima das cartas do nível 1 (que começam em y=110)
+TOPO = 12
+
+
+class Notificacao:
+    """Mensagem na fila de notificações e, enquanto visível, os itens que a desenham"""
+    __slots__ = ("titulo", "mensagem", "tipo", "duracao_ms", "itens", "expiracao")
+
+    def __init__(self, titulo: str, mensagem: str, tipo: str, duracao_ms: int):
+        self.titulo = titulo
+        self.mensagem = mensagem
+        self.tipo = tipo
+        self.duracao_ms = duracao_ms
+        self.itens: List[int] = []
+        self.expiracao = None
+
+    def texto(self) -> str:
+        return f"{self.titulo}\n{self.mensagem}" if self.titulo else self.mensagem
+
+
+class CentralNotificacoes:
+    """Notificações não modais ("toasts") desenhadas sobre o canvas do jogo.
+
+    Ao contrário do messagebox, notificar não bloqueia o loop do Tk: a
+    mensagem entra numa fila, aparece no topo da tela e some sozinha depois
+    de alguns segundos (ou ao ser clicada). Sem canvas anexado, as
+    mensagens vão apenas para o terminal.
+    """
+
+    def __init__(self, max_visiveis: int = MAX_VISIVEIS):
+        self.max_visiveis = max_visiveis
+        self.root = None
+        self.canvas = None
+        self._fila: Deque[Notificacao] = deque()
+        self._visiveis: List[Notificacao] = []
+        self.exibidas = 0
+
+    def anexar(self, root, canvas):
+        """Passa a desenhar as notificações no canvas dado (o da partida atual)"""
+        self.limpar()
+        self.root = root
+        self.canvas = canvas
+        # Um só bind para todas as notificações: clicar numa delas a fecha
+        canvas.tag_bind("notificacao", "<Button-1>", self._clique)
+
+    def notificar(self, mensagem: str, titulo: str = "", tipo: str = "info", duracao_ms: int = DURACAO_PADRAO_MS):
+        """Enfileira uma notificação e retorna imediatamente"""
+        print(f"[{tipo}] {titulo + ': ' if titulo else ''}{mensagem}")
+        if not self._canvasDisponivel():
+            return
+        self._fila.append(Notificacao(titulo, mensagem, tipo, duracao_ms))
+        self._exibirProximas()
+
+    def info(self, titulo: str, mensagem: str, duracao_ms: int = DURACAO_PADRAO_MS):
+        self.notificar(mensagem, titulo, "info", duracao_ms)
+
+    def aviso(self, titulo: str, mensagem: str, duracao_ms: int = DURACAO_PADRAO_MS):
+        self.notificar(mensagem, titulo, "aviso", duracao_ms)
+
+    def erro(self, titulo: str, mensagem: str, duracao_ms: int = DURACAO_PADRAO_MS):
+        self.notificar(mensagem, titulo, "erro", duracao_ms)
+
+    def pendentes(self) -> int:
+        return len(self._fila)
+
+    def limpar(self):
+        """Remove as notificações visíveis e descarta a fila"""
+        for notificacao in list(self._visiveis):
+            self._remover(notificacao)
+        self._fila.clear()
+
+    def _canvasDisponivel(self) -> bool:
+        try:
+            return self.canvas is not None and bool(self.canvas.winfo_exists())
+        except Exception:
+            return False
+
+    def _exibirProximas(self):
+        while self._fila and len(self._visiveis) < self.max_visiveis:
+            self._exibir(self._fila.popleft())
+        self._posicionar()
+
+    def _exibir(self, notificacao: Notificacao):
+        fundo, destaque = CORES.get(notificacao.tipo, CORES["info"])
+        texto = self.canvas.create_text(
+            0, 0, text=notificacao.texto(), fill="white", width=LARGURA_TEXTO,
+            font=("Arial", 12, "bold"), justify="center", anchor="n", tags="notificacao"
+        )
+        caixa = self.canvas.create_rectangle(0, 0, 0, 0, fill=fundo, outline=destaque, width=2, tags="notificacao")
+        self.canvas.tag_lower(caixa, texto)
+        notificacao.itens = [caixa, texto]
+        notificacao.expiracao = self.root.after(notificacao.duracao_ms, lambda n=notificacao: self._expirar(n))
+        self._visiveis.append(notificacao)
+        self.exibidas += 1
+
+    def _posicionar(self):
+        """Empilha as notificações visíveis no topo, centralizadas"""
+        if not self._visiveis or not self._canvasDisponivel():
+            return
+        centro = int(self.canvas.cget("width")) // 2
+        y = TOPO
+        for notificacao in self._visiveis:
+            caixa, texto = notificacao.itens
+            self.canvas.coords(texto, centro, y + MARGEM)
+            x0, y0, x1, y1 = self.canvas.bbox(texto)
+            self.canvas.coords(caixa, x0 - MARGEM, y, x1 + MARGEM, y1 + MARGEM)
+            self.canvas.tag_raise(caixa)
+            self.canvas.tag_raise(texto)
+            y = y1 + MARGEM + ESPACO
+
+    def _clique(self, evento):
+        atual = self.canvas.find_withtag("current")
+        for notificacao in self._visiveis:
+            if atual and atual[0] in notificacao.itens:
+                self._expirar(notificacao)
+                return
+
+    def _expirar(self, notificacao: Notificacao):
+        if notificacao not in self._visiveis:
+            return
+        self._remover(notificacao)
+        if self._canvasDisponivel():
+            self._exibirProximas()
+
+    def _remover(self, notificacao: Notificacao):
+        self._visiveis.remove(notificacao)
+        if notificacao.expiracao is not None and self.root is not None:
+            try:
+                self.root.after_cancel(notificacao.expiracao)
+            except Exception:
+                pass
+        if self._canvasDisponivel():
+            for item in notificacao.itens:
+                self.canvas.delete(item)
+
+
+_central: Optional[CentralNotificacoes] = None
+
+
+def pegarNotificacoes() -> CentralNotificacoes:
+    """Retorna a central de notificações da sessão, criando-a na primeira chamada"""
+    global _central
+    if _central is None:
+        _central = CentralNotificacoes()
+    return _central
@@ -0,0 +1,192 @@
+import hashlib
+import json
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from PIL import Image
+
+from view.carregador_assets import decodificarEmParalelo
+
+# Diretório onde o pacote pré-processado é gravado (ignorado pelo git)
+DIRETORIO_PACOTE = Path("./resources/cache")
+
+# Versão do formato do arquivo; mudar invalida pacotes antigos
+VERSAO_PACOTE = 1
+
+# Cabeçalho: assinatura + tamanho do JSON de índice, seguido dos pixels crus de cada sprite
+ASSINATURA = b"SPLDPACK"
+FORMATO_CABECALHO = ">8sI"
+
+Especificacao = Tuple[Path, Tuple[int, int]]
+
+
+def hashArquivo(caminho: Path) -> str:
+    """Calcula o hash do conteúdo de um arquivo fonte"""
+    return hashlib.sha1(caminho.read_bytes()).hexdigest()
+
+
+def hashLayout(layout: dict) -> str:
+    """Identifica um conjunto de constantes de layout por um hash curto"""
+    return hashlib.sha1(json.dumps(layout, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def chaveSprite(caminho, tamanho) -> str:
+    """Chave de um sprite no pacote: arquivo fonte + tamanho final"""
+    return f"{Path(caminho).as_posix()}@{tamanho[0]}x{tamanho[1]}"
+
+
+class PacoteAssets:
+    """Pacote único com os sprites já redimensionados para os tamanhos usados no canvas.
+
+    O pacote é identificado pelas constantes de layout que definem os tamanhos e
+    é invalidado quando o conteúdo de algum arquivo fonte muda (o mtime é usado
+    como atalho para evitar recalcular hashes de arquivos intocados).
+    """
+
+    def __init__(self, especificacoes: List[Especificacao], layout: dict, diretorio: Path = DIRETORIO_PACOTE):
+        self.especificacoes = [(Path(caminho), tuple(tamanho)) for caminho, tamanho in especificacoes]
+        self.layout = layout
+        self.caminho = diretorio / f"assets-{hashLayout(layout)}.pack"
+        self._imagens: Dict[str, Image.Image] = {}
+
+    def fontes(self) -> List[Path]:
+        """Arquivos fonte distintos usados pelo pacote"""
+        return sorted({caminho for caminho, _ in self.especificacoes})
+
+    def carregar(self) -> bool:
+        """Lê o pacote do disco. Retorna False se ele não existir ou estiver desatualizado"""
+        try:
+            with open(self.caminho, "rb") as arquivo:
+                assinatura, tamanho_indice = struct.unpack(FORMATO_CABECALHO, arquivo.read(struct.calcsize(FORMATO_CABECALHO)))
+                if assinatura != ASSINATURA:
+                    return False
+                indice = json.loads(arquivo.read(tamanho_indice).decode("utf-8"))
+                dados = arquivo.read()
+        except (OSError, struct.error, ValueError):
+            return False
+
+        if indice.get("versao") != VERSAO_PACOTE or indice.get("layout") != self.layout:
+            return False
+        if not self._fontesAtualizadas(indice.get("fontes", {})):
+            return False
+
+        imagens = {}
+        for chave, (modo, largura, altura, inicio, fim) in indice["sprites"].items():
+            imagens[chave] = Image.frombytes(modo, (largura, altura), dados[inicio:fim])
+        self._imagens = imagens
+        return True
+
+    def _fontesAtualizadas(self, fontes_gravadas: dict) -> bool:
+        """Confere se os arquivos fonte ainda são os mesmos usados para gerar o pacote"""
+        for caminho in self.fontes():
+            gravado = fontes_gravadas.get(caminho.as_posix())
+            if gravado is None:
+                return False
+            try:
+                stat = caminho.stat()
+            except OSError:
+                return False
+            if stat.st_mtime_ns == gravado["mtime"] and stat.st_size == gravado["tamanho"]:
+                continue
+            # mtime diferente: só invalida se o conteúdo realmente mudou
+            if hashArquivo(caminho) != gravado["hash"]:
+                return False
+        return True
+
+    def construir(self):
+        """Decodifica e redimensiona todos os sprites e grava o pacote em disco"""
+        imagens = {}
+        # Decodifica em paralelo, mas grava na ordem das especificações para o arquivo ser determinístico
+        processadas = dict(decodificarEmParalelo(self.especificacoes, self.processar))
+        for caminho, tamanho in self.especificacoes:
+            img = processadas.get((caminho, tamanho))
+            if img is not None:
+                imagens[chaveSprite(caminho, tamanho)] = img
+
+        fontes = {}
+        for caminho in self.fontes():
+            if caminho.exists():
+                stat = caminho.stat()
+                fontes[caminho.as_posix()] = {"mtime": stat.st_mtime_ns, "tamanho": stat.st_size, "hash": hashArquivo(caminho)}
+
+        sprites = {}
+        blocos = []
+        posicao = 0
+        for chave, img in imagens.items():
+            bruto = img.tobytes()
+            sprites[chave] = (img.mode, img.width, img.height, posicao, posicao + len(bruto))
+            blocos.append(bruto)
+            posicao += len(bruto)
+
+        indice = json.dumps({
+            "versao": VERSAO_PACOTE,
+            "layout": self.layout,
+            "fontes": fontes,
+            "sprites": sprites,
+        }).encode("utf-8")
+
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        temporario = self.caminho.with_suffix(".tmp")
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(struct.pack(FORMATO_CABECALHO, ASSINATURA, len(indice)))
+            arquivo.write(indice)
+            for bloco in blocos:
+                arquivo.write(bloco)
+        temporario.replace(self.caminho)
+        self._imagens = imagens
+
+    def carregarOuConstruir(self):
+        """Usa o pacote do disco se estiver válido, senão o reconstrói"""
+        if not self.carregar():
+            print(f"Gerando pacote de assets em {self.caminho}")
+            try:
+                self.construir()
+            except OSError as e:
+                print(f"Erro ao gravar pacote de assets: {e}")
+
+    @staticmethod
+    def processar(caminho: Path, tamanho: Tuple[int, int]) -> Image.Image:
+        """Decodifica e redimensiona um sprite a partir do arquivo fonte"""
+        img = Image.open(caminho)
+        img = img.resize(tamanho, Image.Resampling.LANCZOS)
+        if img.mode not in ("RGB", "RGBA", "L", "LA"):
+            img = img.convert("RGBA")
+        return img
+
+    def pegar(self, caminho, tamanho) -> Image.Image:
+        """Retorna o sprite pré-processado, ou decodifica o arquivo se ele não estiver no pacote"""
+        img = self._imagens.get(chaveSprite(caminho, tamanho))
+        if img is None:
+            img = self.processar(Path(caminho), tuple(tamanho))
+        return img
+
+    def __len__(self):
+        return len(self._imagens)
+
+
+_pacotes: Dict[str, PacoteAssets] = {}
+# O pacote pode ser pedido ao mesmo tempo pelo pré-aquecimento e pela tela do jogo
+_trava_pacotes = threading.Lock()
+
+
+def pegarPacoteAssets(especificacoes: List[Especificacao], layout: dict) -> PacoteAssets:
+    """Retorna o pacote do layout pedido, lendo (ou gerando) o arquivo na primeira chamada"""
+    chave = hashLayout(layout)
+    with _trava_pacotes:
+        pacote = _pacotes.get(chave)
+        if pacote is None:
+            pacote = PacoteAssets(especificacoes, layout)
+            pacote.carregarOuConstruir()
+            _pacotes[chave] = pacote
+    return pacote
+
+
+if __name__ == "__main__":
+    # Etapa de build: python -m view.pacote_assets (executar dentro de src)
+    from view.tela_jogo import TelaJogo
+
+    pacote = PacoteAssets(TelaJogo.especificacoesAssets(), TelaJogo.layoutAssets())
+    pacote.construir()
+    print(f"Pacote gerado em {pacote.caminho} com {len(pacote)} sprites")
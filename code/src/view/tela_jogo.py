@@ -10,52 +10,100 @@ from model.tabuleiro import Tabuleiro
 from model.jogador import Jogador
 from model.enums.niveisEnum import NiveisEnum
 from model.enums.pedrasEnum import PedrasEnum
-from model.carta import Carta
+from model.carta import Carta, PrototipoCarta
+from model.diff_tabuleiro import DiffTabuleiro, FotoTabuleiro, compararTabuleiros
+from model.manifesto_cartas import DIRETORIOS_CATALOGO, DIRETORIOS_NIVEIS, DIRETORIO_ROUBO
+from view.catalogo_cartas import pegarCatalogoCartas
+from view.cache_sprites import chaveArquivo, pegarCacheSprites
+from view.carregador_assets import CarregadorAssets, iniciarPreaquecimento, pegarPreaquecimento
+from view.pacote_assets import pegarPacoteAssets
+from view.cena_canvas import CenaCanvas
+from view.backend_render import BackendTk
+from view.compositor_fundo import CompositorFundo
+from view.cache_rotulos import FONTE_NOME, FONTE_NOME_TURNO, FONTE_PONTOS, FONTE_QTD_MINI, FONTE_QTD_PEDRA, CacheRotulos
+from view.agendador_redesenho import AgendadorRedesenho, aposRedesenho
+from view.despachante_cliques import DespachanteCliques
+from view.notificacoes import DURACAO_LONGA_MS, pegarNotificacoes
+from view.instrumentacao import OverlayMetricas, medirFase, pegarInstrumentacao, pegarSaidaLog
 
 # Variável global para o valor mínimo de pontos para vitória
 PONTOS_MINIMOS_VITORIA = 15
 
 class TelaJogo:
-    def __init__(self, root: Tk, show_screen, jogador_local: Jogador, jogador_remoto: Jogador, finalizar_jogada_callback, seed_partida=None):
+    # Window dimensions
+    WINDOW_WIDTH = 1280
+    WINDOW_HEIGHT = 720
+    COR_FUNDO = '#352314'
+
+    # Card and spacing dimensions
+    CARD_WIDTH = 10
+    CARD_HEIGHT = 15
+    HORIZONTAL_GAP = 100
+    DECK_TO_CARDS_GAP = 30
+    VERTICAL_GAP = 150
+
+    # Calculate positions
+    START_X = 450
+    START_Y = 110
+
+    GEMS_X = START_X + ((CARD_WIDTH * 4) + (HORIZONTAL_GAP * 3)) + CARD_WIDTH + DECK_TO_CARDS_GAP + 130
+    GEM_SIZE = 60
+    MINI_GEM_SIZE = 32
+    BUTTONS_X = GEMS_X
+
+    # Button sizes (os demais botões usam o tamanho padrão)
+    BUTTON_SIZE = (150, 100)
+    BUTTON_SIZES = {
+        "desfazer_jogada": (150, 80),
+        "finalizar_jogada": (180, 90),  # Diminuído height de 100 para 90
+        "settings": (60, 60),  # Tamanho menor
+    }
+    # Menu de configurações: sair como "finalizar jogada", regras e créditos como "desfazer jogada"
+    BUTTON_SIZES["sair"] = BUTTON_SIZES["finalizar_jogada"]
+    BUTTON_SIZES["regras"] = BUTTON_SIZES["creditos"] = BUTTON_SIZES["desfazer_jogada"]
+
+    # Player info
+    PLAYER_INFO_WIDTH = 250
+    PLAYER_INFO_HEIGHT = 150  # Aumentado de 120 para 150
+    PLAYER_INFO_X = 0
+
+    def __init__(self, root: Tk, show_screen, jogador_local: Jogador, jogador_remoto: Jogador, finalizar_jogada_callback, seed_partida=None, backend=None):
         self.root = root
         self.show_screen = show_screen
-        
-        # Window dimensions
-        self.WINDOW_WIDTH = 1280
-        self.WINDOW_HEIGHT = 720
-
-        # Card and spacing dimensions
-        self.CARD_WIDTH = 10
-        self.CARD_HEIGHT = 15
-        self.HORIZONTAL_GAP = 100
-        self.DECK_TO_CARDS_GAP = 30
-        self.VERTICAL_GAP = 150
-
-        # Calculate positions
-        total_cards_width = (self.CARD_WIDTH * 4) + (self.HORIZONTAL_GAP * 3)
-        total_width_with_deck = total_cards_width + self.CARD_WIDTH + self.DECK_TO_CARDS_GAP
-        
-        self.START_X = 450
-        self.START_Y = 110
-        
-        self.GEMS_X = self.START_X + total_width_with_deck + 130
-        self.GEM_SIZE = 60
-        self.BUTTONS_X = self.GEMS_X
-        
-        # Player info
-        self.PLAYER_INFO_WIDTH = 250
-        self.PLAYER_INFO_X = 0
+        # Onde o desenho acontece: o Tk, ou um backend de gravação sem display (benchmarks)
+        self.backend = backend if backend is not None else BackendTk()
 
         # Create single canvas
-        self.canvas = Canvas(
+        self.canvas = self.backend.criarCanvas(
             root,
             width=self.WINDOW_WIDTH,
             height=self.WINDOW_HEIGHT,
-            bg='#352314',
+            bg=self.COR_FUNDO,
             highlightthickness=0
         )
         self.canvas.pack(expand=True, fill='both')
 
+        # Itens do canvas reaproveitados entre os redesenhos
+        self.cena = CenaCanvas(self.canvas)
+        # Um único tratador de cliques e movimento do mouse para todo o canvas
+        self.despachante = DespachanteCliques(self.canvas, self.cena)
+        # Textos dos painéis e contadores de pedras: só passam pela cena quando mudam
+        self.rotulos = CacheRotulos(self.cena)
+        # Mensagens do turno aparecem como notificações não modais sobre o canvas
+        self.notificacoes = pegarNotificacoes()
+        self.notificacoes.anexar(self.root, self.canvas)
+        # Estado que está desenhado na tela e custo (em operações no canvas) de cada jogada recebida
+        self.estado_desenhado = None
+        self.ultimo_diff = None
+        self.custos_jogadas: List[dict] = []
+        # Junta os pedidos de redesenho de uma mesma interação num único redesenho
+        self.agendador = AgendadorRedesenho(self.root, self.redesenharPendentes)
+        # Tempos de cada fase do desenho: F3 mostra o overlay, F4 liga o log no terminal
+        self.instrumentacao = pegarInstrumentacao()
+        self.overlay_metricas = OverlayMetricas(self.canvas, self.instrumentacao)
+        self.root.bind("<F3>", self.overlay_metricas.alternar)
+        self.root.bind("<F4>", pegarSaidaLog().alternar)
+
         # Usa o seed fornecido ou usa o fixo 12345
         if seed_partida is not None:
             self.seed_partida = seed_partida
@@ -86,10 +134,18 @@ class TelaJogo:
         self.pedras_habilitadas = False
         self.cartas_habilitadas = False
 
-        # Cache para efeitos visuais
-        self.efeitos_clique = {}
+        # Efeitos visuais
         self.pedras_selecionadas_visuais = set()
 
+        # Catálogo de artes das cartas (montado uma única vez) e cache de sprites da sessão
+        self.catalogo_cartas = pegarCatalogoCartas()
+        self.sprites = self.backend.cacheSprites()
+        self.sprites.observador_falhas = self.instrumentacao.registrarFalhaCache
+        self._pacote_assets = None
+
+        # Decodifica os sprites em paralelo antes de montar o tabuleiro
+        self.precarregarAssets()
+
         # Carrega os recursos
         self.carregarCartas()
         self.carregarPedras()
@@ -99,15 +155,6 @@ class TelaJogo:
         self.root.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
         self.canvas.configure(width=self.WINDOW_WIDTH, height=self.WINDOW_HEIGHT)
 
-        self.capas_baralho = {}
-        for nivel in [1, 2, 3]:
-            try:
-                img = Image.open(f"./resources/cartas/baralho/{nivel}.png").resize((self.CARD_WIDTH*10, self.CARD_HEIGHT*10), Image.Resampling.LANCZOS)
-                self.capas_baralho[nivel] = ImageTk.PhotoImage(img)
-            except Exception as e:
-                print(f"Erro ao carregar capa do baralho nível {nivel}: {e}")
-                self.capas_baralho[nivel] = None
-
         
         # Configurar layout imediatamente
         self.configurarTela()
@@ -121,6 +168,7 @@ class TelaJogo:
         else:
             self.desabilitarJogadas()
     
+    @aposRedesenho
     def habilitarJogadas(self):
         self.habilitarBotaoComprarPedras()
         self.habilitarBotaoComprarCarta()
@@ -129,6 +177,7 @@ class TelaJogo:
         self.habilitarPedras()
         self.desabilitarCartas()
     
+    @aposRedesenho
     def desabilitarJogadas(self):
         self.desabilitarBotaoComprarCarta()
         self.desabilitarBotaoComprarPedras()
@@ -138,10 +187,22 @@ class TelaJogo:
         self.desabilitarPedras()
             
 
+    def liberar(self):
+        """Chamado pelo GerenciadorTelas ao descartar a tela: solta o que é da sessão, não da partida"""
+        self.overlay_metricas.desanexar()
+        self.root.unbind("<F3>")
+
     def pegarTabuleiro(self) -> Tabuleiro:
         return self.tabuleiro
 
+    def receberTabuleiro(self, tabuleiro: Tabuleiro):
+        """Aplica o tabuleiro de uma jogada recebida pelo DOG e registra o custo do redesenho dela"""
+        self.cena.zerarContadores()
+        self.atualizarTabuleiro(tabuleiro)
+        self.agendador.depois(self.registrarCustoJogada)
+
     def atualizarTabuleiro(self, tabuleiro: Tabuleiro):
+        """Troca o tabuleiro exibido e agenda o redesenho do que mudou (jogadas locais e recebidas)"""
         # Salva o estado recebido como o estado inicial para desfazer jogada
         self.tabuleiro_inicio_partida = tabuleiro
         
@@ -155,11 +216,8 @@ class TelaJogo:
         # Recarrega os baralhos se estiverem vazios (caso de tabuleiro recebido do servidor)
         self.recarregarBaralhos()
         
-        # Recarrega as imagens das cartas para garantir que todas as cartas no tabuleiro
-        # tenham suas imagens carregadas corretamente
-        self.recarregarImagensCartas()
-        
-        self.desenharTabuleiro()
+        # Redesenha apenas o que mudou em relação ao que está na tela
+        self.agendarRedesenho("alteracoes")
         
         # Verifica se é o turno do jogador local
         if self.tabuleiro.pegarJogadorLocal().jogadorEmTurno:
@@ -194,68 +252,27 @@ class TelaJogo:
         rng = random.Random(seed + nivel.value)  # Usa seed + nível para variação
         
         # Define o diretório baseado no nível
-        if nivel == NiveisEnum.NIVEL1:
-            diretorio = Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-1")
-            roubo = False
-        elif nivel == NiveisEnum.NIVEL2:
-            diretorio = Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-2")
-            roubo = False
-        elif nivel == NiveisEnum.NIVEL3:
-            diretorio = Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-3")
-            roubo = False
-        else:
+        diretorio = DIRETORIOS_NIVEIS.get(nivel)
+        if diretorio is None:
             print(f"Nível inválido para recarregar baralho: {nivel}")
             return
         
-        # Carrega cartas únicas do diretório
-        cartas_unicas = []
-        # Ordena os arquivos para garantir consistência entre jogadores
-        arquivos_cartas = sorted(diretorio.glob("*.png"), key=lambda x: x.name)
-        
-        for carta_img in arquivos_cartas:
-            try:
-                img = Image.open(carta_img)
-                img = img.resize((self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), Image.Resampling.LANCZOS)
-                img_tk = ImageTk.PhotoImage(img)
-                id_base, pontos, pedras, cartaDeRoubo, bonus, habilitada = self.extrair_dados_carta(carta_img, nivel, roubo)
+        # Desenhos únicos do nível, lidos do manifesto (já ordenados) e compartilhados por todas as cópias
+        prototipos = [PrototipoCarta.daDefinicao(definicao) for definicao in self.catalogo_cartas.pegarDefinicoes(diretorio)]
                 
-                cartas_unicas.append({
-                    'img_tk': img_tk,
-                    'id_base': id_base,
-                    'pontos': pontos,
-                    'pedras': pedras.copy(),
-                    'cartaDeRoubo': cartaDeRoubo,
-                    'bonus': bonus,
-                    'habilitada': habilitada,
-                    'nivel': nivel
-                })
-            except Exception as e:
-                print(f"Erro ao carregar carta {carta_img}: {e}")
-                
-        # Cria 20 cartas para o baralho, reutilizando as cartas únicas
+        # Cria 20 cartas para o baralho, reutilizando os desenhos
         cartas_por_nivel = 20
         baralho = self.tabuleiro.baralhos[nivel.value - 1]
         
         for i in range(cartas_por_nivel):
-            # Seleciona uma carta única de forma cíclica
-            carta_unica = cartas_unicas[i % len(cartas_unicas)]
+            # Seleciona um desenho de forma cíclica
+            prototipo = prototipos[i % len(prototipos)]
             
             # Cria ID único para esta instância
-            id_carta = hash(f"{carta_unica['id_base']}_{nivel.value}_{i}")
+            id_carta = hash(f"{prototipo.definicao.nome}_{nivel.value}_{i}")
             
-            # Instancia a carta
-            self.tabuleiro.instanciarCartas(
-                id=id_carta,
-                pontos=carta_unica['pontos'],
-                nivel=carta_unica['nivel'],
-                pedras=carta_unica['pedras'],
-                cartaDeRoubo=False,
-                bonus=carta_unica['bonus'],
-                habilitada=carta_unica['habilitada']
-            )
-            
-            # Associa a imagem à carta
-            self.carta_imgs[id_carta] = carta_unica['img_tk']
+            # Instancia a cópia (só id e habilitação; custo e imagem ficam no protótipo)
+            self.tabuleiro.instanciarCartaDoPrototipo(id_carta, prototipo)
         
         # Embaralha o baralho com a mesma seed para garantir consistência
         if len(baralho.cartas) > 0:
@@ -263,27 +280,6 @@ class TelaJogo:
         else:
             print(f"ERRO: Baralho {nivel.name} ainda está vazio após recarregamento!")
 
-    def recarregarImagensCartas(self):
-        """Recarrega as imagens das cartas para todas as cartas no tabuleiro"""
-        # Limpa o cache de imagens das cartas
-        self.carta_imgs = {}
-        
-        # Recarrega todas as cartas do tabuleiro
-        for carta in self.tabuleiro.cartasNoTabuleiro:
-            if carta is not None:
-                self.get_carta_img(carta)
-        
-        # Recarrega cartas dos jogadores também
-        for carta in self.tabuleiro.pegarJogadorLocal().pegarCartas():
-            self.get_carta_img(carta)
-        
-        for carta in self.tabuleiro.jogadorRemoto.pegarCartas():
-            self.get_carta_img(carta)
-        
-        # Recarrega cartas de roubo dos jogadores
-        for carta in self.tabuleiro.pegarCartasRoubo():
-            self.get_carta_img(carta)
-
     def notificarDesistencia(self):
         self.tabuleiro.partidaEmAndamento = False  # Marca que a partida não está mais em andamento
         # Cria uma nova janela para notificar a desistência
@@ -305,170 +301,158 @@ class TelaJogo:
     def desabilitarJogador(self):
         self.tabuleiro.pegarJogadorLocal().desabilitarJogador()
     
-    def extrair_dados_carta(self, carta_img_path: Path, nivel: NiveisEnum, roubo=False):
-        nome = carta_img_path.stem
-        pontos = 0
-        bonus = None
-        pedras = {}
-        cartaDeRoubo = roubo
-        habilitada = True
-
-        partes = nome.split('-')
-        for parte in partes:
-            if parte.startswith("pontos:"):
-                pontos = int(parte.split(":")[1])
-            elif parte.startswith("bonus:"):
-                bonus_nome = parte.split(":")[1]
-                bonus = PedrasEnum[bonus_nome.upper()]
-            elif parte.startswith("roubo"):
-                pedras_roubo = parte.split('-')[1:]
-                for pedra_nome in pedras_roubo:
-                    pedra_enum = PedrasEnum[pedra_nome.upper()]
-                    pedras[pedra_enum] = 1
-            elif ':' in parte:
-                pedra_nome, qtd = parte.split(':')
-                # Só adiciona se não for bonus
-                if pedra_nome.lower() not in [p.name.lower() for p in PedrasEnum]:
-                    continue
-                pedra_enum = PedrasEnum[pedra_nome.upper()]
-                pedras[pedra_enum] = int(qtd)
-        
-        # Usa o nome do arquivo como ID base para garantir consistência
-        # O ID final será gerado usando hash determinístico no método que chama esta função
-        id_carta = nome
-        return id_carta, pontos, pedras, cartaDeRoubo, bonus, habilitada
-
     def get_carta_img(self, carta):
         """Retorna a imagem ImageTk.PhotoImage para uma carta específica"""
         if carta is None:
             return None
         
-        # Verifica se a imagem já está em cache
-        if carta.id in self.carta_imgs:
-            return self.carta_imgs[carta.id]
-        
-        # Se não está em cache, tenta carregar do arquivo baseado nas características da carta
+        # A imagem vem do cache de sprites, uma por desenho (não por cópia da carta)
         try:
-            # Procura o arquivo da carta baseado nas características
-            diretorios_cartas = [
-                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-1"), False),
-                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-2"), False),
-                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-3"), False),
-                (Path("./resources/cartas/cartas-tabuleiro/cartas-de-roubo"), True),
-            ]
-            
-            for diretorio, is_roubo in diretorios_cartas:
-                for carta_img in diretorio.glob("*.png"):
-                    nome = carta_img.stem
-                    id_carta, pontos, pedras, cartaDeRoubo, bonus, habilitada = self.extrair_dados_carta(carta_img, None, is_roubo)
-                    
-                    # Compara as características da carta com o arquivo
-                    if (carta.pontos == pontos and 
-                        carta.pedras == pedras and 
-                        carta.cartaDeRoubo == cartaDeRoubo and 
-                        carta.bonus == bonus):
-                        
-                        img = Image.open(carta_img)
-                        img = img.resize((self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), Image.Resampling.LANCZOS)
-                        img_tk = ImageTk.PhotoImage(img)
-                        self.carta_imgs[carta.id] = img_tk
-                        return img_tk
-            
-            # Se não encontrou, retorna None
-            return None
-            
+            return self.spriteCarta(carta)
         except Exception as e:
             print(f"Erro ao carregar imagem da carta {carta.id}: {e}")
             return None
 
+    def spriteBotao(self, nome: str, variante: str = "normal"):
+        """Sprite do botão no tamanho de BUTTON_SIZES, o mesmo do botão habilitado"""
+        return self.spriteArquivo(Path("./resources/botoes") / f"{nome}.png", self.tamanhoBotao(nome), variante)
+
+    def spriteArquivo(self, caminho, tamanho, variante="normal", fixar=False):
+        """Retorna o sprite de um arquivo de imagem no tamanho e variante pedidos.
+
+        Sprites fixados (botões, pedras, capas) nunca são descartados pelo cache.
+        """
+        caminho = Path(caminho)
+        return self.sprites.pegar(
+            chaveArquivo(caminho, tamanho),
+            variante,
+            lambda: self.pacoteAssets().pegar(caminho, tamanho),
+            fixar
+        )
+
+    @classmethod
+    def preaquecerAssets(cls, root):
+        """Começa a decodificar os sprites da partida em segundo plano (chamado na abertura do jogo)"""
+        especificacoes = cls.especificacoesAssets()
+        layout = cls.layoutAssets()
+        return iniciarPreaquecimento(
+            root,
+            pegarCacheSprites(),
+            especificacoes,
+            lambda caminho, tamanho: pegarPacoteAssets(especificacoes, layout).pegar(caminho, tamanho)
+        )
+
+    def precarregarAssets(self):
+        """Carrega todos os sprites do jogo usando o pool de threads, exibindo o progresso no canvas"""
+        # Aproveita o que o pré-aquecimento já decodificou enquanto o jogador estava fora da partida
+        preaquecimento = pegarPreaquecimento()
+        if preaquecimento is not None:
+            preaquecimento.concluir(self.exibirProgressoCarregamento)
+
+        # Carrega o que ainda faltar (tudo, se não houve pré-aquecimento)
+        carregador = CarregadorAssets(self.sprites, self.pacoteAssets().pegar)
+        resultado = carregador.carregar(self.especificacoesAssets(), self.exibirProgressoCarregamento)
+        self.canvas.delete("carregando")
+        if resultado["erros"]:
+            print(f"{resultado['erros']} de {resultado['total']} sprites não puderam ser carregados")
+
+    def exibirProgressoCarregamento(self, feitos: int, total: int):
+        """Atualiza o texto de progresso do carregamento no canvas"""
+        if total == 0:
+            return
+        self.canvas.delete("carregando")
+        self.canvas.create_text(
+            self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2,
+            text=f"Carregando... {feitos * 100 // total}%",
+            font=("Arial", 20, "bold"), fill="white", tags="carregando"
+        )
+        self.canvas.update_idletasks()
+
+    def pacoteAssets(self):
+        """Retorna o pacote de sprites pré-redimensionados, lido do disco só quando necessário"""
+        if self._pacote_assets is None:
+            self._pacote_assets = pegarPacoteAssets(self.especificacoesAssets(), self.layoutAssets())
+        return self._pacote_assets
+
+    @classmethod
+    def tamanhoBotao(cls, nome: str):
+        return cls.BUTTON_SIZES.get(nome, cls.BUTTON_SIZE)
+
+    @classmethod
+    def layoutAssets(cls) -> dict:
+        """Constantes de layout que definem os tamanhos dos sprites do pacote de assets"""
+        return {
+            "CARD_WIDTH": cls.CARD_WIDTH,
+            "CARD_HEIGHT": cls.CARD_HEIGHT,
+            "GEM_SIZE": cls.GEM_SIZE,
+            "MINI_GEM_SIZE": cls.MINI_GEM_SIZE,
+            "BUTTON_SIZE": list(cls.BUTTON_SIZE),
+            "BUTTON_SIZES": {nome: list(tamanho) for nome, tamanho in cls.BUTTON_SIZES.items()},
+            "PLAYER_INFO_WIDTH": cls.PLAYER_INFO_WIDTH,
+            "PLAYER_INFO_HEIGHT": cls.PLAYER_INFO_HEIGHT,
+        }
+
+    @classmethod
+    def especificacoesAssets(cls):
+        """Lista (arquivo, tamanho) de todos os sprites que o canvas do jogo desenha"""
+        tamanho_carta = (cls.CARD_WIDTH * 10, cls.CARD_HEIGHT * 10)
+        catalogo = pegarCatalogoCartas()
+        especificacoes = []
+        for nome_diretorio, _ in DIRETORIOS_CATALOGO:
+            especificacoes += [(arquivo, tamanho_carta) for arquivo in catalogo.pegarArquivos(nome_diretorio)]
+        especificacoes += [(Path(f"./resources/cartas/baralho/{nivel}.png"), tamanho_carta) for nivel in [1, 2, 3]]
+        for pedra_img in sorted(Path("./resources/pedras").glob("*.png")):
+            especificacoes.append((pedra_img, (cls.GEM_SIZE, cls.GEM_SIZE)))
+            especificacoes.append((pedra_img, (cls.MINI_GEM_SIZE, cls.MINI_GEM_SIZE)))
+        for botao_img in sorted(Path("./resources/botoes").glob("*.png")):
+            especificacoes.append((botao_img, cls.tamanhoBotao(botao_img.stem)))
+        for sombra in ["sombra_inferior_esquerda", "sombra_superior_esquerda"]:
+            especificacoes.append((Path(f"./resources/extra/{sombra}.png"), (cls.PLAYER_INFO_WIDTH, cls.PLAYER_INFO_HEIGHT)))
+        return especificacoes
+
+    def spriteCarta(self, carta, variante="normal"):
+        """Retorna o sprite de uma carta na variante pedida, ou None se a carta não tiver arte"""
+        caminho = self.catalogo_cartas.pegarCaminho(carta)
+        if caminho is None:
+            return None
+        return self.spriteArquivo(caminho, (self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), variante)
+
     def carregarCartas(self):
-        self.carta_imgs = {}
         seed = self.seed_partida  # Use o seed da partida para consistência
 
-        def carregarCartasDeDiretorio(diretorio: Path, nivel: NiveisEnum = None, roubo=False):
-            # Primeiro, carrega todas as cartas únicas do diretório
-            cartas_unicas = []
-            # Ordena os arquivos para garantir consistência entre jogadores
-            arquivos_cartas = sorted(diretorio.glob("*.png"), key=lambda x: x.name)
-            
-            for carta_img in arquivos_cartas:
-                try:
-                    img = Image.open(carta_img)
-                    img = img.resize((self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), Image.Resampling.LANCZOS)
-                    img_tk = ImageTk.PhotoImage(img)
-                    id_base, pontos, pedras, cartaDeRoubo, bonus, habilitada = self.extrair_dados_carta(carta_img, nivel, roubo)
-                    nivel_destino = NiveisEnum.NIVEL3 if roubo else nivel
-                    
-                    cartas_unicas.append({
-                        'img_tk': img_tk,
-                        'id_base': id_base,
-                        'pontos': pontos,
-                        'pedras': pedras.copy(),
-                        'cartaDeRoubo': cartaDeRoubo,
-                        'bonus': bonus,
-                        'habilitada': habilitada,
-                        'nivel': nivel_destino
-                    })
-                except Exception as e:
-                    print(f"Erro ao carregar carta {carta_img}: {e}")
+        def carregarCartasDeDiretorio(diretorio: str, nivel: NiveisEnum = None, roubo=False):
+            # Primeiro, pega os desenhos únicos do diretório no manifesto (já ordenados).
+            # Cada desenho vira um protótipo compartilhado por todas as suas cópias
+            # (as cartas de roubo vão para o baralho do nível 3)
+            prototipos = [PrototipoCarta.daDefinicao(definicao) for definicao in self.catalogo_cartas.pegarDefinicoes(diretorio)]
                         
-            # Agora cria 20 cartas por deck, reutilizando as cartas únicas
+            # Agora cria 20 cartas por deck, reutilizando os desenhos
             if not roubo:
                 # Para cartas normais, cria 20 cartas por nível
                 cartas_por_nivel = 20
                 for i in range(cartas_por_nivel):
-                    # Seleciona uma carta única de forma cíclica
-                    carta_unica = cartas_unicas[i % len(cartas_unicas)]
+                    # Seleciona um desenho de forma cíclica
+                    prototipo = prototipos[i % len(prototipos)]
                     
                     # Cria ID único para esta instância
-                    id_carta = hash(f"{carta_unica['id_base']}_{nivel.value}_{i}")
-                    
-                    # Instancia a carta
-                    self.tabuleiro.instanciarCartas(
-                        id=id_carta,
-                        pontos=carta_unica['pontos'],
-                        nivel=carta_unica['nivel'],
-                        pedras=carta_unica['pedras'],
-                        cartaDeRoubo=False,
-                        bonus=carta_unica['bonus'],
-                        habilitada=carta_unica['habilitada']
-                    )
+                    id_carta = hash(f"{prototipo.definicao.nome}_{nivel.value}_{i}")
                     
-                    # Associa a imagem à carta (reutiliza a mesma imagem para todas as instâncias da mesma carta)
-                    self.carta_imgs[id_carta] = carta_unica['img_tk']
+                    # Instancia a cópia (só id e habilitação; custo e imagem ficam no protótipo)
+                    self.tabuleiro.instanciarCartaDoPrototipo(id_carta, prototipo)
                 
             else:
                 # Para cartas de roubo, cria apenas 3 cartas
-                for i in range(3):
-                    if i < len(cartas_unicas):
-                        carta_unica = cartas_unicas[i]
-                        id_carta = hash(f"{carta_unica['id_base']}_roubo_{i}")
-                        
-                        self.tabuleiro.instanciarCartas(
-                            id=id_carta,
-                            pontos=carta_unica['pontos'],
-                            nivel=carta_unica['nivel'],
-                            pedras=carta_unica['pedras'],
-                            cartaDeRoubo=True,
-                            bonus=carta_unica['bonus'],
-                            habilitada=carta_unica['habilitada']
-                        )
-                        self.carta_imgs[id_carta] = carta_unica['img_tk']
+                for i, prototipo in enumerate(prototipos[:3]):
+                    id_carta = hash(f"{prototipo.definicao.nome}_roubo_{i}")
+                    self.tabuleiro.instanciarCartaDoPrototipo(id_carta, prototipo)
                 
 
-        diretorios_cartas = {
-            NiveisEnum.NIVEL1: Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-1"),
-            NiveisEnum.NIVEL2: Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-2"),
-            NiveisEnum.NIVEL3: Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-3"),
-        }
-        cartas_roubo_dir = Path("./resources/cartas/cartas-tabuleiro/cartas-de-roubo")
-
         # Carrega cartas normais primeiro
-        for nivel, diretorio in diretorios_cartas.items():
+        for nivel, diretorio in DIRETORIOS_NIVEIS.items():
             carregarCartasDeDiretorio(diretorio, nivel)
         
         # Carrega cartas de roubo
-        carregarCartasDeDiretorio(cartas_roubo_dir, NiveisEnum.NIVEL3, roubo=True)
+        carregarCartasDeDiretorio(DIRETORIO_ROUBO, NiveisEnum.NIVEL3, roubo=True)
 
         # Verifica se os baralhos foram carregados corretamente
         for i, baralho in enumerate(self.tabuleiro.baralhos):
@@ -495,26 +479,10 @@ class TelaJogo:
 
         for botao_img in botoes_dir.glob("*.png"):
             try:
-                img = Image.open(botao_img)
-                if botao_img.stem == "desfazer_jogada":
-                    tamanho_botoes = (150, 80)
-                elif botao_img.stem == "finalizar_jogada":
-                    tamanho_botoes = (180, 90)  # Diminuído height de 100 para 90
-                else:
-                    tamanho_botoes = (150, 100)
-                img = img.resize(tamanho_botoes, Image.Resampling.LANCZOS)
-                img_tk = ImageTk.PhotoImage(img)
+                img_tk = self.spriteArquivo(botao_img, self.tamanhoBotao(botao_img.stem), fixar=True)
                 self.botoes[botao_img.stem] = img_tk
             except Exception as e:
                 print(f"Erro ao carregar botão {botao_img}: {e}")
-        
-        # Carrega o botão de settings separadamente
-        try:
-            img_settings = Image.open("./resources/botoes/settings.png")
-            img_settings = img_settings.resize((60, 60), Image.Resampling.LANCZOS)  # Tamanho menor
-            self.botoes["settings"] = ImageTk.PhotoImage(img_settings)
-        except Exception as e:
-            print(f"Erro ao carregar botão settings: {e}")
 
     def carregarPedras(self):
         """Carrega as imagens das pedras e cria um dict {PedrasEnum: ImageTk.PhotoImage}"""
@@ -527,9 +495,7 @@ class TelaJogo:
                 # Procura o enum correspondente pelo nome em lower
                 enum_pedra = next((p for p in PedrasEnum if p.name.lower() == nome_pedra), None)
                 if enum_pedra:
-                    img = Image.open(pedra_img)
-                    img = img.resize((self.GEM_SIZE, self.GEM_SIZE), Image.Resampling.LANCZOS)
-                    img_tk = ImageTk.PhotoImage(img)
+                    img_tk = self.spriteArquivo(pedra_img, (self.GEM_SIZE, self.GEM_SIZE), fixar=True)
                     self.pedras[enum_pedra] = img_tk
                 else:
                     print(f"Arquivo de pedra '{pedra_img}' não corresponde a nenhum PedrasEnum.")
@@ -537,12 +503,11 @@ class TelaJogo:
                 print(f"Erro ao carregar pedra {pedra_img}: {e}")
 
     def configurarTela(self):
-        self.canvas.delete("all")
         self.desenharTabuleiro()
 
     def clickComprarPedras(self):
         """Ação ao clicar no botão 'Comprar Pedras'"""
-        messagebox.showinfo("Comprar Pedras", "Selecione as pedras que deseja comprar clicando no tabuleiro.")
+        self.notificacoes.info("Comprar Pedras", "Selecione as pedras que deseja comprar clicando no tabuleiro.")
         
         # Desativa os demais botões de compra
         self.desabilitarBotaoComprarCarta()
@@ -561,7 +526,7 @@ class TelaJogo:
         self.modo_reserva = False
         
         # Redesenha o tabuleiro com o estado inicial
-        self.desenharTabuleiro()
+        self.agendarRedesenho()
         
         # Habilita/desabilita jogadas baseado no turno atual
         if self.tabuleiro.pegarJogadorLocal().jogadorEmTurno:
@@ -569,11 +534,11 @@ class TelaJogo:
         else:
             self.desabilitarJogadas()
             
-        messagebox.showinfo("Jogada Desfeita", "O tabuleiro foi restaurado ao estado inicial da partida.")
+        self.notificacoes.info("Jogada Desfeita", "O tabuleiro foi restaurado ao estado inicial da partida.")
 
     def clickComprarCarta(self):
         """Ação ao clicar no botão 'Comprar Carta'"""
-        messagebox.showinfo("Comprar Carta", "Selecione a carta que deseja comprar clicando no tabuleiro.")
+        self.notificacoes.info("Comprar Carta", "Selecione a carta que deseja comprar clicando no tabuleiro.")
 
         self.desabilitarBotaoComprarPedras()
         self.desabilitarReservarCarta()
@@ -586,7 +551,7 @@ class TelaJogo:
 
     def clickReservarCarta(self):
         """Ação ao clicar no botão 'Reservar Carta'"""
-        messagebox.showinfo("Reservar Carta", "Selecione a carta que deseja reservar clicando no tabuleiro.")
+        self.notificacoes.info("Reservar Carta", "Selecione a carta que deseja reservar clicando no tabuleiro.")
 
         self.desabilitarBotaoComprarPedras()
         self.desabilitarBotaoComprarCarta()
@@ -600,12 +565,12 @@ class TelaJogo:
     def selecionarPedra(self, pedra, jogador):
         """Guarda a pedra selecionada no dict de oferta de pedras"""
         self.ofertaDePedras[jogador] = pedra
-        messagebox.showinfo("Troca de Pedras", f"Você selecionou a pedra {pedra} para troca.")
+        self.notificacoes.info("Troca de Pedras", f"Você selecionou a pedra {pedra} para troca.")
     
     def clickOfertaDeTroca(self):
         """Ação ao clicar no botão 'Oferta de Troca'"""
         if not self.tabuleiro.pegarJogadorLocal().jogadorEmTurno:
-            messagebox.showinfo("Não é sua vez", "Você só pode fazer oferta de troca no seu turno.")
+            self.notificacoes.info("Não é sua vez", "Você só pode fazer oferta de troca no seu turno.")
             return
             
         # Verifica se o jogador tem pedras para trocar
@@ -616,11 +581,11 @@ class TelaJogo:
         pedras_disponiveis_remoto = {pedra: qtd for pedra, qtd in pedras_remoto.items() if qtd > 0}
         
         if not pedras_disponiveis_local:
-            messagebox.showinfo("Sem pedras", "Você não tem pedras para trocar.")
+            self.notificacoes.info("Sem pedras", "Você não tem pedras para trocar.")
             return
             
         if not pedras_disponiveis_remoto:
-            messagebox.showinfo("Oponente sem pedras", "Seu oponente não tem pedras para trocar.")
+            self.notificacoes.info("Oponente sem pedras", "Seu oponente não tem pedras para trocar.")
             return
         
         # Desabilita outros botões
@@ -791,7 +756,7 @@ class TelaJogo:
             self.habilitarJogadas()
         self.desabilitarBotaoDesfazerJogada()
         
-        messagebox.showinfo("Oferta Cancelada", "A oferta de troca foi cancelada.")
+        self.notificacoes.info("Oferta Cancelada", "A oferta de troca foi cancelada.")
 
     def enviarOfertaTroca(self):
         """Envia a oferta de troca"""
@@ -808,7 +773,7 @@ class TelaJogo:
                 # Armazena a oferta no tabuleiro para ser enviada
                 self.tabuleiro.oferta_pendente = oferta
                 
-                messagebox.showinfo("Oferta Enviada", 
+                self.notificacoes.info("Oferta Enviada", 
                                   f"Oferta enviada: sua {self.pedra_local_selecionada.name} pela {self.pedra_remoto_selecionada.name} do oponente.")
                 
                 # Finaliza a jogada
@@ -817,7 +782,7 @@ class TelaJogo:
                 print(f"Erro ao criar/enviar oferta: {e}")
                 import traceback
                 traceback.print_exc()
-                messagebox.showerror("Erro", f"Erro ao enviar oferta: {e}")
+                self.notificacoes.erro("Erro", f"Erro ao enviar oferta: {e}")
         else:
             messagebox.showwarning("Seleção Incompleta", "Você precisa selecionar uma pedra sua e uma pedra do oponente antes de enviar a oferta.")
 
@@ -990,31 +955,31 @@ class TelaJogo:
         # Remove a oferta pendente
         self.oferta_pendente = None
         
-        messagebox.showinfo("Troca Aceita", f"Troca realizada: você recebeu {oferta['pedra_local'].name} e deu {oferta['pedra_remoto'].name}.")
+        self.notificacoes.info("Troca Aceita", f"Troca realizada: você recebeu {oferta['pedra_local'].name} e deu {oferta['pedra_remoto'].name}.")
         
         # Atualiza o tabuleiro
-        self.desenharTabuleiro()
+        self.agendarRedesenho()
 
     def recusarOfertaTroca(self):
         """Recusa a oferta de troca"""
         # Remove a oferta pendente
         self.oferta_pendente = None
         
-        messagebox.showinfo("Troca Recusada", "Você recusou a oferta de troca.")
+        self.notificacoes.info("Troca Recusada", "Você recusou a oferta de troca.")
         
         # Atualiza o tabuleiro
-        self.desenharTabuleiro()
+        self.agendarRedesenho()
 
     def clickPedra(self, pedra: PedrasEnum):
         """Método chamado quando uma pedra é clicada no tabuleiro"""
         # Verifica se as pedras estão habilitadas para seleção
         if not self.pedras_habilitadas:
-            messagebox.showinfo("Pedras não habilitadas", "Clique em 'Comprar Pedras' para habilitar a seleção de pedras.")
+            self.notificacoes.info("Pedras não habilitadas", "Clique em 'Comprar Pedras' para habilitar a seleção de pedras.")
             return
         
         # Ouro não pode ser comprado diretamente
         if pedra == PedrasEnum.OURO:
-            messagebox.showinfo("Pedra de Ouro", "Pedras de ouro só podem ser obtidas ao reservar cartas!")
+            self.notificacoes.info("Pedra de Ouro", "Pedras de ouro só podem ser obtidas ao reservar cartas!")
             return
             
         self.pedrasSelecionadas.append(pedra)
@@ -1026,11 +991,11 @@ class TelaJogo:
         if len(self.pedrasSelecionadas) == 1:
             # Primeira pedra selecionada - mostra opções
             opcoes = f"Você selecionou {pedra.name}.\n\nAgora você pode:\n• Selecionar mais uma pedra {pedra.name} (para ter 2 iguais)\n• Selecionar duas pedras diferentes (para ter 3 diferentes)"
-            messagebox.showinfo("Primeira Pedra Selecionada", opcoes)
+            self.notificacoes.info("Primeira Pedra Selecionada", opcoes)
             
         elif len(self.pedrasSelecionadas) == 2:
             if self.pedrasSelecionadas[0] == self.pedrasSelecionadas[1]:
-                messagebox.showinfo(
+                self.notificacoes.info(
                     "Pedras Selecionadas",
                     f"Você selecionou 2 pedras do tipo {pedra.name}.\nClique em 'Finalizar Jogada' para confirmar."
                 )
@@ -1038,14 +1003,14 @@ class TelaJogo:
                 self.desabilitarPedras()  # Desabilita imediatamente
 
             else:
-                messagebox.showinfo(
+                self.notificacoes.info(
                     "Pedras Selecionadas",
                     f"Você selecionou 2 pedras diferentes: {self.pedrasSelecionadas[0].name} e {self.pedrasSelecionadas[1].name}.\nAgora selecione uma terceira pedra diferente."
                 )
         elif len(self.pedrasSelecionadas) == 3:
             p1, p2, p3 = self.pedrasSelecionadas
             if p1 == p2 or p1 == p3 or p2 == p3:
-                messagebox.showerror(
+                self.notificacoes.erro(
                     "Erro",
                     "A terceira pedra selecionada não pode ser igual às anteriores. Tente novamente."
                 )
@@ -1054,7 +1019,7 @@ class TelaJogo:
                 self.remover_efeito_selecao_pedra(p3)
                 self.pedras_selecionadas_visuais.discard(p3)
             else:
-                messagebox.showinfo(
+                self.notificacoes.info(
                     "Pedras Selecionadas",
                     f"Você selecionou 3 pedras diferentes: {p1.name}, {p2.name}, e {p3.name}.\nClique em 'Finalizar Jogada' para confirmar."
                 )
@@ -1063,17 +1028,13 @@ class TelaJogo:
 
     def notificarJogadaInvalida(self, mensagem: str):
         """Exibe uma mensagem de erro quando uma jogada inválida é realizada"""
-        messagebox.showerror(
-            title="Jogada inválida",
-            message=mensagem,
-            parent=self.root
-        )
+        self.notificacoes.erro("Jogada inválida", mensagem)
 
     def clickCarta(self, indiceCarta: int):
         """Método chamado quando uma carta é clicada no tabuleiro"""
         # Verifica se as cartas estão habilitadas para seleção
         if not self.cartas_habilitadas:
-            messagebox.showinfo("Cartas não habilitadas", "Clique em 'Comprar Carta' ou 'Reservar Carta' para habilitar a seleção de cartas.")
+            self.notificacoes.info("Cartas não habilitadas", "Clique em 'Comprar Carta' ou 'Reservar Carta' para habilitar a seleção de cartas.")
             return
             
         # Verifica se há uma carta no índice selecionado
@@ -1092,9 +1053,9 @@ class TelaJogo:
 
         # Mostra mensagem de confirmação da seleção
         if self.modo_reserva:
-            messagebox.showinfo("Carta Selecionada", f"Carta selecionada para reserva! Clique em 'Finalizar Jogada' para confirmar.")
+            self.notificacoes.info("Carta Selecionada", f"Carta selecionada para reserva! Clique em 'Finalizar Jogada' para confirmar.")
         else:
-            messagebox.showinfo("Carta Selecionada", f"Carta selecionada para compra! Clique em 'Finalizar Jogada' para confirmar.")
+            self.notificacoes.info("Carta Selecionada", f"Carta selecionada para compra! Clique em 'Finalizar Jogada' para confirmar.")
 
         self.habilitarBotaoFinalizarJogada()
 
@@ -1166,6 +1127,7 @@ class TelaJogo:
             import traceback
             traceback.print_exc()
 
+    @medirFase("desenharCartasJogadores")
     def desenharCartasJogadores(self):
         """Desenha as cartas dos jogadores nas áreas específicas"""
         # Jogador local (embaixo, centralizado) - mostra cartas cortadas
@@ -1194,51 +1156,27 @@ class TelaJogo:
                     if img_tk:
                         # Cria uma versão cortada da carta (mostra apenas a parte superior)
                         try:
-                            # Encontra o arquivo da carta para recriar a imagem
-                            diretorios_cartas = [
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-1"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-2"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-3"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-de-roubo"), True),
-                            ]
-                            
-                            for diretorio, is_roubo in diretorios_cartas:
-                                for carta_img in diretorio.glob("*.png"):
-                                    nome = carta_img.stem
-                                    id_carta, pontos, pedras, cartaDeRoubo, bonus, habilitada = self.extrair_dados_carta(carta_img, None, is_roubo)
-                                    
-                                    if (carta.pontos == pontos and 
-                                        carta.pedras == pedras and 
-                                        carta.cartaDeRoubo == cartaDeRoubo and 
-                                        carta.bonus == bonus):
-                                        
-                                        # Carrega a imagem e corta (mostra apenas a parte superior)
-                                        pil_img = Image.open(carta_img).resize((self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), Image.Resampling.LANCZOS)
-                                        # Corta apenas a parte superior da carta (primeiros 30% da altura)
-                                        altura_corte = int(self.CARD_HEIGHT * 10 * 0.3)
-                                        pil_img_cortada = pil_img.crop((0, 0, self.CARD_WIDTH * 10, altura_corte))
-                                        img_tk_cortada = ImageTk.PhotoImage(pil_img_cortada)
-                                        
-                                        # Desenha a carta cortada
-                                        self.canvas.create_image(
-                                            x, y, 
-                                            image=img_tk_cortada, 
-                                            anchor='s',
-                                            tags=f"carta_jogador_local_{i}"
-                                        )
-                                        break
-                                else:
-                                    continue
-                                break
+                            # Variante cortada (apenas os primeiros 30% da altura), construída uma vez por sessão
+                            img_tk_cortada = self.spriteCarta(carta, "cortada")
+                            if img_tk_cortada is not None:
+                                # Desenha a carta cortada
+                                self.cena.imagem(
+                                    f"carta_jogador_local_{i}",
+                                    x, y, 
+                                    camada="maos",
+                                    image=img_tk_cortada, 
+                                    anchor='s'
+                                )
                         except Exception as e:
                             print(f"Erro ao criar carta cortada para jogador local: {e}")
                             # Fallback: mostra apenas os pontos
-                            self.canvas.create_text(
+                            self.cena.texto(
+                                f"carta_jogador_local_{i}_pontos",
                                 x, y, 
+                                camada="maos",
                                 text=str(carta.pontos), 
                                 fill="white", 
-                                font=("Arial", 16, "bold"),
-                                tags=f"carta_jogador_local_{i}"
+                                font=("Arial", 16, "bold")
                             )
 
         # Jogador remoto (em cima, centralizado, invertido) - mostra cartas rotacionadas e cortadas
@@ -1267,54 +1205,30 @@ class TelaJogo:
                     if img_tk:
                         # Cria uma versão rotacionada e cortada da carta
                         try:
-                            # Encontra o arquivo da carta para recriar a imagem
-                            diretorios_cartas = [
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-1"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-2"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-3"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-de-roubo"), True),
-                            ]
-                            
-                            for diretorio, is_roubo in diretorios_cartas:
-                                for carta_img in diretorio.glob("*.png"):
-                                    nome = carta_img.stem
-                                    id_carta, pontos, pedras, cartaDeRoubo, bonus, habilitada = self.extrair_dados_carta(carta_img, None, is_roubo)
-                                    
-                                    if (carta.pontos == pontos and 
-                                        carta.pedras == pedras and 
-                                        carta.cartaDeRoubo == cartaDeRoubo and 
-                                        carta.bonus == bonus):
-                                        
-                                        # Carrega a imagem, rotaciona 180° e corta
-                                        pil_img = Image.open(carta_img).resize((self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), Image.Resampling.LANCZOS)
-                                        pil_img = pil_img.transpose(Image.ROTATE_180)
-                                        # Corta apenas a parte superior da carta rotacionada (primeiros 30% da altura)
-                                        altura_corte = int(self.CARD_HEIGHT * 10 * 0.3)
-                                        pil_img_cortada = pil_img.crop((0, 0, self.CARD_WIDTH * 10, altura_corte))
-                                        img_tk_cortada = ImageTk.PhotoImage(pil_img_cortada)
-                                        
-                                        # Desenha a carta rotacionada e cortada
-                                        self.canvas.create_image(
-                                            x, y, 
-                                            image=img_tk_cortada, 
-                                            anchor='n',
-                                            tags=f"carta_jogador_remoto_{i}"
-                                        )
-                                        break
-                                else:
-                                    continue
-                                break
+                            # Variante rotacionada 180° e cortada, construída uma vez por sessão
+                            img_tk_cortada = self.spriteCarta(carta, "rotacionada_cortada")
+                            if img_tk_cortada is not None:
+                                # Desenha a carta rotacionada e cortada
+                                self.cena.imagem(
+                                    f"carta_jogador_remoto_{i}",
+                                    x, y, 
+                                    camada="maos",
+                                    image=img_tk_cortada, 
+                                    anchor='n'
+                                )
                         except Exception as e:
                             print(f"Erro ao criar carta rotacionada para jogador remoto: {e}")
                             # Fallback: mostra apenas os pontos
-                            self.canvas.create_text(
+                            self.cena.texto(
+                                f"carta_jogador_remoto_{i}_pontos",
                                 x, y, 
+                                camada="maos",
                                 text=str(carta.pontos), 
                                 fill="white", 
-                                font=("Arial", 16, "bold"),
-                                tags=f"carta_jogador_remoto_{i}"
+                                font=("Arial", 16, "bold")
                             )
 
+    @medirFase("desenharCartasRouboJogador")
     def desenharCartasRouboJogador(self):
         """Desenha as cartas de roubo dos jogadores"""
         # Jogador local (embaixo) - apenas cartas de roubo que realmente pertencem ao jogador
@@ -1327,11 +1241,11 @@ class TelaJogo:
                     # Centralizado e cortado (exemplo: só metade da carta)
                     x = self.WINDOW_WIDTH // 2 + (i - len(cartas_roubo_local)//2) * (self.CARD_WIDTH*5)
                     y = self.WINDOW_HEIGHT - 250  # Movido mais para cima para dar espaço às reservadas
-                    self.canvas.create_image(x, y, image=img_tk, anchor='s', tags=f"roubo_local_{i}")
+                    self.cena.imagem(f"roubo_local_{i}", x, y, camada="maos", image=img_tk, anchor='s')
                     
                     # Adiciona funcionalidade de clique para usar carta de roubo
-                    self.canvas.tag_bind(f"roubo_local_{i}", "<Button-1>", lambda event, idx=i: self.clickCartaRoubo(idx))
-                    self.configurar_cursor_clicavel(f"roubo_local_{i}")
+                    self.despachante.registrar(f"roubo_local_{i}", clique=lambda idx=i: self.clickCartaRoubo(idx))
+                    self.despachante.habilitar(f"roubo_local_{i}")
 
         # Jogador remoto (em cima, invertido) - apenas cartas de roubo que realmente pertencem ao jogador
         cartas_roubo_remoto = self.tabuleiro.jogadorRemoto.pegarCartas()
@@ -1340,70 +1254,28 @@ class TelaJogo:
             for i, carta in enumerate(cartas_roubo_remoto):
                 img_tk = self.get_carta_img(carta)
                 if img_tk:
+                    x = self.WINDOW_WIDTH // 2 + (i - len(cartas_roubo_remoto)//2) * (self.CARD_WIDTH*5)
+                    y = self.CARD_HEIGHT*2
                     # Inverter imagem 180 graus
                     try:
-                        from PIL import Image
-                        # Encontra o arquivo da carta
-                        diretorios_cartas = [
-                            Path("./resources/cartas/cartas-tabuleiro/cartas-de-roubo"),
-                        ]
-                        
-                        for diretorio in diretorios_cartas:
-                            for carta_img in diretorio.glob("*.png"):
-                                nome = carta_img.stem
-                                id_carta, pontos, pedras, cartaDeRoubo, bonus, habilitada = self.extrair_dados_carta(carta_img, None, True)
-                                
-                                # Compara as características da carta com o arquivo
-                                if (carta.pontos == pontos and 
-                                    carta.pedras == pedras and 
-                                    carta.cartaDeRoubo == cartaDeRoubo and 
-                                    carta.bonus == bonus):
-                                    
-                                    pil_img = Image.open(carta_img).resize((self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), Image.Resampling.LANCZOS)
-                                    pil_img = pil_img.transpose(Image.ROTATE_180)
-                                    img_tk_invertida = ImageTk.PhotoImage(pil_img)
-                                    x = self.WINDOW_WIDTH // 2 + (i - len(cartas_roubo_remoto)//2) * (self.CARD_WIDTH*5)
-                                    y = self.CARD_HEIGHT*2
-                                    self.canvas.create_image(x, y, image=img_tk_invertida, anchor='n', tags=f"roubo_remoto_{i}")
-                                    break
-                            else:
-                                continue
-                            break
-                        else:
+                        img_tk_invertida = self.spriteCarta(carta, "rotacionada")
+                        if img_tk_invertida is None:
                             # Se não encontrou a imagem, usa a original
-                            x = self.WINDOW_WIDTH // 2 + (i - len(cartas_roubo_remoto)//2) * (self.CARD_WIDTH*5)
-                            y = self.CARD_HEIGHT*2
-                            self.canvas.create_image(x, y, image=img_tk, anchor='n', tags=f"roubo_remoto_{i}")
+                            img_tk_invertida = img_tk
                     except Exception as e:
                         # Se houver erro, usa a imagem original
-                        x = self.WINDOW_WIDTH // 2 + (i - len(cartas_roubo_remoto)//2) * (self.CARD_WIDTH*5)
-                        y = self.CARD_HEIGHT*2
-                        self.canvas.create_image(x, y, image=img_tk, anchor='n', tags=f"roubo_remoto_{i}")
+                        img_tk_invertida = img_tk
+                    self.cena.imagem(f"roubo_remoto_{i}", x, y, camada="maos", image=img_tk_invertida, anchor='n')
 
+    @medirFase("quadro")
     def desenharTabuleiro(self):
-        self.canvas.delete("all")
-        niveis = [NiveisEnum.NIVEL1, NiveisEnum.NIVEL2, NiveisEnum.NIVEL3]
-        for nivel_idx, nivel in enumerate(niveis):
-            y_pos = self.START_Y + (nivel_idx * (self.CARD_HEIGHT + self.VERTICAL_GAP))
-            deck_x = self.START_X
-
-            capa_img = self.capas_baralho.get(nivel.value)
-            if capa_img:
-                self.canvas.create_image(deck_x-80, y_pos, image=capa_img, anchor=NW, tags=f"capa_nivel{nivel.value}")
-
-            for i in range(4):
-                idx = nivel_idx * 4 + i
-                carta = self.tabuleiro.pegarCartaTabuleiro(idx)
-                if carta is not None:
-                    img_tk = self.get_carta_img(carta)
-                    if img_tk:
-                        x = deck_x + self.CARD_WIDTH + self.DECK_TO_CARDS_GAP + i * (self.CARD_WIDTH + self.HORIZONTAL_GAP)
-                        self.canvas.create_image(x, y_pos, image=img_tk, anchor=NW, tags=f"carta_{nivel.name}_{idx}")
-                        # Só habilita clique se for o turno do jogador E as cartas estiverem habilitadas
-                        if self.tabuleiro.pegarJogadorLocal().jogadorEmTurno and self.cartas_habilitadas:
-                            # Configura cursor para cartas clicáveis
-                            self.configurar_cursor_clicavel(f"carta_{nivel.name}_{idx}")
-                            self.canvas.tag_bind(f"carta_{nivel.name}_{idx}", "<Button-1>", lambda event, idx=idx: self.clickCarta(idx))
+        # Os itens do canvas são reaproveitados: só o que mudou é reconfigurado,
+        # e os slots que não forem desenhados neste quadro ficam escondidos
+        self.cena.iniciarQuadro()
+        # Redesenho completo: a partir daqui só os sprites usados neste quadro estão na tela
+        self.sprites.iniciarQuadro()
+        self.desenharFundo()
+        self.desenharCartasTabuleiro()
 
         self.tabuleiro.atualizarPedrasNoTabuleiro()
         self.desenharBotoes()
@@ -1412,9 +1284,119 @@ class TelaJogo:
         self.desenharCartasJogadores()  # Adiciona o desenho das cartas dos jogadores
         self.desenharCartasRouboJogador()  # Adiciona o desenho das cartas de roubo dos jogadores
         self.desenharCartasReservadas()  # Adiciona o desenho das cartas reservadas
+        self.cena.finalizarQuadro()
+        self.estado_desenhado = FotoTabuleiro.capturar(self.tabuleiro)
+        self.desabilitarBotaoFinalizarJogada()
+        self.desabilitarBotaoDesfazerJogada()
+
+    @medirFase("quadro_parcial")
+    def redesenharAlteracoes(self, diff: DiffTabuleiro):
+        """Redesenha apenas as regiões do tabuleiro que mudaram segundo o diff"""
+        camadas = set()
+        if diff.pedras:
+            camadas.add("pedras")
+        if diff.paineis or diff.turno:
+            camadas.add("jogadores")
+        if diff.maos:
+            camadas.add("maos")
+        if diff.reservas:
+            camadas.add("reservadas")
+
+        self.cena.iniciarQuadro(camadas)
+        if diff.slots:
+            self.desenharCartasTabuleiro(diff.slots)
+        if "pedras" in camadas:
+            self.desenharPedras()
+        if "jogadores" in camadas:
+            self.desenharInfosJogadores()
+        if "maos" in camadas:
+            self.desenharCartasJogadores()
+            self.desenharCartasRouboJogador()
+        if "reservadas" in camadas:
+            self.desenharCartasReservadas()
+        self.cena.finalizarQuadro()
+        self.estado_desenhado = FotoTabuleiro.capturar(self.tabuleiro)
         self.desabilitarBotaoFinalizarJogada()
         self.desabilitarBotaoDesfazerJogada()
 
+    def registrarCustoJogada(self):
+        """Guarda quantas operações no canvas a última jogada recebida custou"""
+        custo = self.cena.contadores()
+        self.custos_jogadas.append(custo)
+        alteracoes = self.ultimo_diff if self.ultimo_diff is not None else "redesenho completo"
+        print(f"Jogada recebida ({alteracoes}): {sum(custo.values())} operações no canvas {custo}, rótulos {self.rotulos.estatisticas()}")
+
+    def agendarRedesenho(self, *regioes):
+        """Pede um redesenho do tabuleiro. Os pedidos feitos numa mesma interação viram um só,
+        executado quando o Tk fica ocioso"""
+        self.agendador.marcar(*(regioes or ("tabuleiro",)))
+
+    def redesenharPendentes(self, regioes):
+        """Executa o redesenho agendado: completo se alguém pediu o tabuleiro todo, senão só as alterações"""
+        if not self.canvas.winfo_exists():
+            return
+        if "tabuleiro" in regioes:
+            self.ultimo_diff = None
+            self.desenharTabuleiro()
+        else:
+            # As pedras do tabuleiro são derivadas das pedras dos jogadores
+            self.tabuleiro.atualizarPedrasNoTabuleiro()
+            self.ultimo_diff = compararTabuleiros(self.estado_desenhado, FotoTabuleiro.capturar(self.tabuleiro))
+            self.redesenharAlteracoes(self.ultimo_diff)
+
+    def compositorFundo(self) -> CompositorFundo:
+        """Partes do tabuleiro que nunca mudam durante a partida: capas dos baralhos e sombras dos painéis"""
+        largura, altura = int(self.canvas.cget("width")), int(self.canvas.cget("height"))
+        compositor = CompositorFundo(largura, altura, self.COR_FUNDO)
+        tamanho_carta = (self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10)
+        for nivel_idx, nivel in enumerate([1, 2, 3]):
+            y_pos = self.START_Y + (nivel_idx * (self.CARD_HEIGHT + self.VERTICAL_GAP))
+            compositor.adicionar(f"capa_nivel{nivel}", self.START_X - 80, y_pos,
+                                 self.carregadorBase(f"./resources/cartas/baralho/{nivel}.png", tamanho_carta))
+        tamanho_painel = (self.PLAYER_INFO_WIDTH, self.PLAYER_INFO_HEIGHT)
+        compositor.adicionar("sombra_local", self.PLAYER_INFO_X, altura,
+                             self.carregadorBase("./resources/extra/sombra_inferior_esquerda.png", tamanho_painel), anchor="sw")
+        compositor.adicionar("sombra_remoto", self.PLAYER_INFO_X, 0,
+                             self.carregadorBase("./resources/extra/sombra_superior_esquerda.png", tamanho_painel))
+        return compositor
+
+    def carregadorBase(self, caminho, tamanho):
+        """Função que devolve a imagem PIL base do arquivo (a mesma que o cache de sprites usa)"""
+        caminho = Path(caminho)
+        return lambda: self.sprites.pegarBase(chaveArquivo(caminho, tamanho), lambda: self.pacoteAssets().pegar(caminho, tamanho))
+
+    def desenharFundo(self):
+        """Desenha o fundo estático pré-composto: um único item, construído uma vez por tamanho de janela"""
+        compositor = self.compositorFundo()
+        sprite = self.sprites.pegar(compositor.chave(), "normal", compositor.compor, fixar=True)
+        self.cena.imagem("fundo_estatico", 0, 0, camada="fundo", image=sprite, anchor=NW)
+
+    @medirFase("desenharCartasTabuleiro")
+    def desenharCartasTabuleiro(self, indices=None):
+        """Desenha as cartas abertas (apenas os slots em `indices`, se informado). As capas dos baralhos estão no fundo"""
+        niveis = [NiveisEnum.NIVEL1, NiveisEnum.NIVEL2, NiveisEnum.NIVEL3]
+        for nivel_idx, nivel in enumerate(niveis):
+            y_pos = self.START_Y + (nivel_idx * (self.CARD_HEIGHT + self.VERTICAL_GAP))
+            deck_x = self.START_X
+
+            for i in range(4):
+                idx = nivel_idx * 4 + i
+                if indices is not None and idx not in indices:
+                    continue
+                tag = f"carta_{nivel.name}_{idx}"
+                carta = self.tabuleiro.pegarCartaTabuleiro(idx)
+                img_tk = self.get_carta_img(carta) if carta is not None else None
+                if not img_tk:
+                    self.cena.esconder(tag)
+                    continue
+                x = deck_x + self.CARD_WIDTH + self.DECK_TO_CARDS_GAP + i * (self.CARD_WIDTH + self.HORIZONTAL_GAP)
+                self.cena.imagem(tag, x, y_pos, image=img_tk, anchor=NW)
+                self.despachante.registrar(tag, clique=lambda idx=idx: self.clickCarta(idx))
+                # Só habilita clique se for o turno do jogador E as cartas estiverem habilitadas
+                if self.tabuleiro.pegarJogadorLocal().jogadorEmTurno and self.cartas_habilitadas:
+                    self.despachante.habilitar(tag)
+
+    @medirFase("desenharBotoes")
     def desenharBotoes(self):
         """Desenha os botões na tela com efeitos visuais"""
         h = 1080
@@ -1427,165 +1409,133 @@ class TelaJogo:
             "desfazer_jogada": (h, 500),  # Botão para desfazer jogada - abaixo dos outros
             "finalizar_jogada": (20, 50+off)  # Botão para finalizar jogada - mais à esquerda
         }
+        acoes = {
+            "comprar_pedras": self.clickComprarPedras,
+            "comprar_carta": self.clickComprarCarta,
+            "reservar_carta": self.clickReservarCarta,
+            "oferta_de_troca": self.clickOfertaDeTroca,
+            "desfazer_jogada": self.clickDesfazerJogada,
+            "finalizar_jogada": self.clickFinalizarJogada,
+        }
         
         for nome, img in self.botoes.items():
             if nome in botoes_pos:
                 x, y = botoes_pos[nome]
-                self.canvas.create_image(x, y, image=img, anchor=NW, tags=f"botao_{nome}")
+                self.cena.imagem(f"botao_{nome}", x, y, camada="botoes", image=img, anchor=NW)
                 
-                # Configura cursor e efeitos de clique
-                self.configurar_cursor_clicavel(f"botao_{nome}")
-                
-                if nome == "comprar_pedras":
-                    self.canvas.tag_bind(f"botao_{nome}", "<Button-1>", 
-                                       lambda event: [self.aplicar_efeito_clique_botao("comprar_pedras"), self.clickComprarPedras()])
-                elif nome == "comprar_carta":
-                    self.canvas.tag_bind(f"botao_{nome}", "<Button-1>", 
-                                       lambda event: [self.aplicar_efeito_clique_botao("comprar_carta"), self.clickComprarCarta()])
-                elif nome == "reservar_carta":
-                    self.canvas.tag_bind(f"botao_{nome}", "<Button-1>", 
-                                       lambda event: [self.aplicar_efeito_clique_botao("reservar_carta"), self.clickReservarCarta()])
-                elif nome == "oferta_de_troca":
-                    self.canvas.tag_bind(f"botao_{nome}", "<Button-1>", 
-                                       lambda event: [self.aplicar_efeito_clique_botao("oferta_de_troca"), self.clickOfertaDeTroca()])
-                elif nome == "desfazer_jogada":
-                    self.canvas.tag_bind(f"botao_{nome}", "<Button-1>", 
-                                       lambda event: [self.aplicar_efeito_clique_botao("desfazer_jogada"), self.clickDesfazerJogada()])
-                elif nome == "finalizar_jogada":
-                    self.canvas.tag_bind(f"botao_{nome}", "<Button-1>", 
-                                       lambda event: [self.aplicar_efeito_clique_botao("finalizar_jogada"), self.clickFinalizarJogada()])
+                # Clique com efeito visual; o despachante cuida do cursor
+                acao = acoes[nome]
+                self.despachante.registrar(f"botao_{nome}", clique=lambda nome=nome, acao=acao: [self.aplicar_efeito_clique_botao(nome), acao()])
+                self.despachante.habilitar(f"botao_{nome}")
         
         # Desenha o botão de settings no canto superior direito
         if "settings" in self.botoes:
             x_settings = self.WINDOW_WIDTH - 80  # 80 pixels da borda direita
             y_settings = 20  # 20 pixels do topo
-            self.canvas.create_image(x_settings, y_settings, image=self.botoes["settings"], anchor=NW, tags="botao_settings")
+            self.cena.imagem("botao_settings", x_settings, y_settings, camada="botoes", image=self.botoes["settings"], anchor=NW)
             
-            # Configura cursor e clique
-            self.configurar_cursor_clicavel("botao_settings")
-            self.canvas.tag_bind("botao_settings", "<Button-1>", 
-                               lambda event: [self.aplicar_efeito_clique_botao("settings"), self.abrirMenuSettings()])
+            # Configura o clique
+            self.despachante.registrar("botao_settings", clique=lambda: [self.aplicar_efeito_clique_botao("settings"), self.abrirMenuSettings()])
+            self.despachante.habilitar("botao_settings")
 
+    @aposRedesenho
     def habilitarBotaoComprarCarta(self):
         """Habilita o botão 'Comprar Carta'"""
         if "comprar_carta" in self.botoes:
             img = self.botoes["comprar_carta"]
-            self.canvas.itemconfig("botao_comprar_carta", image=img)
-            self.canvas.tag_bind("botao_comprar_carta", "<Button-1>", lambda event: self.clickComprarCarta())
+            self.cena.configurar("botao_comprar_carta", image=img)
+            self.despachante.habilitar("botao_comprar_carta")
 
+    @aposRedesenho
     def desabilitarBotaoComprarCarta(self):
         """Desabilita o botão 'Comprar Carta'"""
         if "comprar_carta" in self.botoes:
-            pil_img = Image.open("./resources/botoes/comprar_carta.png").resize((150, 100), Image.Resampling.LANCZOS).convert("RGBA")
-            alpha = pil_img.split()[3]
-            alpha = alpha.point(lambda p: int(p * 0.5))
-            pil_img.putalpha(alpha)
-            img = ImageTk.PhotoImage(pil_img)
-            self.canvas.itemconfig("botao_comprar_carta", image=img)
-            self.canvas.tag_unbind("botao_comprar_carta", "<Button-1>")
-            self.botoes["comprar_carta_disabled"] = img
+            img = self.spriteBotao("comprar_carta", "transparente")
+            self.cena.configurar("botao_comprar_carta", image=img)
+            self.despachante.desabilitar("botao_comprar_carta")
 
+    @aposRedesenho
     def habilitarBotaoComprarPedras(self):
         """Habilita o botão 'Comprar Pedras'"""
         if "comprar_pedras" in self.botoes:
             img = self.botoes["comprar_pedras"]
-            self.canvas.itemconfig("botao_comprar_pedras", image=img)
-            self.canvas.tag_bind("botao_comprar_pedras", "<Button-1>", lambda event: self.clickComprarPedras())
+            self.cena.configurar("botao_comprar_pedras", image=img)
+            self.despachante.habilitar("botao_comprar_pedras")
 
+    @aposRedesenho
     def desabilitarBotaoComprarPedras(self):
         """Desabilita o botão 'Comprar Pedras'"""
         if "comprar_pedras" in self.botoes:
-            
-            pil_img = Image.open("./resources/botoes/comprar_pedras.png").resize((150, 100), Image.Resampling.LANCZOS).convert("RGBA")
-            alpha = pil_img.split()[3]
-            alpha = alpha.point(lambda p: int(p * 0.5))
-            pil_img.putalpha(alpha)
-            img = ImageTk.PhotoImage(pil_img)
-            self.canvas.itemconfig("botao_comprar_pedras", image=img)
-            self.canvas.tag_unbind("botao_comprar_pedras", "<Button-1>")
-            self.botoes["comprar_pedras_disabled"] = img
+            img = self.spriteBotao("comprar_pedras", "transparente")
+            self.cena.configurar("botao_comprar_pedras", image=img)
+            self.despachante.desabilitar("botao_comprar_pedras")
 
+    @aposRedesenho
     def habilitarBotaoOfertaDeTroca(self):
         """Habilita o botão 'Oferta de Troca'"""
         if "oferta_de_troca" in self.botoes:
             img = self.botoes["oferta_de_troca"]
-            self.canvas.itemconfig("botao_oferta_de_troca", image=img)
-            self.canvas.tag_bind("botao_oferta_de_troca", "<Button-1>", lambda event: self.clickOfertaDeTroca())
+            self.cena.configurar("botao_oferta_de_troca", image=img)
+            self.despachante.habilitar("botao_oferta_de_troca")
 
+    @aposRedesenho
     def desabilitarBotaoOfertaDeTroca(self):
         """Desabilita o botão 'Oferta de Troca'"""
         if "oferta_de_troca" in self.botoes:
-            
-            pil_img = Image.open("./resources/botoes/oferta_de_troca.png").resize((150, 100), Image.Resampling.LANCZOS).convert("RGBA")
-            alpha = pil_img.split()[3]
-            alpha = alpha.point(lambda p: int(p * 0.5))
-            pil_img.putalpha(alpha)
-            img = ImageTk.PhotoImage(pil_img)
-            self.canvas.itemconfig("botao_oferta_de_troca", image=img)
-            self.canvas.tag_unbind("botao_oferta_de_troca", "<Button-1>")
-            self.botoes["oferta_de_troca_disabled"] = img
+            img = self.spriteBotao("oferta_de_troca", "transparente")
+            self.cena.configurar("botao_oferta_de_troca", image=img)
+            self.despachante.desabilitar("botao_oferta_de_troca")
 
+    @aposRedesenho
     def habilitarReservarCarta(self):
         """Habilita o botão 'Reservar Carta'"""
         if "reservar_carta" in self.botoes:
             img = self.botoes["reservar_carta"]
-            self.canvas.itemconfig("botao_reservar_carta", image=img)
-            self.canvas.tag_bind("botao_reservar_carta", "<Button-1>", lambda event: self.clickReservarCarta())
+            self.cena.configurar("botao_reservar_carta", image=img)
+            self.despachante.habilitar("botao_reservar_carta")
     
+    @aposRedesenho
     def desabilitarReservarCarta(self):
         """Desabilita o botão 'Reservar Carta'"""
         if "reservar_carta" in self.botoes:
-            
-            pil_img = Image.open("./resources/botoes/reservar_carta.png").resize((150, 100), Image.Resampling.LANCZOS).convert("RGBA")
-            alpha = pil_img.split()[3]
-            alpha = alpha.point(lambda p: int(p * 0.5))
-            pil_img.putalpha(alpha)
-            img = ImageTk.PhotoImage(pil_img)
-            self.canvas.itemconfig("botao_reservar_carta", image=img)
-            self.canvas.tag_unbind("botao_reservar_carta", "<Button-1>")
-            self.botoes["reservar_carta_disabled"] = img
+            img = self.spriteBotao("reservar_carta", "transparente")
+            self.cena.configurar("botao_reservar_carta", image=img)
+            self.despachante.desabilitar("botao_reservar_carta")
 
+    @aposRedesenho
     def habilitarDesfazerJogada(self):
         """Habilita o botão 'Desfazer Jogada'"""
         if "desfazer_jogada" in self.botoes:
             img = self.botoes["desfazer_jogada"]
-            self.canvas.itemconfig("botao_desfazer_jogada", image=img)
-            self.canvas.tag_bind("botao_desfazer_jogada", "<Button-1>", lambda event: self.clickDesfazerJogada())
+            self.cena.configurar("botao_desfazer_jogada", image=img)
+            self.despachante.habilitar("botao_desfazer_jogada")
     
+    @aposRedesenho
     def desabilitarBotaoDesfazerJogada(self):
         """Desabilita o botão 'Desfazer Jogada'"""
         if "desfazer_jogada" in self.botoes:
-            
-            pil_img = Image.open("./resources/botoes/desfazer_jogada.png").resize((150, 80), Image.Resampling.LANCZOS).convert("RGBA")
-            alpha = pil_img.split()[3]
-            alpha = alpha.point(lambda p: int(p * 0.5))
-            pil_img.putalpha(alpha)
-            img = ImageTk.PhotoImage(pil_img)
-            self.canvas.itemconfig("botao_desfazer_jogada", image=img)
-            self.canvas.tag_unbind("botao_desfazer_jogada", "<Button-1>")
-            self.botoes["desfazer_jogada_disabled"] = img
+            img = self.spriteBotao("desfazer_jogada", "transparente")
+            self.cena.configurar("botao_desfazer_jogada", image=img)
+            self.despachante.desabilitar("botao_desfazer_jogada")
 
+    @aposRedesenho
     def habilitarBotaoFinalizarJogada(self):
         """Habilita o botão 'Finalizar Jogada'"""
         if "finalizar_jogada" in self.botoes:
             img = self.botoes["finalizar_jogada"]
-            self.canvas.itemconfig("botao_finalizar_jogada", image=img)
-            self.canvas.tag_bind("botao_finalizar_jogada", "<Button-1>", lambda event: self.clickFinalizarJogada())
+            self.cena.configurar("botao_finalizar_jogada", image=img)
+            self.despachante.habilitar("botao_finalizar_jogada")
 
+    @aposRedesenho
     def desabilitarBotaoFinalizarJogada(self):
         """Desabilita o botão 'Finalizar Jogada'"""
         if "finalizar_jogada" in self.botoes:
-            
-            pil_img = Image.open("./resources/botoes/finalizar_jogada.png").resize((180, 90), Image.Resampling.LANCZOS).convert("RGBA")  # Ajustado para novo tamanho
-            alpha = pil_img.split()[3]
-            alpha = alpha.point(lambda p: int(p * 0.5))
-            pil_img.putalpha(alpha)
-            img = ImageTk.PhotoImage(pil_img)
-            self.canvas.itemconfig("botao_finalizar_jogada", image=img)
-            self.canvas.tag_unbind("botao_finalizar_jogada", "<Button-1>")
-            self.botoes["finalizar_jogada_disabled"] = img
+            img = self.spriteBotao("finalizar_jogada", "transparente")
+            self.cena.configurar("botao_finalizar_jogada", image=img)
+            self.despachante.desabilitar("botao_finalizar_jogada")
 
     # Métodos para habilitar/desabilitar cartas
+    @aposRedesenho
     def habilitarCartas(self):
         """Habilita todas as cartas no tabuleiro e cartas reservadas com efeitos visuais"""
         self.cartas_habilitadas = True
@@ -1595,30 +1545,22 @@ class TelaJogo:
                 idx = nivel_idx * 4 + i
                 carta = self.tabuleiro.cartasNoTabuleiro[idx]
                 if carta is not None:
-                    # Configura cursor para cartas clicáveis
-                    self.configurar_cursor_clicavel(f"carta_{nivel.name}_{idx}")
-                    
-                    self.canvas.tag_bind(f"carta_{nivel.name}_{idx}", "<Button-1>", 
-                                       lambda event, idx=idx: self.clickCarta(idx))
+                    self.despachante.habilitar(f"carta_{nivel.name}_{idx}")
                     # Restaura a imagem normal da carta
                     img_tk = self.get_carta_img(carta)
                     if img_tk:
-                        self.canvas.itemconfig(f"carta_{nivel.name}_{idx}", image=img_tk)
+                        self.cena.configurar(f"carta_{nivel.name}_{idx}", image=img_tk)
         
         # Habilita também as cartas reservadas se não estiver no modo de reserva
         if not self.modo_reserva:
             cartas_reservadas = self.tabuleiro.pegarJogadorLocal().pegarCartasReservadas()
             for i, carta in enumerate(cartas_reservadas):
-                # Configura cursor para cartas reservadas clicáveis
-                self.configurar_cursor_clicavel(f"carta_reservada_{i}")
-                self.canvas.tag_bind(f"carta_reservada_{i}", "<Button-1>", 
-                                   lambda event, idx=i: self.clickCartaReservada(idx))
+                self.despachante.habilitar(f"carta_reservada_{i}")
 
+    @aposRedesenho
     def desabilitarCartas(self):
         """Desabilita todas as cartas no tabuleiro e cartas reservadas, aplicando transparência quando não for o turno"""
         self.cartas_habilitadas = False
-        if not hasattr(self, 'carta_imgs_transparentes'):
-            self.carta_imgs_transparentes = {}
         niveis = [NiveisEnum.NIVEL1, NiveisEnum.NIVEL2, NiveisEnum.NIVEL3]
         for nivel_idx, nivel in enumerate(niveis):
             for i in range(4):
@@ -1626,115 +1568,66 @@ class TelaJogo:
                 carta = self.tabuleiro.cartasNoTabuleiro[idx]
                 if carta is not None:
                     # Remove cursor pointer e eventos de clique
-                    self.canvas.tag_unbind(f"carta_{nivel.name}_{idx}", "<Button-1>")
-                    self.canvas.tag_unbind(f"carta_{nivel.name}_{idx}", "<Enter>")
-                    self.canvas.tag_unbind(f"carta_{nivel.name}_{idx}", "<Leave>")
+                    self.despachante.desabilitar(f"carta_{nivel.name}_{idx}")
                     
                     # Aplica transparência apenas se não for o turno do jogador
                     if not self.tabuleiro.pegarJogadorLocal().jogadorEmTurno:
                         # Aplica transparência à carta
                         try:
-                            # Recarrega a imagem e aplica transparência
-                            diretorios_cartas = [
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-1"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-2"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-3"), False),
-                                (Path("./resources/cartas/cartas-tabuleiro/cartas-de-roubo"), True),
-                            ]
-                            for diretorio, is_roubo in diretorios_cartas:
-                                for carta_img in diretorio.glob("*.png"):
-                                    nome = carta_img.stem
-                                    id_carta, pontos, pedras, cartaDeRoubo, bonus, habilitada = self.extrair_dados_carta(carta_img, None, is_roubo)
-                                    if (carta.pontos == pontos and 
-                                        carta.pedras == pedras and 
-                                        carta.cartaDeRoubo == cartaDeRoubo and 
-                                        carta.bonus == bonus):
-                                        pil_img = Image.open(carta_img).resize((self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), Image.Resampling.LANCZOS).convert("RGBA")
-                                        alpha = pil_img.split()[3]
-                                        alpha = alpha.point(lambda p: int(p * 0.5))
-                                        pil_img.putalpha(alpha)
-                                        img_transp = ImageTk.PhotoImage(pil_img)
-                                        # GUARDA REFERÊNCIA
-                                        self.carta_imgs_transparentes[carta.id] = img_transp
-                                        self.canvas.itemconfig(f"carta_{nivel.name}_{idx}", image=img_transp)
-                                        break
-                                else:
-                                    continue
-                                break
+                            # Usa a variante transparente já em cache (o cache guarda a referência)
+                            img_transp = self.spriteCarta(carta, "transparente")
+                            if img_transp is not None:
+                                self.cena.configurar(f"carta_{nivel.name}_{idx}", image=img_transp)
                         except Exception as e:
                             print(f"Erro ao aplicar transparência na carta: {e}")
                     else:
                         # Se for o turno do jogador, garante que a imagem normal está sendo usada
                         img_tk = self.get_carta_img(carta)
                         if img_tk:
-                            self.canvas.itemconfig(f"carta_{nivel.name}_{idx}", image=img_tk)
+                            self.cena.configurar(f"carta_{nivel.name}_{idx}", image=img_tk)
         
         # Desabilita também as cartas reservadas
         cartas_reservadas = self.tabuleiro.pegarJogadorLocal().pegarCartasReservadas()
         for i, carta in enumerate(cartas_reservadas):
             # Remove cursor pointer e eventos de clique
-            self.canvas.tag_unbind(f"carta_reservada_{i}", "<Button-1>")
-            self.canvas.tag_unbind(f"carta_reservada_{i}", "<Enter>")
-            self.canvas.tag_unbind(f"carta_reservada_{i}", "<Leave>")
+            self.despachante.desabilitar(f"carta_reservada_{i}")
             
             # Aplica transparência apenas se não for o turno do jogador
             if not self.tabuleiro.pegarJogadorLocal().jogadorEmTurno:
                 try:
-                    # Recarrega a imagem e aplica transparência
-                    diretorios_cartas = [
-                        (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-1"), False),
-                        (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-2"), False),
-                        (Path("./resources/cartas/cartas-tabuleiro/cartas-nivel-3"), False),
-                        (Path("./resources/cartas/cartas-tabuleiro/cartas-de-roubo"), True),
-                    ]
-                    for diretorio, is_roubo in diretorios_cartas:
-                        for carta_img in diretorio.glob("*.png"):
-                            nome = carta_img.stem
-                            id_carta, pontos, pedras, cartaDeRoubo, bonus, habilitada = self.extrair_dados_carta(carta_img, None, is_roubo)
-                            if (carta.pontos == pontos and 
-                                carta.pedras == pedras and 
-                                carta.cartaDeRoubo == cartaDeRoubo and 
-                                carta.bonus == bonus):
-                                pil_img = Image.open(carta_img).resize((self.CARD_WIDTH * 10, self.CARD_HEIGHT * 10), Image.Resampling.LANCZOS).convert("RGBA")
-                                alpha = pil_img.split()[3]
-                                alpha = alpha.point(lambda p: int(p * 0.5))
-                                pil_img.putalpha(alpha)
-                                img_transp = ImageTk.PhotoImage(pil_img)
-                                # GUARDA REFERÊNCIA
-                                self.carta_imgs_transparentes[carta.id] = img_transp
-                                self.canvas.itemconfig(f"carta_reservada_{i}", image=img_transp)
-                                break
-                        else:
-                            continue
-                        break
+                    # Usa a variante transparente já em cache (o cache guarda a referência)
+                    img_transp = self.spriteCarta(carta, "transparente")
+                    if img_transp is not None:
+                        self.cena.configurar(f"carta_reservada_{i}", image=img_transp)
                 except Exception as e:
                     print(f"Erro ao aplicar transparência na carta reservada: {e}")
             else:
                 # Se for o turno do jogador, garante que a imagem normal está sendo usada
                 img_tk = self.get_carta_img(carta)
                 if img_tk:
-                    self.canvas.itemconfig(f"carta_reservada_{i}", image=img_tk)
+                    self.cena.configurar(f"carta_reservada_{i}", image=img_tk)
 
     # Métodos para habilitar/desabilitar pedras
+    @aposRedesenho
     def habilitarPedras(self):
         """Habilita todas as pedras no tabuleiro"""
         self.pedras_habilitadas = True
         for pedra in self.tabuleiro.pedrasNoTabuleiro.keys():
-            self.canvas.tag_bind(f"pedra_{pedra.name}", "<Button-1>", lambda event, pedra=pedra: self.clickPedra(pedra))
+            self.despachante.habilitar(f"pedra_{pedra.name}")
             # Restaura a imagem normal da pedra
             if pedra in self.pedras:
-                self.canvas.itemconfig(f"pedra_{pedra.name}", image=self.pedras[pedra])
+                self.cena.configurar(f"pedra_{pedra.name}", image=self.pedras[pedra])
             else:
                 # Se a imagem original não está disponível, recarrega
                 try:
                     caminho = f"./resources/pedras/{pedra.name.lower()}.png"
-                    img = Image.open(caminho).resize((self.GEM_SIZE, self.GEM_SIZE), Image.Resampling.LANCZOS)
-                    img_tk = ImageTk.PhotoImage(img)
+                    img_tk = self.spriteArquivo(caminho, (self.GEM_SIZE, self.GEM_SIZE))
                     self.pedras[pedra] = img_tk
-                    self.canvas.itemconfig(f"pedra_{pedra.name}", image=img_tk)
+                    self.cena.configurar(f"pedra_{pedra.name}", image=img_tk)
                 except Exception as e:
                     print(f"Erro ao recarregar imagem da pedra {pedra.name}: {e}")
 
+    @aposRedesenho
     def desabilitarPedras(self):
         """Desabilita todas as pedras no tabuleiro, aplicando transparência quando não for o turno"""
         self.pedras_habilitadas = False
@@ -1745,34 +1638,22 @@ class TelaJogo:
             self.remover_efeito_selecao_pedra(pedra)
         self.pedras_selecionadas_visuais.clear()
         
-        # Cria dicionário para imagens transparentes se não existir
-        if not hasattr(self, 'pedras_transparentes'):
-            self.pedras_transparentes = {}
-        
         for pedra in self.tabuleiro.pedrasNoTabuleiro.keys():
-            self.canvas.tag_unbind(f"pedra_{pedra.name}", "<Button-1>")
-            # Remove cursor pointer
-            self.canvas.tag_unbind(f"pedra_{pedra.name}", "<Enter>")
-            self.canvas.tag_unbind(f"pedra_{pedra.name}", "<Leave>")
+            # Remove o clique e o cursor pointer
+            self.despachante.desabilitar(f"pedra_{pedra.name}")
             
             # Aplica transparência apenas se não for o turno do jogador
             if not self.tabuleiro.pegarJogadorLocal().jogadorEmTurno:
                 caminho = f"./resources/pedras/{pedra.name.lower()}.png"
                 try:
-                    pil_img = Image.open(caminho).resize((self.GEM_SIZE, self.GEM_SIZE), Image.Resampling.LANCZOS).convert("RGBA")
-                    alpha = pil_img.split()[3]
-                    alpha = alpha.point(lambda p: int(p * 0.5))
-                    pil_img.putalpha(alpha)
-                    img_transp = ImageTk.PhotoImage(pil_img)
-                    self.canvas.itemconfig(f"pedra_{pedra.name}", image=img_transp)
-                    # Mantém referência para não ser coletado (em dicionário separado)
-                    self.pedras_transparentes[pedra] = img_transp
+                    img_transp = self.spriteArquivo(caminho, (self.GEM_SIZE, self.GEM_SIZE), "transparente")
+                    self.cena.configurar(f"pedra_{pedra.name}", image=img_transp)
                 except Exception as e:
                     print(f"Erro ao aplicar transparência na pedra {pedra.name}: {e}")
             else:
                 # Se for o turno do jogador, garante que a imagem normal está sendo usada
                 if pedra in self.pedras:
-                    self.canvas.itemconfig(f"pedra_{pedra.name}", image=self.pedras[pedra])
+                    self.cena.configurar(f"pedra_{pedra.name}", image=self.pedras[pedra])
 
     def avaliarVencedor(self):
         pontos1 = self.tabuleiro.pegarJogadorLocal().pegarPontuacaoJogador()
@@ -1849,6 +1730,7 @@ class TelaJogo:
             self.habilitarBotaoOfertaDeTroca()
             self.habilitarBotaoReservarCarta()
     
+    @medirFase("desenharPedras")
     def desenharPedras(self):
         GEM_SIZE = 50
         GEM_VERTICAL_GAP = 60
@@ -1860,136 +1742,114 @@ class TelaJogo:
                 y_pos = gems_start_y + (i * GEM_VERTICAL_GAP)
                 
                 # Desenha apenas uma pedra (sem efeito de pilha)
-                self.canvas.create_image(
+                self.cena.imagem(
+                    f"pedra_{pedra.name}",  # Use PedraEnum name for the tag
                     self.GEMS_X,
                     y_pos,
+                    camada="pedras",
                     image=self.pedras[pedra],  # Access the ImageTk.PhotoImage using PedraEnum as key
-                    anchor='nw',
-                    tags=f"pedra_{pedra.name}"  # Use PedraEnum name for the tag
+                    anchor='nw'
                 )
                 
+                self.despachante.registrar(f"pedra_{pedra.name}", clique=lambda pedra=pedra: self.clickPedra(pedra))
                 # Só habilita clique se for o turno do jogador, as pedras estiverem habilitadas E não for ouro
                 if (self.tabuleiro.pegarJogadorLocal().jogadorEmTurno and 
                     self.pedras_habilitadas and 
                     pedra != PedrasEnum.OURO):  # Ouro nunca pode ser comprado diretamente
-                    
-                    # Configura cursor para pedras clicáveis
-                    self.configurar_cursor_clicavel(f"pedra_{pedra.name}")
-                    
-                    self.canvas.tag_bind(f"pedra_{pedra.name}", "<Button-1>", 
-                                       lambda event, pedra=pedra: self.clickPedra(pedra))
+                    self.despachante.habilitar(f"pedra_{pedra.name}")
                 
                 # Quantity text
-                self.canvas.create_text(
+                self.rotulos.rotulo(
+                    f"qtd_pedra_{pedra.name}",
                     self.GEMS_X + GEM_SIZE + 20,
                     y_pos + GEM_SIZE//2,
-                    text=str(qtd),
-                    fill='white',
-                    font=('Aclonica', 14)
+                    str(qtd),
+                    FONTE_QTD_PEDRA,
+                    camada="pedras"
                 )
 
+    @medirFase("desenharInfosJogadores")
     def desenharInfosJogadores(self):
-        # Carregue as imagens de fundo (só uma vez)
-        if not hasattr(self, "bg_jogador_local"):
-            img_local = Image.open("./resources/extra/sombra_inferior_esquerda.png").resize((self.PLAYER_INFO_WIDTH, 150), Image.Resampling.LANCZOS)  # Aumentado de 120 para 150
-            self.bg_jogador_local = ImageTk.PhotoImage(img_local)
-            img_remoto = Image.open("./resources/extra/sombra_superior_esquerda.png").resize((self.PLAYER_INFO_WIDTH, 150), Image.Resampling.LANCZOS)  # Aumentado de 120 para 150
-            self.bg_jogador_remoto = ImageTk.PhotoImage(img_remoto)
-
-        # Cache para mini pedras
-        if not hasattr(self, "mini_pedras"):
-            self.mini_pedras = {}
-
-        pedra_size = 32
+        # As sombras dos painéis fazem parte do fundo estático (desenharFundo)
+        pedra_size = self.MINI_GEM_SIZE
         gap = 2
 
         # --- Jogador Local (embaixo SEMPRE) ---
         y_base_local = self.WINDOW_HEIGHT
-        self.canvas.create_image(
-            self.PLAYER_INFO_X,
-            y_base_local,
-            image=self.bg_jogador_local,
-            anchor="sw"
-        )
-        sombra_altura = 150  # Aumentado de 120 para 150
+        sombra_altura = self.PLAYER_INFO_HEIGHT
         y_nome = y_base_local - sombra_altura + 10  # Movido para cima (era 15)
         y_pontos = y_nome + 25
         y_pedra = y_pontos + 30
 
         jogador_local = self.tabuleiro.pegarJogadorLocal()
-        self.canvas.create_text(
+        self.rotulos.rotulo(
+            "info_local_nome",
             self.PLAYER_INFO_X + 15,
             y_nome,
-            text=f"{jogador_local.pegarNome()} {'(Em Turno)' if jogador_local.jogadorEmTurno else ''}",
-            fill="white",
-            anchor="nw",
-            font=("Arial", 14, "bold" if jogador_local.jogadorEmTurno else "normal")
+            f"{jogador_local.pegarNome()} {'(Em Turno)' if jogador_local.jogadorEmTurno else ''}",
+            FONTE_NOME_TURNO if jogador_local.jogadorEmTurno else FONTE_NOME,
+            camada="jogadores",
+            anchor="nw"
         )
-        self.canvas.create_text(
+        self.rotulos.rotulo(
+            "info_local_pontos",
             self.PLAYER_INFO_X + 15,
             y_pontos,
-            text=f"Pontos: {jogador_local.pegarPontuacaoJogador()}",
-            fill="white",
-            anchor="nw",
-            font=("Arial", 12)
+            f"Pontos: {jogador_local.pegarPontuacaoJogador()}",
+            FONTE_PONTOS,
+            camada="jogadores",
+            anchor="nw"
         )
         pedras = jogador_local.pegarPedras()
         x_pedra = self.PLAYER_INFO_X + 15
         for pedra_enum, qtd in pedras.items():
             if qtd > 0:
-                if pedra_enum not in self.mini_pedras:
-                    img = Image.open(f"./resources/pedras/{pedra_enum.name.lower()}.png").resize((pedra_size, pedra_size), Image.Resampling.LANCZOS)
-                    self.mini_pedras[pedra_enum] = ImageTk.PhotoImage(img)
-                self.canvas.create_image(x_pedra, y_pedra, image=self.mini_pedras[pedra_enum], anchor="nw")
-                self.canvas.create_text(x_pedra + pedra_size // 2, y_pedra + pedra_size + 4, text=str(qtd), fill="white", font=("Arial", 10), anchor="n")
+                mini_pedra = self.spriteArquivo(f"./resources/pedras/{pedra_enum.name.lower()}.png", (pedra_size, pedra_size))
+                self.cena.imagem(f"info_local_pedra_{pedra_enum.name}", x_pedra, y_pedra, camada="jogadores", image=mini_pedra, anchor="nw")
+                self.rotulos.rotulo(f"info_local_qtd_{pedra_enum.name}", x_pedra + pedra_size // 2, y_pedra + pedra_size + 4, str(qtd), FONTE_QTD_MINI, camada="jogadores", anchor="n")
                 x_pedra += pedra_size + gap
 
         # --- Jogador Remoto (em cima SEMPRE) ---
         y_base_remoto = 0
-        self.canvas.create_image(
-            self.PLAYER_INFO_X,
-            y_base_remoto,
-            image=self.bg_jogador_remoto,
-            anchor="nw"
-        )
         y_nome_r = y_base_remoto + 10  # Movido para cima (era 15)
         y_pontos_r = y_nome_r + 25
         y_pedra_r = y_pontos_r + 30
 
         jogador_remoto = self.tabuleiro.jogadorRemoto
-        self.canvas.create_text(
+        self.rotulos.rotulo(
+            "info_remoto_nome",
             self.PLAYER_INFO_X + 15,
             y_nome_r,
-            text=f"{jogador_remoto.pegarNome()} {'(Em Turno)' if jogador_remoto.jogadorEmTurno else ''}",
-            fill="white",
-            anchor="nw",
-            font=("Arial", 14, "bold" if jogador_remoto.jogadorEmTurno else "normal")
+            f"{jogador_remoto.pegarNome()} {'(Em Turno)' if jogador_remoto.jogadorEmTurno else ''}",
+            FONTE_NOME_TURNO if jogador_remoto.jogadorEmTurno else FONTE_NOME,
+            camada="jogadores",
+            anchor="nw"
         )
-        self.canvas.create_text(
+        self.rotulos.rotulo(
+            "info_remoto_pontos",
             self.PLAYER_INFO_X + 15,
             y_pontos_r,
-            text=f"Pontos: {jogador_remoto.pegarPontuacaoJogador()}",
-            fill="white",
-            anchor="nw",
-            font=("Arial", 12)
+            f"Pontos: {jogador_remoto.pegarPontuacaoJogador()}",
+            FONTE_PONTOS,
+            camada="jogadores",
+            anchor="nw"
         )
         pedras = jogador_remoto.pegarPedras()
         x_pedra = self.PLAYER_INFO_X + 15
         for pedra_enum, qtd in pedras.items():
             if qtd > 0:
-                if pedra_enum not in self.mini_pedras:
-                    img = Image.open(f"./resources/pedras/{pedra_enum.name.lower()}.png").resize((pedra_size, pedra_size), Image.Resampling.LANCZOS)
-                    self.mini_pedras[pedra_enum] = ImageTk.PhotoImage(img)
-                self.canvas.create_image(x_pedra, y_pedra_r, image=self.mini_pedras[pedra_enum], anchor="nw")
-                self.canvas.create_text(x_pedra + pedra_size // 2, y_pedra_r + pedra_size + 4, text=str(qtd), fill="white", font=("Arial", 10), anchor="n")
+                mini_pedra = self.spriteArquivo(f"./resources/pedras/{pedra_enum.name.lower()}.png", (pedra_size, pedra_size))
+                self.cena.imagem(f"info_remoto_pedra_{pedra_enum.name}", x_pedra, y_pedra_r, camada="jogadores", image=mini_pedra, anchor="nw")
+                self.rotulos.rotulo(f"info_remoto_qtd_{pedra_enum.name}", x_pedra + pedra_size // 2, y_pedra_r + pedra_size + 4, str(qtd), FONTE_QTD_MINI, camada="jogadores", anchor="n")
                 x_pedra += pedra_size + gap
 
+    @aposRedesenho
     def habilitarBotaoReservarCarta(self):
         """Habilita o botão 'Reservar Carta'"""
         if "reservar_carta" in self.botoes:
             img = self.botoes["reservar_carta"]
-            self.canvas.itemconfig("botao_reservar_carta", image=img)
-            self.canvas.tag_bind("botao_reservar_carta", "<Button-1>", lambda event: self.clickReservarCarta())
+            self.cena.configurar("botao_reservar_carta", image=img)
+            self.despachante.habilitar("botao_reservar_carta")
 
     def comprarCartaReservada(self, indice_carta_reservada: int):
         """Compra uma carta da reserva do jogador"""
@@ -2037,7 +1897,7 @@ class TelaJogo:
                     bonus = carta.pegarBonus()
                     self.tabuleiro.pegarJogadorLocal().adicionarBonus(bonus)
                 
-                self.desenharTabuleiro()
+                self.agendarRedesenho()
                 return True
             else:
                 self.notificarJogadaInvalida("Você não tem pedras suficientes para comprar esta carta.")
@@ -2079,10 +1939,10 @@ class TelaJogo:
                 if self.tabuleiro.pedrasNoTabuleiro[PedrasEnum.OURO] > 0:
                     self.tabuleiro.pegarJogadorLocal().adicionarPedraNaMao(PedrasEnum.OURO, 1)
                     self.tabuleiro.pedrasNoTabuleiro[PedrasEnum.OURO] -= 1
-                    messagebox.showinfo("Pedra de Ouro", "Você recebeu uma pedra de ouro por reservar a carta!")
+                    self.notificacoes.info("Pedra de Ouro", "Você recebeu uma pedra de ouro por reservar a carta!")
                 
                 self.cartaSelecionada = None
-                self.desenharTabuleiro()
+                self.agendarRedesenho()
             except ValueError as e:
                 print(f"Erro ao encontrar carta no tabuleiro: {e}")
                 self.notificarJogadaInvalida("Erro ao reservar carta: carta não encontrada no tabuleiro.")
@@ -2155,7 +2015,7 @@ class TelaJogo:
             return
         
         self.cartaSelecionada = None
-        self.desenharTabuleiro()
+        self.agendarRedesenho()
 
     def realizarCompraPedras(self):
         """Executa a compra das pedras selecionadas"""
@@ -2188,7 +2048,7 @@ class TelaJogo:
         for pedra in self.pedrasSelecionadas:
             self.tabuleiro.pegarJogadorLocal().adicionarPedraNaMao(pedra, 1)
         
-        self.desenharTabuleiro()
+        self.agendarRedesenho()
 
     def clickFinalizarJogada(self):
         if len(self.pedrasSelecionadas) >= 2:
@@ -2219,15 +2079,15 @@ class TelaJogo:
                 
                 # Determina qual jogador atingiu 15 pontos primeiro
                 if pontos_local >= PONTOS_MINIMOS_VITORIA and pontos_remoto < PONTOS_MINIMOS_VITORIA:
-                    messagebox.showinfo("Última Chance!", 
-                                      f"Você atingiu {pontos_local} pontos! O oponente tem uma última chance de tentar superar sua pontuação.")
+                    self.notificacoes.aviso("Última Chance!", 
+                                      f"Você atingiu {pontos_local} pontos! O oponente tem uma última chance de tentar superar sua pontuação.", DURACAO_LONGA_MS)
                 elif pontos_remoto >= PONTOS_MINIMOS_VITORIA and pontos_local < PONTOS_MINIMOS_VITORIA:
-                    messagebox.showinfo("Última Chance!", 
-                                      f"O oponente atingiu {pontos_remoto} pontos! Você tem uma última chance de tentar superar a pontuação dele.")
+                    self.notificacoes.aviso("Última Chance!", 
+                                      f"O oponente atingiu {pontos_remoto} pontos! Você tem uma última chance de tentar superar a pontuação dele.", DURACAO_LONGA_MS)
                 else:
                     # Ambos atingiram 15 pontos simultaneamente
-                    messagebox.showinfo("Última Chance!", 
-                                      f"Ambos os jogadores atingiram {min(pontos_local, pontos_remoto)} pontos! Esta é a última rodada para definir o vencedor.")
+                    self.notificacoes.aviso("Última Chance!", 
+                                      f"Ambos os jogadores atingiram {min(pontos_local, pontos_remoto)} pontos! Esta é a última rodada para definir o vencedor.", DURACAO_LONGA_MS)
         
         # Se já está na última partida, avalia o vencedor
         if self.tabuleiro.ehUltimaPartida():
@@ -2250,15 +2110,18 @@ class TelaJogo:
         self.atualizarTabuleiro(self.tabuleiro)
         self.finalizar_jogada_callback(self.tabuleiro, status='next')
 
+    @medirFase("desenharCartasReservadas")
     def desenharCartasReservadas(self):
         """Desenha as cartas reservadas do jogador local na área específica"""
         cartas_reservadas = self.tabuleiro.pegarJogadorLocal().pegarCartasReservadas()
         
         if cartas_reservadas:
             # Label "Reservadas" - posicionado muito abaixo, fora da tela visível
-            self.canvas.create_text(
+            self.cena.texto(
+                "rotulo_reservadas",
                 self.WINDOW_WIDTH // 2,
                 self.WINDOW_HEIGHT + 30,  # Fora da tela visível
+                camada="reservadas",
                 text="CARTAS RESERVADAS",
                 fill="white",
                 font=("Arial", 12, "bold"),
@@ -2280,36 +2143,33 @@ class TelaJogo:
                 img_tk = self.get_carta_img(carta)
                 if img_tk:
                     # Desenha a carta completa (será cortada pela borda da tela)
-                    self.canvas.create_image(
+                    self.cena.imagem(
+                        f"carta_reservada_{i}",
                         x, y, 
+                        camada="reservadas",
                         image=img_tk, 
-                        anchor='s',
-                        tags=f"carta_reservada_{i}"
+                        anchor='s'
                     )
                     
-                    # Adiciona clique para comprar carta reservada (só quando estiver no modo de compra)
+                    # Efeito de hover sempre; clique para comprar só quando estiver no modo de compra
+                    self.despachante.registrar(
+                        f"carta_reservada_{i}",
+                        clique=lambda idx=i: self.clickCartaReservada(idx),
+                        entrar=lambda idx=i, x_pos=x, y_pos=y: self.hover_carta_reservada(idx, x_pos, y_pos, True),
+                        sair=lambda idx=i, x_pos=x, y_pos=y: self.hover_carta_reservada(idx, x_pos, y_pos, False)
+                    )
                     if self.cartas_habilitadas and not self.modo_reserva:
-                        # Configura cursor para cartas reservadas clicáveis
-                        self.canvas.tag_bind(f"carta_reservada_{i}", "<Enter>", 
-                                           lambda e, idx=i, x_pos=x, y_pos=y: self.hover_carta_reservada(idx, x_pos, y_pos, True))
-                        self.canvas.tag_bind(f"carta_reservada_{i}", "<Leave>", 
-                                           lambda e, idx=i, x_pos=x, y_pos=y: self.hover_carta_reservada(idx, x_pos, y_pos, False))
-                        self.canvas.tag_bind(f"carta_reservada_{i}", "<Button-1>", lambda event, idx=i: self.clickCartaReservada(idx))
-                    else:
-                        # Se não está habilitada, só adiciona o efeito de hover
-                        self.canvas.tag_bind(f"carta_reservada_{i}", "<Enter>", 
-                                           lambda e, idx=i, x_pos=x, y_pos=y: self.hover_carta_reservada(idx, x_pos, y_pos, True))
-                        self.canvas.tag_bind(f"carta_reservada_{i}", "<Leave>", 
-                                           lambda e, idx=i, x_pos=x, y_pos=y: self.hover_carta_reservada(idx, x_pos, y_pos, False))
+                        self.despachante.habilitar(f"carta_reservada_{i}")
                     
                 else:
                     # Fallback: mostra apenas os pontos
-                    self.canvas.create_text(
+                    self.cena.texto(
+                        f"carta_reservada_{i}_pontos",
                         x, y, 
+                        camada="reservadas",
                         text=str(carta.pontos), 
                         fill="white", 
-                        font=("Arial", 16, "bold"),
-                        tags=f"carta_reservada_{i}"
+                        font=("Arial", 16, "bold")
                     )
         else:
             print("Nenhuma carta reservada para desenhar")
@@ -2319,14 +2179,10 @@ class TelaJogo:
         if entrar:
             # Move a carta para cima quando o mouse entra
             nova_y = y_pos - 50  # Move 50 pixels para cima
-            self.canvas.moveto(f"carta_reservada_{idx}", x_pos, nova_y)
-            # Configura cursor de mão
-            self.canvas.configure(cursor="hand2")
+            self.cena.mover(f"carta_reservada_{idx}", x_pos, nova_y)
         else:
             # Move a carta de volta para a posição original quando o mouse sai
-            self.canvas.moveto(f"carta_reservada_{idx}", x_pos, y_pos)
-            # Restaura cursor normal
-            self.canvas.configure(cursor="arrow")
+            self.cena.mover(f"carta_reservada_{idx}", x_pos, y_pos)
 
     def clickCartaReservada(self, indice_carta_reservada: int):
         """Método chamado quando uma carta reservada é clicada"""
@@ -2337,7 +2193,7 @@ class TelaJogo:
             # Verifica se tem pedras suficientes
             if self.tabuleiro.verificarPedrasSuficientes(carta):
                 self.cartaSelecionada = carta
-                messagebox.showinfo("Carta Reservada Selecionada", f"Carta reservada selecionada para compra! Clique em 'Finalizar Jogada' para confirmar.")
+                self.notificacoes.info("Carta Reservada Selecionada", f"Carta reservada selecionada para compra! Clique em 'Finalizar Jogada' para confirmar.")
                 self.habilitarBotaoFinalizarJogada()
             else:
                 self.notificarJogadaInvalida("Você não tem pedras suficientes para comprar esta carta reservada.")
@@ -2347,65 +2203,33 @@ class TelaJogo:
     def criar_efeito_clique(self, img_original, tipo="botao"):
         """Cria uma versão com efeito de clique (mais escura)"""
         try:
-            if isinstance(img_original, ImageTk.PhotoImage):
-                # Converte de volta para PIL para aplicar efeito
-                pil_img = Image.open(f"./resources/botoes/{tipo}.png").resize((150, 100), Image.Resampling.LANCZOS)
-            else:
-                pil_img = img_original.copy()
-            
-            # Aplica um efeito de escurecimento (multiplica por 0.7)
-            pil_img = pil_img.convert("RGBA")
-            data = pil_img.getdata()
-            new_data = []
-            for item in data:
-                new_data.append((int(item[0] * 0.7), int(item[1] * 0.7), int(item[2] * 0.7), item[3]))
-            pil_img.putdata(new_data)
-            
-            return ImageTk.PhotoImage(pil_img)
+            # A variante escurecida é calculada uma única vez por botão e reaproveitada
+            return self.spriteArquivo(f"./resources/botoes/{tipo}.png", self.tamanhoBotao(tipo), "escurecida")
         except Exception as e:
             print(f"Erro ao criar efeito de clique: {e}")
             return img_original
 
+    @aposRedesenho
     def aplicar_efeito_selecao_pedra(self, pedra_enum):
         """Aplica efeito visual de seleção na pedra"""
         if pedra_enum in self.pedras:
             try:
-                # Carrega a imagem original da pedra
+                # Pedra com brilho aumentado e borda dourada, calculada uma única vez por pedra
                 img_path = f"./resources/pedras/{pedra_enum.name.lower()}.png"
-                pil_img = Image.open(img_path).resize((self.GEM_SIZE, self.GEM_SIZE), Image.Resampling.LANCZOS)
-                
-                # Aplica um efeito de brilho (aumenta o brilho)
-                pil_img = pil_img.convert("RGBA")
-                data = pil_img.getdata()
-                new_data = []
-                for item in data:
-                    r, g, b, a = item
-                    # Aumenta o brilho em 30%
-                    r = min(255, int(r * 1.3))
-                    g = min(255, int(g * 1.3))
-                    b = min(255, int(b * 1.3))
-                    new_data.append((r, g, b, a))
-                pil_img.putdata(new_data)
-                
-                # Adiciona uma borda dourada
-                from PIL import ImageDraw
-                draw = ImageDraw.Draw(pil_img)
-                draw.rectangle([0, 0, self.GEM_SIZE-1, self.GEM_SIZE-1], outline=(255, 215, 0, 255), width=3)
-                
-                img_selecionada = ImageTk.PhotoImage(pil_img)
-                self.efeitos_clique[f"pedra_selecionada_{pedra_enum.name}"] = img_selecionada
+                img_selecionada = self.spriteArquivo(img_path, (self.GEM_SIZE, self.GEM_SIZE), "selecionada")
                 
                 # Atualiza a imagem no canvas
-                self.canvas.itemconfig(f"pedra_{pedra_enum.name}", image=img_selecionada)
+                self.cena.configurar(f"pedra_{pedra_enum.name}", image=img_selecionada)
                 
             except Exception as e:
                 print(f"Erro ao aplicar efeito de seleção na pedra {pedra_enum.name}: {e}")
 
+    @aposRedesenho
     def remover_efeito_selecao_pedra(self, pedra_enum):
         """Remove o efeito visual de seleção da pedra"""
         if pedra_enum in self.pedras:
             # Restaura a imagem original
-            self.canvas.itemconfig(f"pedra_{pedra_enum.name}", image=self.pedras[pedra_enum])
+            self.cena.configurar(f"pedra_{pedra_enum.name}", image=self.pedras[pedra_enum])
 
     def aplicar_efeito_clique_botao(self, nome_botao):
         """Aplica efeito de clique no botão"""
@@ -2413,10 +2237,9 @@ class TelaJogo:
             try:
                 # Cria versão com efeito de clique
                 img_clique = self.criar_efeito_clique(self.botoes[nome_botao], nome_botao)
-                self.efeitos_clique[f"botao_clique_{nome_botao}"] = img_clique
                 
                 # Aplica o efeito
-                self.canvas.itemconfig(f"botao_{nome_botao}", image=img_clique)
+                self.cena.configurar(f"botao_{nome_botao}", image=img_clique)
                 
                 # Remove o efeito após 100ms
                 self.root.after(100, lambda: self.remover_efeito_clique_botao(nome_botao))
@@ -2427,14 +2250,7 @@ class TelaJogo:
     def remover_efeito_clique_botao(self, nome_botao):
         """Remove o efeito de clique do botão"""
         if nome_botao in self.botoes:
-            self.canvas.itemconfig(f"botao_{nome_botao}", image=self.botoes[nome_botao])
-
-    def configurar_cursor_clicavel(self, tag, cursor="hand2"):
-        """Configura o cursor para elementos clicáveis"""
-        # Não configura o cursor para cartas reservadas pois elas já têm efeito de hover
-        if not tag.startswith("carta_reservada_"):
-            self.canvas.tag_bind(tag, "<Enter>", lambda e: self.canvas.configure(cursor=cursor))
-            self.canvas.tag_bind(tag, "<Leave>", lambda e: self.canvas.configure(cursor="arrow"))
+            self.cena.configurar(f"botao_{nome_botao}", image=self.botoes[nome_botao])
 
     def abrirMenuSettings(self):
         """Abre o menu de configurações"""
@@ -2488,25 +2304,8 @@ class TelaJogo:
                 frame_botao = Frame(main_frame, bg='#352314')
                 frame_botao.pack(pady=15)
                 
-                # Redimensiona os botões para usar as mesmas medidas dos botões do jogo
-                if nome_botao == "sair":
-                    # Botão sair usa o mesmo tamanho do botão "finalizar jogada" (180x90)
-                    try:
-                        img_original = Image.open(f"./resources/botoes/{nome_botao}.png")
-                        img_redimensionada = img_original.resize((180, 90), Image.Resampling.LANCZOS)
-                        img_tk = ImageTk.PhotoImage(img_redimensionada)
-                    except Exception as e:
-                        print(f"Erro ao redimensionar botão {nome_botao}: {e}")
-                        img_tk = self.botoes[nome_botao]
-                else:
-                    # Botões regras e creditos usam o mesmo tamanho do botão "desfazer jogada" (150x80)
-                    try:
-                        img_original = Image.open(f"./resources/botoes/{nome_botao}.png")
-                        img_redimensionada = img_original.resize((150, 80), Image.Resampling.LANCZOS)
-                        img_tk = ImageTk.PhotoImage(img_redimensionada)
-                    except Exception as e:
-                        print(f"Erro ao redimensionar botão {nome_botao}: {e}")
-                        img_tk = self.botoes[nome_botao]
+                # Os botões do menu já vêm no tamanho de BUTTON_SIZES (os mesmos dos botões do jogo)
+                img_tk = self.botoes[nome_botao]
                 
                 # Botão com imagem
                 btn = Button(frame_botao, 
@@ -2532,42 +2331,12 @@ class TelaJogo:
             print(f"Erro ao definir grab do popup: {e}")
 
     def abrirRegras(self):
-        """Abre a tela de regras"""
-        # Destroi o frame atual da tela de jogo temporariamente
-        self.canvas.pack_forget()
-        
-        # Cria a tela de regras com destino de volta para jogo
-        from view.tela_regras import TelaRegras
-        self.tela_regras_temp = TelaRegras(self.root, self.voltarParaJogo, "jogo")
-        
-        # Guarda referência para poder destruir depois
-        self.tela_atual_temp = self.tela_regras_temp
+        """Abre a tela de regras; a tela do jogo fica apenas escondida"""
+        self.show_screen("regras")
 
     def abrirCreditos(self):
-        """Abre a tela de créditos"""
-        # Destroi o frame atual da tela de jogo temporariamente
-        self.canvas.pack_forget()
-        
-        # Cria a tela de créditos com destino de volta para jogo
-        from view.tela_creditos import TelaCreditos
-        self.tela_creditos_temp = TelaCreditos(self.root, self.voltarParaJogo, "jogo")
-        
-        # Guarda referência para poder destruir depois
-        self.tela_atual_temp = self.tela_creditos_temp
-
-    def voltarParaJogo(self, destino):
-        """Volta para a tela do jogo"""
-        # Destroi a tela temporária
-        if hasattr(self, 'tela_atual_temp'):
-            if hasattr(self.tela_atual_temp, 'frame'):
-                self.tela_atual_temp.frame.destroy()
-            delattr(self, 'tela_atual_temp')
-        
-        # Restaura o canvas do jogo
-        self.canvas.pack(expand=True, fill='both')
-        
-        # Redesenha o tabuleiro para garantir que está atualizado
-        self.desenharTabuleiro()
+        """Abre a tela de créditos; a tela do jogo fica apenas escondida"""
+        self.show_screen("creditos")
 
     def sairJogo(self):
         """Sai do jogo e retorna à tela inicial"""
@@ -2595,7 +2364,7 @@ class TelaJogo:
                     pedras_disponiveis.append(pedra)
             
             if not pedras_disponiveis:
-                messagebox.showinfo("Carta de Roubo", "O adversário não tem nenhuma das pedras que podem ser roubadas com esta carta.")
+                self.notificacoes.info("Carta de Roubo", "O adversário não tem nenhuma das pedras que podem ser roubadas com esta carta.")
                 return
             
             # Mostra confirmação para usar a carta de roubo
@@ -2607,7 +2376,7 @@ class TelaJogo:
             if resposta:
                 self.usarCartaRoubo(carta_roubo, pedras_disponiveis)
         else:
-            messagebox.showerror("Erro", "Carta de roubo não encontrada.")
+            self.notificacoes.erro("Erro", "Carta de roubo não encontrada.")
 
     def usarCartaRoubo(self, carta_roubo, pedras_disponiveis):
         """Executa o roubo de pedra usando a carta de roubo"""
@@ -2633,10 +2402,10 @@ class TelaJogo:
                 self.tabuleiro.pegarJogadorLocal().cartas.pop(i)
                 break
         
-        messagebox.showinfo("Roubo Realizado", f"Você roubou uma pedra {pedra_roubada.name} do adversário!")
+        self.notificacoes.info("Roubo Realizado", f"Você roubou uma pedra {pedra_roubada.name} do adversário!")
         
         # Atualiza o tabuleiro
-        self.desenharTabuleiro()
+        self.agendarRedesenho()
 
     def escolherPedraParaRoubar(self, pedras_disponiveis):
         """Permite ao jogador escolher qual pedra roubar"""